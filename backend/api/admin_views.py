@@ -1,9 +1,15 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
 
+from . import counters
+from .bulk import BulkMutationMixin
+from .ordering import AppendOrderMixin, ReorderMixin
+from .pagination import MessageKeysetPagination
 from .models import (
     Profile,
     SkillCategory,
@@ -30,6 +36,8 @@ from .serializers import (
     AchievementSerializer,
     CertificationSerializer,
     MessageListSerializer,
+    MessageBulkSerializer,
+    MessageFilterSerializer,
     BlogPostListSerializer,
     BlogPostDetailSerializer,
     TestimonialSerializer,
@@ -41,28 +49,13 @@ from .serializers import (
 class DashboardStatsView(APIView):
     """
     GET /api/dashboard/stats/
-    Returns dashboard stats for the logged-in user.
+    Returns dashboard stats for the logged-in user, read from their
+    DashboardCounters row (see api/counters.py).
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
-        return Response({
-            'projects': Project.objects.filter(user=user).count(),
-            'featured_projects': Project.objects.filter(user=user, is_featured=True).count(),
-            'skills': Skill.objects.filter(user=user).count(),
-            'categories': SkillCategory.objects.filter(user=user).count(),
-            'experience': Experience.objects.filter(user=user).count(),
-            'messages': Message.objects.filter(recipient=user).count(),
-            'unread_messages': Message.objects.filter(recipient=user, is_read=False).count(),
-            'blog_posts': BlogPost.objects.filter(user=user).count(),
-            'published_posts': BlogPost.objects.filter(user=user, is_published=True).count(),
-            'testimonials': Testimonial.objects.filter(user=user).count(),
-            'education': Education.objects.filter(user=user).count(),
-            'activities': Activity.objects.filter(user=user).count(),
-            'achievements': Achievement.objects.filter(user=user).count(),
-            'certifications': Certification.objects.filter(user=user).count(),
-        })
+        return Response(counters.get_counters(request.user.pk))
 
 
 # ─── Dashboard Profile ─────────────────────────────────────────────────────
@@ -89,7 +82,7 @@ class DashboardProfileView(generics.RetrieveUpdateAPIView):
 
 # ─── Dashboard Projects CRUD ──────────────────────────────────────────────
 
-class DashboardProjectListCreateView(generics.ListCreateAPIView):
+class DashboardProjectListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/projects/  — List own projects
     POST /api/dashboard/projects/  — Create a new project
@@ -97,15 +90,26 @@ class DashboardProjectListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user).prefetch_related('tech_stack')
+        return Project.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch('tech_stack', queryset=Skill.objects.select_related('category'))
+        )
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return ProjectDetailSerializer
         return ProjectListSerializer
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardProjectBulkView(BulkMutationMixin, DashboardProjectListCreateView):
+    """
+    POST /api/dashboard/projects/bulk/  — Create, update and delete own projects in one transaction
+    """
+
+
+class DashboardProjectReorderView(ReorderMixin, DashboardProjectListCreateView):
+    """
+    POST /api/dashboard/projects/reorder/  — Reorder own projects
+    """
 
 
 class DashboardProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -118,12 +122,14 @@ class DashboardProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user).prefetch_related('tech_stack')
+        return Project.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch('tech_stack', queryset=Skill.objects.select_related('category'))
+        )
 
 
 # ─── Dashboard Skills CRUD ────────────────────────────────────────────────
 
-class DashboardSkillListCreateView(generics.ListCreateAPIView):
+class DashboardSkillListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/skills/  — List own skills
     POST /api/dashboard/skills/  — Create a new skill
@@ -133,10 +139,19 @@ class DashboardSkillListCreateView(generics.ListCreateAPIView):
     pagination_class = None
 
     def get_queryset(self):
-        return Skill.objects.filter(user=self.request.user)
+        return Skill.objects.filter(user=self.request.user).select_related('category')
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardSkillBulkView(BulkMutationMixin, DashboardSkillListCreateView):
+    """
+    POST /api/dashboard/skills/bulk/  — Create, update and delete own skills in one transaction
+    """
+
+
+class DashboardSkillReorderView(ReorderMixin, DashboardSkillListCreateView):
+    """
+    POST /api/dashboard/skills/reorder/  — Reorder own skills
+    """
 
 
 class DashboardSkillDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -149,12 +164,12 @@ class DashboardSkillDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Skill.objects.filter(user=self.request.user)
+        return Skill.objects.filter(user=self.request.user).select_related('category')
 
 
 # ─── Dashboard Skill Categories CRUD ──────────────────────────────────────
 
-class DashboardCategoryListCreateView(generics.ListCreateAPIView):
+class DashboardCategoryListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/skill-categories/  — List own categories
     POST /api/dashboard/skill-categories/  — Create a new category
@@ -166,8 +181,17 @@ class DashboardCategoryListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return SkillCategory.objects.filter(user=self.request.user).prefetch_related('skills')
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardCategoryBulkView(BulkMutationMixin, DashboardCategoryListCreateView):
+    """
+    POST /api/dashboard/skill-categories/bulk/  — Create, update and delete own skill categories in one transaction
+    """
+
+
+class DashboardCategoryReorderView(ReorderMixin, DashboardCategoryListCreateView):
+    """
+    POST /api/dashboard/skill-categories/reorder/  — Reorder own skill categories
+    """
 
 
 class DashboardCategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -185,7 +209,7 @@ class DashboardCategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ─── Dashboard Experience CRUD ────────────────────────────────────────────
 
-class DashboardExperienceListCreateView(generics.ListCreateAPIView):
+class DashboardExperienceListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/experience/  — List own experience
     POST /api/dashboard/experience/  — Create a new experience entry
@@ -197,8 +221,17 @@ class DashboardExperienceListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Experience.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardExperienceBulkView(BulkMutationMixin, DashboardExperienceListCreateView):
+    """
+    POST /api/dashboard/experience/bulk/  — Create, update and delete own experience entries in one transaction
+    """
+
+
+class DashboardExperienceReorderView(ReorderMixin, DashboardExperienceListCreateView):
+    """
+    POST /api/dashboard/experience/reorder/  — Reorder own experience entries
+    """
 
 
 class DashboardExperienceDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -216,7 +249,7 @@ class DashboardExperienceDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ─── Dashboard Messages ───────────────────────────────────────────────────
 
-class DashboardEducationListCreateView(generics.ListCreateAPIView):
+class DashboardEducationListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/education/  — List own education entries
     POST /api/dashboard/education/  — Create a new education entry
@@ -228,8 +261,17 @@ class DashboardEducationListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Education.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardEducationBulkView(BulkMutationMixin, DashboardEducationListCreateView):
+    """
+    POST /api/dashboard/education/bulk/  — Create, update and delete own education entries in one transaction
+    """
+
+
+class DashboardEducationReorderView(ReorderMixin, DashboardEducationListCreateView):
+    """
+    POST /api/dashboard/education/reorder/  — Reorder own education entries
+    """
 
 
 class DashboardEducationDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -245,7 +287,7 @@ class DashboardEducationDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Education.objects.filter(user=self.request.user)
 
 
-class DashboardActivityListCreateView(generics.ListCreateAPIView):
+class DashboardActivityListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/activities/  — List own extracurricular activities
     POST /api/dashboard/activities/  — Create a new extracurricular activity
@@ -257,8 +299,17 @@ class DashboardActivityListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Activity.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardActivityBulkView(BulkMutationMixin, DashboardActivityListCreateView):
+    """
+    POST /api/dashboard/activities/bulk/  — Create, update and delete own extracurricular activities in one transaction
+    """
+
+
+class DashboardActivityReorderView(ReorderMixin, DashboardActivityListCreateView):
+    """
+    POST /api/dashboard/activities/reorder/  — Reorder own extracurricular activities
+    """
 
 
 class DashboardActivityDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -274,7 +325,7 @@ class DashboardActivityDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Activity.objects.filter(user=self.request.user)
 
 
-class DashboardAchievementListCreateView(generics.ListCreateAPIView):
+class DashboardAchievementListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/achievements/  — List own achievements
     POST /api/dashboard/achievements/  — Create a new achievement
@@ -286,8 +337,17 @@ class DashboardAchievementListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Achievement.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardAchievementBulkView(BulkMutationMixin, DashboardAchievementListCreateView):
+    """
+    POST /api/dashboard/achievements/bulk/  — Create, update and delete own achievements in one transaction
+    """
+
+
+class DashboardAchievementReorderView(ReorderMixin, DashboardAchievementListCreateView):
+    """
+    POST /api/dashboard/achievements/reorder/  — Reorder own achievements
+    """
 
 
 class DashboardAchievementDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -303,7 +363,7 @@ class DashboardAchievementDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Achievement.objects.filter(user=self.request.user)
 
 
-class DashboardCertificationListCreateView(generics.ListCreateAPIView):
+class DashboardCertificationListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/certifications/  — List own certifications
     POST /api/dashboard/certifications/  — Create a new certification
@@ -315,8 +375,17 @@ class DashboardCertificationListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Certification.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardCertificationBulkView(BulkMutationMixin, DashboardCertificationListCreateView):
+    """
+    POST /api/dashboard/certifications/bulk/  — Create, update and delete own certifications in one transaction
+    """
+
+
+class DashboardCertificationReorderView(ReorderMixin, DashboardCertificationListCreateView):
+    """
+    POST /api/dashboard/certifications/reorder/  — Reorder own certifications
+    """
 
 
 class DashboardCertificationDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -332,15 +401,76 @@ class DashboardCertificationDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Certification.objects.filter(user=self.request.user)
 
 
+def filter_messages(messages, criteria):
+    """Narrow an inbox queryset by validated MessageFilterSerializer criteria."""
+    if 'is_read' in criteria:
+        messages = messages.filter(is_read=criteria['is_read'])
+    if 'sender_email' in criteria:
+        messages = messages.filter(sender_email=criteria['sender_email'])
+    if 'created_before' in criteria:
+        messages = messages.filter(created_at__lt=criteria['created_before'])
+    if 'created_after' in criteria:
+        messages = messages.filter(created_at__gte=criteria['created_after'])
+    return messages
+
+
 class DashboardMessageListView(generics.ListAPIView):
     """
-    GET /api/dashboard/messages/  — List own messages
+    GET /api/dashboard/messages/  — List own messages, newest first
+    Filters: ?is_read=, ?sender_email=, ?created_after=, ?created_before= (ISO 8601).
+    Cursor-paginated on (-created_at, -id); inbox totals come from the dashboard counters.
     """
     serializer_class = MessageListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = MessageKeysetPagination
 
     def get_queryset(self):
-        return Message.objects.filter(recipient=self.request.user)
+        criteria = MessageFilterSerializer(data=self.request.query_params.dict())
+        criteria.is_valid(raise_exception=True)
+        return filter_messages(Message.objects.filter(recipient=self.request.user), criteria.validated_data)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        inbox = counters.get_counters(self.request.user.pk)
+        response.data['total'] = inbox['messages']
+        response.data['unread'] = inbox['unread_messages']
+        return response
+
+
+class DashboardMessageBulkView(APIView):
+    """
+    POST /api/dashboard/messages/bulk/  — Mark read / unread or delete many messages
+    Body: {"action": "mark_read" | "mark_unread" | "delete", "ids": [...]}
+      or  {"action": ..., "filter": {"is_read": false, "sender_email": "...", "created_before": "...", ...}}
+    Applies one UPDATE or DELETE scoped to the caller's inbox.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = MessageBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        messages = Message.objects.filter(recipient=request.user)
+        if 'ids' in data:
+            messages = messages.filter(pk__in=data['ids'])
+        else:
+            messages = filter_messages(messages, data['filter'])
+
+        with transaction.atomic():
+            if data['action'] == 'delete':
+                # Messages have no dependent rows, and their only post_delete receiver is the
+                # per-row counter delta that the recount below replaces, so skip the collector: one DELETE.
+                affected = messages.order_by()._raw_delete(messages.db)
+            else:
+                affected = messages.update(is_read=data['action'] == 'mark_read')
+            if affected:
+                counters.refresh_counters('Message', request.user.pk)
+        return Response({
+            'action': data['action'],
+            'affected': affected,
+            'unread_messages': counters.get_counters(request.user.pk)['unread_messages'],
+        })
 
 
 class DashboardMessageDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -439,6 +569,12 @@ class DashboardBlogListCreateView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
+class DashboardBlogBulkView(BulkMutationMixin, DashboardBlogListCreateView):
+    """
+    POST /api/dashboard/blog/bulk/  — Create, update and delete own blog posts in one transaction
+    """
+
+
 class DashboardBlogDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     GET    /api/dashboard/blog/{id}/  — Read own blog post
@@ -454,7 +590,7 @@ class DashboardBlogDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ─── Dashboard Testimonials CRUD ──────────────────────────────────────────
 
-class DashboardTestimonialListCreateView(generics.ListCreateAPIView):
+class DashboardTestimonialListCreateView(AppendOrderMixin, generics.ListCreateAPIView):
     """
     GET  /api/dashboard/testimonials/  — List own testimonials
     POST /api/dashboard/testimonials/  — Create a new testimonial
@@ -466,8 +602,17 @@ class DashboardTestimonialListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Testimonial.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+
+class DashboardTestimonialBulkView(BulkMutationMixin, DashboardTestimonialListCreateView):
+    """
+    POST /api/dashboard/testimonials/bulk/  — Create, update and delete own testimonials in one transaction
+    """
+
+
+class DashboardTestimonialReorderView(ReorderMixin, DashboardTestimonialListCreateView):
+    """
+    POST /api/dashboard/testimonials/reorder/  — Reorder own testimonials
+    """
 
 
 class DashboardTestimonialDetailView(generics.RetrieveUpdateDestroyAPIView):
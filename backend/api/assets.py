@@ -0,0 +1,189 @@
+"""
+Cloudinary asset URLs for the public views.
+
+Parsing a delivery URL into its public id / resource type is memoized per URL,
+as are the responsive srcset variants built from it (which the public
+serializers store in the portfolio snapshots).
+
+The resume redirect target (a signed, expiring Cloudinary download link, or the
+stored URL itself for other hosts) is cached per profile in the shared 'public'
+cache. A link is reused until RESUME_LINK_REUSE_MARGIN seconds before it
+expires; a Profile write that changes the resume drops the entry (see
+api/signals.py).
+"""
+import os
+import re
+import time
+from collections import namedtuple
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+try:
+    import cloudinary
+    import cloudinary.utils
+except ImportError:  # pragma: no cover - cloudinary is listed in requirements.txt
+    cloudinary = None
+
+from .cache import PUBLIC_CACHE_ALIAS
+
+RESUME_LINK_TTL = 10 * 60
+# Stop handing out a cached link this close to its expiry, so a click never
+# lands on a link that has already expired.
+RESUME_LINK_REUSE_MARGIN = 60
+
+_CLOUDINARY_VERSION_RE = re.compile(r'^v\d+$')
+
+CloudinaryAsset = namedtuple('CloudinaryAsset', ['public_id', 'resource_type', 'delivery_type', 'format'])
+
+# A cached redirect: the Profile.resume it was made from, the target URL, and
+# the target's expiry timestamp (None for links that do not expire).
+ResumeLink = namedtuple('ResumeLink', ['source_url', 'url', 'expires_at'])
+
+
+class ResumeDeliveryNotConfigured(Exception):
+    """Cloudinary credentials are missing, so private assets cannot be signed."""
+
+
+def is_public_http_url(value):
+    parsed = urlparse(value)
+    return parsed.scheme in {'http', 'https'} and bool(parsed.netloc)
+
+
+@lru_cache(maxsize=1024)
+def cloudinary_asset(asset_url):
+    """Parse a res.cloudinary.com delivery URL into a CloudinaryAsset, or None for other URLs."""
+    parsed = urlparse(asset_url)
+    if parsed.netloc != 'res.cloudinary.com':
+        return None
+
+    path_parts = [part for part in parsed.path.split('/') if part]
+    if len(path_parts) < 5:
+        return None
+
+    resource_type = path_parts[1]
+    delivery_type = path_parts[2]
+    version_index = next(
+        (index for index, part in enumerate(path_parts) if _CLOUDINARY_VERSION_RE.match(part)),
+        None,
+    )
+    if version_index is None or version_index >= len(path_parts) - 1:
+        return None
+
+    public_id_parts = path_parts[version_index + 1:]
+    file_name = public_id_parts[-1]
+    base_name, extension = os.path.splitext(file_name)
+    if resource_type != 'raw' and base_name:
+        public_id_parts[-1] = base_name
+
+    public_id = '/'.join(public_id_parts).strip('/')
+    if not public_id:
+        return None
+
+    return CloudinaryAsset(
+        public_id=public_id,
+        resource_type=resource_type,
+        delivery_type=delivery_type,
+        format=extension.lstrip('.').lower() if extension else '',
+    )
+
+
+# ─── Responsive Images ─────────────────────────────────────────────────────
+
+def _transformation(width):
+    return f'f_auto,q_auto,c_limit,w_{width}'
+
+
+@lru_cache(maxsize=4096)
+def _image_srcset(image_url, widths):
+    asset = cloudinary_asset(image_url)
+    if asset is None or asset.resource_type != 'image' or asset.delivery_type != 'upload':
+        return ''
+    parsed = urlparse(image_url)
+    path_parts = parsed.path.split('/')
+    # Chain the resize after any transformation already in the URL, just before the version.
+    version_index = next(index for index, part in enumerate(path_parts) if _CLOUDINARY_VERSION_RE.match(part))
+    head, tail = '/'.join(path_parts[:version_index]), '/'.join(path_parts[version_index:])
+    base = f'{parsed.scheme}://{parsed.netloc}{head}'
+    return ', '.join(f'{base}/{_transformation(width)}/{tail} {width}w' for width in widths)
+
+
+def image_srcset(image_url, ladder):
+    """
+    srcset value with one f_auto,q_auto Cloudinary variant per width in
+    settings.RESPONSIVE_IMAGE_WIDTHS[ladder], or '' for images Cloudinary
+    cannot transform (other hosts, raw or private assets).
+    """
+    widths = tuple(settings.RESPONSIVE_IMAGE_WIDTHS.get(ladder, ()))
+    if not image_url or not widths:
+        return ''
+    return _image_srcset(image_url.strip(), widths)
+
+
+# ─── Resume Links ──────────────────────────────────────────────────────────
+
+def _resume_key(profile_id):
+    return f'resume:{profile_id}:link'
+
+
+def cached_resume_link(profile_id):
+    """The cached redirect target for a profile's resume, or None if missing or about to expire."""
+    link = caches[PUBLIC_CACHE_ALIAS].get(_resume_key(profile_id))
+    if link is None:
+        return None
+    if link.expires_at is not None and link.expires_at - RESUME_LINK_REUSE_MARGIN <= time.time():
+        return None
+    return link.url
+
+
+def _signed_download_url(asset):
+    config = cloudinary.config() if cloudinary is not None else None
+    if config is None or not config.api_key or not config.api_secret:
+        raise ResumeDeliveryNotConfigured()
+
+    expires_at = int(time.time()) + RESUME_LINK_TTL
+    url = cloudinary.utils.private_download_url(
+        asset.public_id,
+        asset.format or 'pdf',
+        resource_type=asset.resource_type,
+        type=asset.delivery_type,
+        attachment=True,
+        secure=True,
+        expires_at=expires_at,
+    )
+    return url, expires_at
+
+
+def resume_link(profile_id, resume_url):
+    """
+    Build and cache the redirect target for resume_url: a signed download link
+    for Cloudinary assets, resume_url itself for other hosts.
+    Raises ResumeDeliveryNotConfigured when a Cloudinary asset cannot be signed.
+    """
+    url, expires_at = resume_url, None
+    asset = cloudinary_asset(resume_url)
+    if asset:
+        try:
+            url, expires_at = _signed_download_url(asset)
+        except ResumeDeliveryNotConfigured:
+            raise
+        except Exception:
+            url = None
+        if not url or not is_public_http_url(url):
+            # Fall back to the stored URL when signed URL generation fails (not cached, so it is retried).
+            return resume_url
+
+    timeout = DEFAULT_TIMEOUT if expires_at is None else expires_at - int(time.time())
+    caches[PUBLIC_CACHE_ALIAS].set(_resume_key(profile_id), ResumeLink(resume_url, url, expires_at), timeout)
+    return url
+
+
+def forget_resume_link(profile_id, current_resume_url=None):
+    """Drop a profile's cached link unless it was made from current_resume_url."""
+    cache = caches[PUBLIC_CACHE_ALIAS]
+    link = cache.get(_resume_key(profile_id))
+    if link is not None and (current_resume_url is None or link.source_url != current_resume_url.strip()):
+        cache.delete(_resume_key(profile_id))
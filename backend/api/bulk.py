@@ -0,0 +1,215 @@
+"""
+Bulk create / update / delete for the dashboard collections.
+
+POST /api/dashboard/<collection>/bulk/ takes an array of operations:
+
+    [{"op": "create", "data": {...}},
+     {"op": "update", "id": 12, "data": {...}},   # partial update
+     {"op": "delete", "id": 13}]
+
+Creates and updates are validated together through many=True serializers and
+the whole batch is applied in one transaction: bulk_create, bulk_update and a
+single QuerySet.delete(). If any operation fails validation nothing is written
+and every item reports its own outcome (400/404 for the failing ones, 424 for
+the rest), so a client importing a CV can fix exactly the rows that failed.
+Creates without an `order` are appended to the collection, as with a single POST.
+
+bulk_create / bulk_update send no post_save, so the side effects the receivers
+in api/signals.py run per row (search index, tag index, related content,
+snapshot sections, dashboard counters) are applied once per batch by
+after_bulk_save(). Deletes go through QuerySet.delete() and its post_delete
+receivers as usual.
+"""
+from django.db import IntegrityError, transaction
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from . import counters, related, search, tags
+from .ordering import is_ordered, next_order_keys
+from .snapshots import SECTION_DEPENDENCIES, schedule_refresh
+
+MAX_OPERATIONS = 200
+OPERATIONS = ('create', 'update', 'delete')
+
+
+class BulkUpdateListSerializer(serializers.ListSerializer):
+    """many=True partial update of already-fetched rows; `instance` maps id -> row, data items carry 'id'."""
+
+    def run_child_validation(self, data):
+        self.child.instance = self.instance[data['id']]
+        self.child.initial_data = data
+        return super().run_child_validation(data)
+
+
+def after_bulk_save(model, user_id, created, updated):
+    """Run the post_save side effects of api/signals.py once for a batch of bulk-written rows."""
+    model_name = model.__name__
+    instances = created + updated
+    if model_name in search.KIND_BY_MODEL:
+        for instance in instances:
+            search.index_object(search.KIND_BY_MODEL[model_name], instance)
+    if model_name == 'BlogPost':
+        for instance in instances:
+            tags.sync_post_tags(instance)
+    if model_name in related.KIND_BY_MODEL:
+        related.schedule_related_refresh(user_id, related.KIND_BY_MODEL[model_name])
+    if model in SECTION_DEPENDENCIES:
+        schedule_refresh(user_id, SECTION_DEPENDENCIES[model])
+    if model_name in counters.COUNTERS:
+        counters.record_saves(model_name, user_id, created, updated)
+
+
+def _error(op, code, errors, object_id=None):
+    result = {'op': op, 'status': code, 'errors': errors}
+    if object_id is not None:
+        result['id'] = object_id
+    return result
+
+
+class BulkMutationMixin:
+    """
+    Adds POST <collection>/bulk/ to a dashboard ListCreate view, reusing its
+    get_queryset() (ownership scope and response prefetches) and the serializer
+    it uses for POST.
+    """
+    http_method_names = ['post', 'options']
+    owner_field = 'user'
+
+    def _parse(self, operations):
+        """Split the payload into (creates, updates, deletes) as [(index, ...)], plus per-index errors."""
+        creates, updates, deletes, errors = [], [], [], {}
+        seen_ids = set()
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict) or operation.get('op') not in OPERATIONS:
+                errors[index] = _error(operation.get('op') if isinstance(operation, dict) else None, 400, {
+                    'op': [f'Must be one of: {", ".join(OPERATIONS)}.'],
+                })
+                continue
+            op = operation['op']
+            if op == 'create':
+                creates.append((index, operation.get('data')))
+                continue
+            object_id = operation.get('id')
+            if not isinstance(object_id, int) or isinstance(object_id, bool):
+                errors[index] = _error(op, 400, {'id': ['A valid integer is required.']})
+            elif object_id in seen_ids:
+                errors[index] = _error(op, 400, {'id': ['Only one operation per id is allowed.']}, object_id)
+            elif op == 'update' and not isinstance(operation.get('data'), dict):
+                errors[index] = _error(op, 400, {'data': ['Expected an object of fields to change.']}, object_id)
+            elif op == 'update':
+                updates.append((index, object_id, operation['data']))
+            else:
+                deletes.append((index, object_id))
+            seen_ids.add(object_id)
+        return creates, updates, deletes, errors
+
+    def post(self, request, *args, **kwargs):
+        operations = request.data
+        if not isinstance(operations, list) or not operations:
+            return Response({'detail': 'Expected a non-empty list of operations.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > MAX_OPERATIONS:
+            return Response(
+                {'detail': f'At most {MAX_OPERATIONS} operations per request.'}, status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        creates, updates, deletes, errors = self._parse(operations)
+        existing = self.get_queryset().model.objects.filter(
+            **{self.owner_field: request.user},
+            pk__in=[object_id for _, object_id, _ in updates] + [object_id for _, object_id in deletes],
+        ).in_bulk()
+        for index, object_id, *_ in updates + deletes:
+            if object_id not in existing:
+                errors[index] = _error(operations[index]['op'], 404, {'detail': 'Not found.'}, object_id)
+        updates = [(index, object_id, data) for index, object_id, data in updates if object_id in existing]
+        deletes = [(index, object_id) for index, object_id in deletes if object_id in existing]
+
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        create_serializer = serializer_class(data=[data for _, data in creates], many=True, context=context)
+        update_serializer = BulkUpdateListSerializer(
+            child=serializer_class(partial=True, context=context),
+            instance=existing,
+            data=[{**data, 'id': object_id} for _, object_id, data in updates],
+            partial=True,
+            context=context,
+        )
+        checks = (
+            (create_serializer, [(index, None) for index, _ in creates]),
+            (update_serializer, [(index, object_id) for index, object_id, _ in updates]),
+        )
+        for serializer, items in checks:
+            if serializer.is_valid():
+                continue
+            for (index, object_id), item_errors in zip(items, serializer.errors):
+                if item_errors:
+                    errors[index] = _error(operations[index]['op'], 400, item_errors, object_id)
+
+        if errors:
+            results = [
+                errors.get(index) or {'op': operation['op'], 'status': status.HTTP_424_FAILED_DEPENDENCY}
+                for index, operation in enumerate(operations)
+            ]
+            return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            created, updated = self._apply(create_serializer, update_serializer, updates, deletes, existing)
+        except IntegrityError:
+            return Response(
+                {'detail': 'The batch conflicts with existing rows (duplicate name or slug).'},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({'results': self._results(operations, creates, created, updates, updated, deletes)})
+
+    def _apply(self, create_serializer, update_serializer, updates, deletes, existing):
+        model = self.get_queryset().model
+        owner = {self.owner_field: self.request.user}
+        created = [model(**owner, **data) for data in create_serializer.validated_data]
+        updated = []
+        for (_, object_id, _), data in zip(updates, update_serializer.validated_data):
+            instance = existing[object_id]
+            for name, value in data.items():
+                setattr(instance, name, value)
+            updated.append(instance)
+        if hasattr(model, 'populate_derived_fields'):
+            for instance in created + updated:
+                instance.populate_derived_fields()
+
+        # bulk_update() skips Field.pre_save(), so stamp auto_now columns by hand.
+        fields = [
+            field for field in model._meta.concrete_fields
+            if not field.primary_key and field.name != self.owner_field and not getattr(field, 'auto_now_add', False)
+        ]
+        for instance in updated:
+            for field in fields:
+                if getattr(field, 'auto_now', False):
+                    field.pre_save(instance, add=False)
+
+        with transaction.atomic():
+            unordered = [
+                instance for instance, data in zip(created, create_serializer.validated_data) if 'order' not in data
+            ]
+            if unordered and is_ordered(model):
+                for instance, key in zip(unordered, next_order_keys(model, owner, len(unordered))):
+                    instance.order = key
+            model.objects.bulk_create(created)
+            model.objects.bulk_update(updated, [field.name for field in fields])
+            if deletes:
+                model.objects.filter(pk__in=[object_id for _, object_id in deletes]).delete()
+            if created or updated:
+                after_bulk_save(model, self.request.user.pk, created, updated)
+        return created, updated
+
+    def _results(self, operations, creates, created, updates, updated, deletes):
+        saved = {instance.pk: instance for instance in created + updated}
+        refreshed = self.get_queryset().filter(pk__in=saved).in_bulk() if saved else {}
+        representation = self.get_serializer_class()(context=self.get_serializer_context()).to_representation
+        results = [None] * len(operations)
+        for (index, _), instance in zip(creates, created):
+            results[index] = {'op': 'create', 'status': status.HTTP_201_CREATED, 'id': instance.pk,
+                              'data': representation(refreshed[instance.pk])}
+        for (index, object_id, _), instance in zip(updates, updated):
+            results[index] = {'op': 'update', 'status': status.HTTP_200_OK, 'id': object_id,
+                              'data': representation(refreshed[instance.pk])}
+        for index, object_id in deletes:
+            results[index] = {'op': 'delete', 'status': status.HTTP_204_NO_CONTENT, 'id': object_id}
+        return results
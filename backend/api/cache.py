@@ -0,0 +1,99 @@
+"""
+Versioned response cache for the public portfolio endpoints.
+
+Every cached response is keyed by its owner and the owner's snapshot version.
+Rebuilding a snapshot bumps the version and publishes it here, which
+implicitly expires every cached response for that user without scanning
+keys. The store is the 'public' alias in settings.CACHES: in-process LRU
+(locmem), file-based, or any Redis-protocol server.
+
+The published versions expire after PUBLIC_CACHE_VALIDATOR_TTL and are then
+re-read from the snapshot row. With a per-process locmem cache that bounds how
+long one worker keeps serving (and answering 304 for) a version another worker
+or a management command has already replaced.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import PortfolioSnapshot
+
+PUBLIC_CACHE_ALIAS = 'public'
+
+
+def _cache():
+    return caches[PUBLIC_CACHE_ALIAS]
+
+
+def _validators_key(user_id):
+    return f'portfolio:{user_id}:validators'
+
+
+def _response_key(user_id, version, request, variant):
+    digest = hashlib.md5(f'{variant}|{request.build_absolute_uri()}'.encode()).hexdigest()
+    return f'portfolio:{user_id}:v{version}:{digest}'
+
+
+# ─── Version Validators ────────────────────────────────────────────────────
+
+def publish_validators(user_id, version, updated_at):
+    """Record a freshly rebuilt snapshot version; older cache entries become unreachable."""
+    _cache().set(
+        _validators_key(user_id), (version, int(updated_at.timestamp())), settings.PUBLIC_CACHE_VALIDATOR_TTL,
+    )
+
+
+def get_validators(user_id):
+    """
+    Return (version, last_modified timestamp) for a user's snapshot, or None if
+    it has not been built yet. Falls back to the snapshot row on a cache miss.
+    """
+    validators = _cache().get(_validators_key(user_id))
+    if validators is not None:
+        return validators
+
+    row = (
+        PortfolioSnapshot.objects
+        .filter(user_id=user_id)
+        .values_list('version', 'updated_at')
+        .first()
+    )
+    if row is None:
+        return None
+    validators = (row[0], int(row[1].timestamp()))
+    # add() rather than set(): never overwrite a newer version published by a writer.
+    _cache().add(_validators_key(user_id), validators, settings.PUBLIC_CACHE_VALIDATOR_TTL)
+    return validators
+
+
+# ─── Responses ─────────────────────────────────────────────────────────────
+
+# An entry is either (data, status) for the 'data' variant, or, for a
+# 'precompressed:<media type>' variant, the final encoded body as
+# {content-coding: bytes} (see api/compression.py).
+
+def get_response(user_id, version, request, variant='data'):
+    """Return the cached entry for this request at the given version, or None."""
+    return _cache().get(_response_key(user_id, version, request, variant))
+
+
+def set_response(user_id, version, request, entry, variant='data'):
+    _cache().set(_response_key(user_id, version, request, variant), entry)
+
+
+# ─── Platform Responses ────────────────────────────────────────────────────
+# Documents spanning every portfolio (the sitemap index) are keyed by a
+# validator tag computed from all snapshots instead of one owner's version.
+
+def _platform_key(name, tag, request):
+    digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return f'platform:{name}:{tag}:{digest}'
+
+
+def get_platform_response(name, tag, request):
+    return _cache().get(_platform_key(name, tag, request))
+
+
+def set_platform_response(name, tag, request, entry):
+    _cache().set(_platform_key(name, tag, request), entry)
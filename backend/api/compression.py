@@ -0,0 +1,66 @@
+"""
+Precompression of public response bodies.
+
+Bodies are compressed once, when they are cached or exported, and the stored
+variants are handed out per request according to Accept-Encoding, so serving
+a compressed response costs no CPU.
+"""
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional; gzip is always available
+    brotli = None
+
+# Bodies shorter than this are not worth compressing (same cut-off as GZipMiddleware).
+MIN_COMPRESS_LENGTH = 200
+
+# Server preference when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+
+def compress_variants(body):
+    """Return {'identity': body, 'gzip': ..., 'br': ...} keeping only encodings that shrink it."""
+    variants = {'identity': body}
+    if len(body) < MIN_COMPRESS_LENGTH:
+        return variants
+
+    compressed = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed['br'] = brotli.compress(body, quality=11)
+    for encoding, data in compressed.items():
+        if len(data) < len(body):
+            variants[encoding] = data
+    return variants
+
+
+def _accepted_encodings(header):
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def choose_encoding(request, variants):
+    """Pick the best stored encoding the client accepts; falls back to 'identity'."""
+    accepted = _accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = 'identity', 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in variants:
+            continue
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
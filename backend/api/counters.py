@@ -0,0 +1,202 @@
+"""
+Materialized dashboard stats.
+
+Each user's row counts live in one DashboardCounters row, so the dashboard
+stats endpoint is a primary-key lookup instead of a COUNT(*) per table. Every
+save or delete of a counted model (wired up in api/signals.py) changes the
+owner's row by F() deltas in one UPDATE: +1/-1 on create and delete, and +/-1
+on the flag counters when is_featured / is_read / is_published flips. The
+UPDATE runs once the write commits (transaction.on_commit), so a rolled-back
+write leaves the counters alone. Models with flag counters remember the flags a
+row was loaded with (CountedFlagsMixin.from_db in api/models.py) to tell what
+a save changed.
+
+A missing row is built on first read from one aggregated SELECT; full recounts
+are left to `reconcile_counters` (run nightly, see `manage.py
+reconcile_counters`), which repairs drift from writes that bypass signals,
+such as QuerySet.update().
+"""
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+# Model name -> (owner field, {counter: {flag field: value} the row must match, or None}).
+COUNTERS = {
+    'Project': ('user', {'projects': None, 'featured_projects': {'is_featured': True}}),
+    'Skill': ('user', {'skills': None}),
+    'SkillCategory': ('user', {'categories': None}),
+    'Experience': ('user', {'experience': None}),
+    'Message': ('recipient', {'messages': None, 'unread_messages': {'is_read': False}}),
+    'BlogPost': ('user', {'blog_posts': None, 'published_posts': {'is_published': True}}),
+    'Testimonial': ('user', {'testimonials': None}),
+    'Education': ('user', {'education': None}),
+    'Activity': ('user', {'activities': None}),
+    'Achievement': ('user', {'achievements': None}),
+    'Certification': ('user', {'certifications': None}),
+}
+
+# Response order of the dashboard stats endpoint.
+COUNTER_FIELDS = [
+    'projects', 'featured_projects', 'skills', 'categories', 'experience', 'messages', 'unread_messages',
+    'blog_posts', 'published_posts', 'testimonials', 'education', 'activities', 'achievements', 'certifications',
+]
+
+# Model name -> the flag fields its counters depend on.
+COUNTED_FLAGS = {
+    model_name: sorted({field for condition in counters.values() if condition for field in condition})
+    for model_name, (_, counters) in COUNTERS.items()
+}
+
+
+def _count_expressions(model_name, get_model=apps.get_model):
+    """Counter -> scalar COUNT subquery over model_name rows owned by OuterRef('pk')."""
+    model = get_model('api', model_name)
+    owner, counters = COUNTERS[model_name]
+    expressions = {}
+    for counter, condition in counters.items():
+        rows = model.objects.filter(**{owner: OuterRef('pk')})
+        if condition is not None:
+            rows = rows.filter(**condition)
+        count = rows.order_by().values(owner).annotate(count=Count('pk')).values('count')
+        expressions[counter] = Coalesce(Subquery(count, output_field=IntegerField()), Value(0))
+    return expressions
+
+
+def _user_count_expressions(get_model=apps.get_model):
+    """Every counter as a User annotation, prefixed to stay clear of reverse relation names (user.projects)."""
+    expressions = {}
+    for model_name in COUNTERS:
+        for counter, expression in _count_expressions(model_name, get_model).items():
+            expressions[f'count_{counter}'] = expression
+    return expressions
+
+
+def _unprefixed(row):
+    return {field: row[f'count_{field}'] for field in COUNTER_FIELDS}
+
+
+# ─── Deltas ────────────────────────────────────────────────────────────────
+
+def _counted(flags, condition):
+    """1 if a row with these flag values (None: no row) counts towards condition, else 0."""
+    if flags is None:
+        return 0
+    return int(condition is None or all(flags[field] == value for field, value in condition.items()))
+
+
+def _flags(model_name, instance):
+    return {field: getattr(instance, field) for field in COUNTED_FLAGS[model_name]}
+
+
+def track_flags(model_name, instance):
+    """Remember the counted flags an instance was loaded (or last saved) with; deferred flags are skipped."""
+    instance._counted_flags = {
+        field: instance.__dict__[field] for field in COUNTED_FLAGS[model_name] if field in instance.__dict__
+    }
+
+
+def _delta(model_name, before, after):
+    """Counter -> change for a row going from `before` to `after` flags (None: no row)."""
+    _, counters = COUNTERS[model_name]
+    delta = {}
+    for counter, condition in counters.items():
+        change = _counted(after, condition) - _counted(before, condition)
+        if change:
+            delta[counter] = change
+    return delta
+
+
+def _previous_flags(model_name, instance):
+    """The flags an existing row had before this save, or None if they were never loaded."""
+    if not COUNTED_FLAGS[model_name]:
+        return {}
+    tracked = getattr(instance, '_counted_flags', None)
+    if tracked is None or len(tracked) < len(COUNTED_FLAGS[model_name]):
+        return None
+    return tracked
+
+
+def apply_delta(owner_id, delta, get_model=apps.get_model):
+    """Add delta ({counter: change}) to the owner's row in one UPDATE; a no-op until the row exists."""
+    delta = {counter: change for counter, change in delta.items() if change}
+    if not delta:
+        return
+    DashboardCounters = get_model('api', 'DashboardCounters')
+    DashboardCounters.objects.filter(pk=owner_id).update(**{
+        counter: Greatest(F(counter) + change, Value(0)) for counter, change in delta.items()
+    })
+
+
+def record_saves(model_name, owner_id, created=(), updated=()):
+    """
+    Count one owner's newly created and updated rows in a single UPDATE once the
+    write commits. If an updated row was not loaded with all its flags, the model
+    is recounted instead.
+    """
+    previous = [_previous_flags(model_name, instance) for instance in updated]
+    if any(flags is None for flags in previous):
+        transaction.on_commit(partial(refresh_counters, model_name, owner_id))
+    else:
+        delta = {}
+        changes = [(None, instance) for instance in created] + list(zip(previous, updated))
+        for before, instance in changes:
+            for counter, change in _delta(model_name, before, _flags(model_name, instance)).items():
+                delta[counter] = delta.get(counter, 0) + change
+        if any(delta.values()):
+            transaction.on_commit(partial(apply_delta, owner_id, delta))
+    for instance in [*created, *updated]:
+        track_flags(model_name, instance)
+
+
+def record_delete(model_name, owner_id, instance):
+    """Uncount a deleted row, with the flags it was last loaded or saved with, once the delete commits."""
+    before = _previous_flags(model_name, instance) or _flags(model_name, instance)
+    transaction.on_commit(partial(apply_delta, owner_id, _delta(model_name, before, None)))
+
+
+# ─── Recounts ──────────────────────────────────────────────────────────────
+
+def refresh_counters(model_name, owner_id, get_model=apps.get_model):
+    """Recount one model's counters for owner_id; a no-op until the user's row exists."""
+    DashboardCounters = get_model('api', 'DashboardCounters')
+    DashboardCounters.objects.filter(pk=owner_id).update(**_count_expressions(model_name, get_model))
+
+
+def compute_counters(user_id, get_model=apps.get_model):
+    """Every counter for one user, counted in a single SELECT."""
+    User = get_model('auth', 'User')
+    row = User.objects.filter(pk=user_id).values(**_user_count_expressions(get_model)).first()
+    return _unprefixed(row) if row else dict.fromkeys(COUNTER_FIELDS, 0)
+
+
+def get_counters(user_id):
+    """The dashboard stats for user_id, building the DashboardCounters row on first use."""
+    DashboardCounters = apps.get_model('api', 'DashboardCounters')
+    counts = DashboardCounters.objects.filter(pk=user_id).values(*COUNTER_FIELDS).first()
+    if counts is None:
+        counts = compute_counters(user_id)
+        DashboardCounters.objects.bulk_create([DashboardCounters(user_id=user_id, **counts)], ignore_conflicts=True)
+    return counts
+
+
+def reconcile_counters(get_model=apps.get_model):
+    """Recount every user; create missing rows and rewrite drifted ones. Returns (created, corrected)."""
+    User = get_model('auth', 'User')
+    DashboardCounters = get_model('api', 'DashboardCounters')
+    stored = {row['user_id']: row for row in DashboardCounters.objects.values('user_id', *COUNTER_FIELDS)}
+
+    missing, drifted = [], []
+    for row in User.objects.order_by('pk').values('pk', **_user_count_expressions(get_model)).iterator():
+        user_id, counts = row['pk'], _unprefixed(row)
+        current = stored.get(user_id)
+        if current is None:
+            missing.append(DashboardCounters(user_id=user_id, **counts))
+        elif any(current[field] != counts[field] for field in COUNTER_FIELDS):
+            drifted.append(DashboardCounters(user_id=user_id, **counts))
+
+    DashboardCounters.objects.bulk_create(missing, ignore_conflicts=True, batch_size=500)
+    DashboardCounters.objects.bulk_update(drifted, COUNTER_FIELDS, batch_size=500)
+    return len(missing), len(drifted)
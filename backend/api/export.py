@@ -0,0 +1,69 @@
+"""
+Worker side of `manage.py export_portfolio`: writes one user's static JSON tree.
+
+The command runs export_user() in a process pool. Workers started with spawn or
+forkserver (the default on macOS and Windows, and on Linux from Python 3.14)
+import this module to unpickle the task before anything has configured Django,
+so it sets Django up before importing any model code.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import django
+from django.apps import apps
+
+if not apps.ready:
+    django.setup()
+
+from .compression import compress_variants  # noqa: E402
+from .renderers import ORJSONRenderer  # noqa: E402
+from .snapshots import PORTFOLIO_SECTIONS, get_snapshot, visible_sections  # noqa: E402
+
+PAGINATED_SECTIONS = {'projects', 'blog'}
+_SUFFIXES = {'identity': '', 'gzip': '.gz', 'br': '.br'}
+
+
+def _write_json(path, data):
+    """Write index.json plus precompressed .gz / .br siblings (for gzip_static / brotli_static)."""
+    path.mkdir(parents=True, exist_ok=True)
+    for encoding, body in compress_variants(ORJSONRenderer().render(data)).items():
+        (path / f'index.json{_SUFFIXES[encoding]}').write_bytes(body)
+
+
+def export_user(user_id, username, output_dir, base_url):
+    """Write one user's portfolio tree; returns (user_id, username, version, file_count)."""
+    snapshot = get_snapshot(user_id)
+    sections = snapshot.sections
+    output_dir = Path(output_dir)
+
+    profile = dict(sections['profile'] or {})
+    if base_url and profile.get('resume_download_url'):
+        profile['resume_download_url'] = base_url.rstrip('/') + profile['resume_download_url']
+
+    staging = Path(tempfile.mkdtemp(prefix=f'.{username}-', dir=output_dir / 'u'))
+    staging.chmod(0o755)  # mkdtemp creates 0700; the web server must be able to read the tree.
+    files = [
+        (staging / 'profile', profile),
+        (staging / 'bundle', {'profile': profile, **visible_sections(snapshot)}),
+    ]
+    for key, _, _, _ in PORTFOLIO_SECTIONS:
+        rows = sections[key]
+        if key in PAGINATED_SECTIONS:
+            rows = {'count': len(rows), 'next': None, 'previous': None, 'results': rows}
+        files.append((staging / key, rows))
+    for slug, row in sections['project_details'].items():
+        files.append((staging / 'projects' / slug, row))
+    for slug, row in sections['blog_details'].items():
+        files.append((staging / 'blog' / slug, row))
+    files.append((staging / 'blog' / 'tags', sections['blog_tags']))
+
+    for path, data in files:
+        _write_json(path, data)
+
+    target = output_dir / 'u' / username
+    if target.exists():
+        shutil.rmtree(target)
+    os.replace(staging, target)
+    return user_id, username, snapshot.version, len(files)
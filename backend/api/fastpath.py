@@ -0,0 +1,113 @@
+"""
+Values-based fast path for the read-only public list serializers.
+
+compile_serializer() turns a ModelSerializer class into a plan that builds rows
+straight from .values() dicts: plain fields become columns, dotted sources such
+as category.name become joins (category__name), nested many=True serializers
+become one extra .values() query per relation, and SerializerMethodFields are
+called with a lightweight object holding their Meta.field_dependencies columns.
+Fields whose DRF representation is the database value itself are copied as-is;
+the rest go through the DRF field's to_representation(), so the output renders
+to the same bytes as serializer_class(queryset, many=True).data without creating
+model instances or running field lookups per row. Fields with an is_enabled()
+check (SrcsetField) are left out of a build while it is false, as DRF leaves
+them out when their get_attribute() raises SkipField.
+
+`python manage.py benchmark_serializers` compares both paths.
+"""
+from functools import lru_cache
+from types import SimpleNamespace
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+# Fields whose to_representation() returns database values of these types unchanged.
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class CompiledSerializer:
+    """Execution plan for one serializer class over .values() rows."""
+
+    def __init__(self, serializer_class):
+        serializer = serializer_class()
+        model = serializer_class.Meta.model
+        dependencies = getattr(serializer_class.Meta, 'field_dependencies', {})
+        self.model = model
+        self.columns = {'pk'}
+        self.plan = []
+        self.nested = []
+        self.optional = {}
+
+        for name, field in serializer.fields.items():
+            if isinstance(field, serializers.SerializerMethodField):
+                if name not in dependencies:
+                    raise ImproperlyConfigured(
+                        f'{serializer_class.__name__}.{name} needs a Meta.field_dependencies entry.'
+                    )
+                self.columns.update(dependencies[name])
+                self.plan.append((name, 'method', (getattr(serializer, field.method_name), dependencies[name])))
+            elif isinstance(field, serializers.ListSerializer):
+                model_field = model._meta.get_field(field.source)
+                if model_field.one_to_many:
+                    lookup = model_field.remote_field.name
+                else:
+                    lookup = model_field.related_query_name()
+                self.nested.append((name, lookup, compile_serializer(type(field.child))))
+                self.plan.append((name, 'nested', None))
+            elif isinstance(field, serializers.BaseSerializer):
+                raise ImproperlyConfigured(f'{serializer_class.__name__}.{name}: single nested serializers are not supported.')
+            else:
+                column = field.source.replace('.', '__')
+                self.columns.add(column)
+                convert = None if isinstance(field, IDENTITY_FIELDS) else field.to_representation
+                self.plan.append((name, 'value', (column, convert)))
+                if hasattr(field, 'is_enabled'):
+                    self.optional[name] = field.is_enabled
+
+    def _nested_rows(self, rows):
+        """{field name: {parent pk: [child rows]}} with one query per nested relation."""
+        pks = [row['pk'] for row in rows]
+        grouped = {}
+        for name, lookup, child in self.nested:
+            children = child.model.objects.filter(**{f'{lookup}__in': pks}).values(lookup, *child.columns)
+            child_rows = list(children)
+            by_parent = {}
+            for child_row, data in zip(child_rows, child.build(child_rows)):
+                by_parent.setdefault(child_row[lookup], []).append(data)
+            grouped[name] = by_parent
+        return grouped
+
+    def build(self, rows):
+        nested = self._nested_rows(rows) if self.nested and rows else {}
+        plan = [step for step in self.plan if step[0] not in self.optional or self.optional[step[0]]()]
+        output = []
+        for row in rows:
+            data = {}
+            for name, kind, spec in plan:
+                if kind == 'value':
+                    column, convert = spec
+                    value = row[column]
+                    data[name] = value if convert is None or value is None else convert(value)
+                elif kind == 'method':
+                    method, columns = spec
+                    data[name] = method(SimpleNamespace(**{column: row[column] for column in columns}))
+                else:
+                    data[name] = nested[name].get(row['pk'], [])
+            output.append(data)
+        return output
+
+    def serialize(self, queryset):
+        """Serialize a queryset of self.model; same data as serializer_class(queryset, many=True).data."""
+        return self.build(list(queryset.prefetch_related(None).values(*self.columns)))
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class):
+    return CompiledSerializer(serializer_class)
@@ -0,0 +1,200 @@
+"""
+RSS / Atom blog feeds and sitemaps for the public portfolios.
+
+The expensive part of both documents, one XML element per post or project, is
+rendered into the user's PortfolioSnapshot as the 'feed' and 'sitemap'
+sections, so it is rebuilt only by writes to the rows it lists (see
+SECTION_DEPENDENCIES). Views wrap the stored fragments in a small document head
+built from the snapshot profile, and serve the result through the versioned
+response cache like every other public endpoint.
+
+Links point at the public site (settings.PUBLIC_SITE_URL + PUBLIC_PAGE_PATHS),
+not at this API.
+"""
+from io import StringIO
+
+from django.conf import settings
+from django.db.models import F
+from django.utils.feedgenerator import rfc2822_date, rfc3339_date
+from django.utils.xmlutils import SimplerXMLGenerator
+
+from .models import BlogPost, Profile, Project
+from .tags import tag_slugs
+
+FEED_LIMIT = 20
+
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+ATOM_NAMESPACE = 'http://www.w3.org/2005/Atom'
+CONTENT_NAMESPACE = 'http://purl.org/rss/1.0/modules/content/'
+
+
+def public_url(page, **params):
+    """Absolute URL of a page on the public site, e.g. public_url('post', username=..., slug=...)."""
+    return settings.PUBLIC_SITE_URL.rstrip('/') + settings.PUBLIC_PAGE_PATHS[page].format(**params)
+
+
+def _fragment(write):
+    """Render write(handler) as an XML fragment (no declaration, no root element)."""
+    stream = StringIO()
+    write(SimplerXMLGenerator(stream, 'utf-8', short_empty_elements=True))
+    return stream.getvalue()
+
+
+def _document(write):
+    stream = StringIO()
+    handler = SimplerXMLGenerator(stream, 'utf-8', short_empty_elements=True)
+    handler.startDocument()
+    write(handler, stream)
+    handler.endDocument()
+    return stream.getvalue()
+
+
+# ─── Blog Feed ─────────────────────────────────────────────────────────────
+
+def _feed_posts(user):
+    return (
+        BlogPost.objects.filter(user=user, is_published=True)
+        .order_by(F('published_at').desc(nulls_last=True), '-created_at', '-id')
+        .values('slug', 'title', 'excerpt', 'content_html', 'tags', 'published_at', 'created_at', 'updated_at')
+        [:FEED_LIMIT]
+    )
+
+
+def build_feed(user):
+    """Snapshot 'feed' section: RSS items and Atom entries for the latest published posts."""
+    username = Profile.objects.filter(user=user).values_list('username_slug', flat=True).first()
+    if username is None:
+        return None
+    posts = list(_feed_posts(user))
+    for post in posts:
+        post['link'] = public_url('post', username=username, slug=post['slug'])
+        post['published'] = post['published_at'] or post['created_at']
+
+    def write_rss(handler):
+        for post in posts:
+            handler.startElement('item', {})
+            handler.addQuickElement('title', post['title'])
+            handler.addQuickElement('link', post['link'])
+            handler.addQuickElement('guid', post['link'], {'isPermaLink': 'true'})
+            handler.addQuickElement('pubDate', rfc2822_date(post['published']))
+            handler.addQuickElement('description', post['excerpt'])
+            handler.addQuickElement('content:encoded', post['content_html'])
+            for name in tag_slugs(post['tags']).values():
+                handler.addQuickElement('category', name)
+            handler.endElement('item')
+
+    def write_atom(handler):
+        for post in posts:
+            handler.startElement('entry', {})
+            handler.addQuickElement('title', post['title'])
+            handler.addQuickElement('link', '', {'href': post['link'], 'rel': 'alternate'})
+            handler.addQuickElement('id', post['link'])
+            handler.addQuickElement('published', rfc3339_date(post['published']))
+            handler.addQuickElement('updated', rfc3339_date(post['updated_at']))
+            handler.addQuickElement('summary', post['excerpt'])
+            handler.addQuickElement('content', post['content_html'], {'type': 'html'})
+            for slug, name in tag_slugs(post['tags']).items():
+                handler.addQuickElement('category', '', {'term': slug, 'label': name})
+            handler.endElement('entry')
+
+    updated = max((post['updated_at'] for post in posts), default=user.date_joined)
+    return {
+        'link': public_url('portfolio', username=username),
+        'updated_rss': rfc2822_date(updated),
+        'updated_atom': rfc3339_date(updated),
+        'rss_items': _fragment(write_rss),
+        'atom_entries': _fragment(write_atom),
+    }
+
+
+def _feed_title(profile):
+    return f"{profile.get('full_name') or profile.get('username_slug')} — Blog"
+
+
+def rss_document(feed, profile, feed_url):
+    def write(handler, stream):
+        handler.startElement('rss', {'version': '2.0', 'xmlns:atom': ATOM_NAMESPACE, 'xmlns:content': CONTENT_NAMESPACE})
+        handler.startElement('channel', {})
+        handler.addQuickElement('title', _feed_title(profile))
+        handler.addQuickElement('link', feed['link'])
+        handler.addQuickElement('description', profile.get('tagline') or profile.get('bio') or _feed_title(profile))
+        handler.addQuickElement('atom:link', '', {'href': feed_url, 'rel': 'self', 'type': 'application/rss+xml'})
+        handler.addQuickElement('lastBuildDate', feed['updated_rss'])
+        stream.write(feed['rss_items'])
+        handler.endElement('channel')
+        handler.endElement('rss')
+    return _document(write)
+
+
+def atom_document(feed, profile, feed_url):
+    def write(handler, stream):
+        handler.startElement('feed', {'xmlns': ATOM_NAMESPACE})
+        handler.addQuickElement('title', _feed_title(profile))
+        handler.addQuickElement('link', '', {'href': feed['link'], 'rel': 'alternate'})
+        handler.addQuickElement('link', '', {'href': feed_url, 'rel': 'self'})
+        handler.addQuickElement('id', feed['link'])
+        handler.addQuickElement('updated', feed['updated_atom'])
+        handler.startElement('author', {})
+        handler.addQuickElement('name', profile.get('full_name') or profile.get('username_slug'))
+        handler.endElement('author')
+        stream.write(feed['atom_entries'])
+        handler.endElement('feed')
+    return _document(write)
+
+
+# ─── Sitemaps ──────────────────────────────────────────────────────────────
+
+def _write_urls(handler, urls):
+    for location, lastmod in urls:
+        handler.startElement('url', {})
+        handler.addQuickElement('loc', location)
+        if lastmod is not None:
+            handler.addQuickElement('lastmod', lastmod.date().isoformat())
+        handler.endElement('url')
+
+
+def build_sitemap(user):
+    """Snapshot 'sitemap' section: <url> elements for the user's visible projects and published posts."""
+    username = Profile.objects.filter(user=user).values_list('username_slug', flat=True).first()
+    if username is None:
+        return None
+    projects = Project.objects.filter(user=user, is_visible=True).order_by('order', 'id').values_list('slug', 'updated_at')
+    posts = (
+        BlogPost.objects.filter(user=user, is_published=True)
+        .order_by(F('published_at').desc(nulls_last=True), '-id').values_list('slug', 'updated_at')
+    )
+    return {
+        'portfolio': public_url('portfolio', username=username),
+        'projects': _fragment(lambda handler: _write_urls(handler, [
+            (public_url('project', username=username, slug=slug), updated_at) for slug, updated_at in projects
+        ])),
+        'posts': _fragment(lambda handler: _write_urls(handler, [
+            (public_url('post', username=username, slug=slug), updated_at) for slug, updated_at in posts
+        ])),
+    }
+
+
+def sitemap_document(sitemap, profile, last_modified):
+    """<urlset> for one portfolio; sections the owner has hidden are left out."""
+    def write(handler, stream):
+        handler.startElement('urlset', {'xmlns': SITEMAP_NAMESPACE})
+        _write_urls(handler, [(sitemap['portfolio'], last_modified)])
+        if profile.get('show_projects', True):
+            stream.write(sitemap['projects'])
+        if profile.get('show_blog', True):
+            stream.write(sitemap['posts'])
+        handler.endElement('urlset')
+    return _document(write)
+
+
+def sitemap_index_document(shards):
+    """<sitemapindex> over [(shard url, last modified datetime), ...]."""
+    def write(handler, stream):
+        handler.startElement('sitemapindex', {'xmlns': SITEMAP_NAMESPACE})
+        for location, lastmod in shards:
+            handler.startElement('sitemap', {})
+            handler.addQuickElement('loc', location)
+            handler.addQuickElement('lastmod', rfc3339_date(lastmod))
+            handler.endElement('sitemap')
+        handler.endElement('sitemapindex')
+    return _document(write)
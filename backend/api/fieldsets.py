@@ -0,0 +1,98 @@
+"""
+Sparse fieldsets: ?fields=title,slug keeps only the listed fields of each object,
+?omit=tech_stack drops the listed ones. Both apply to GET requests only.
+
+Serializers narrow their output through SparseFieldsetMixin, for views that opt
+in with `sparse_fieldsets = True` (the public read views; the dashboard views
+sharing those serializers ignore the parameters). List and detail views narrow
+the SQL to match with sparse_queryset() (.only() the columns the kept fields
+read, no prefetch for omitted relations); snapshot-served rows are trimmed with
+sparse_data().
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def _split(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def sparse_fieldset(request, field_names):
+    """The subset of field_names kept by the request's ?fields= / ?omit= parameters, in order."""
+    field_names = list(field_names)
+    if request is None or request.method != 'GET':
+        return field_names
+    params = getattr(request, 'query_params', request.GET)
+    fields, omit = _split(params.get('fields')), _split(params.get('omit'))
+    if not fields and not omit:
+        return field_names
+    return [name for name in field_names if (not fields or name in fields) and name not in omit]
+
+
+def sparse_data(request, data):
+    """Trim one already-serialized object (e.g. a snapshot row) to the requested fields."""
+    kept = sparse_fieldset(request, data)
+    if len(kept) == len(data):
+        return data
+    return {name: data[name] for name in kept}
+
+
+def sparse_queryset(queryset, serializer_class, request, required=()):
+    """
+    Narrow queryset to what the kept fields of serializer_class read: .only() their
+    columns (plus `required`, e.g. pagination keys) and prefetch only kept relations.
+    Returns the queryset unchanged when nothing is omitted, or when a kept computed
+    field has no Meta.field_dependencies entry to say which columns it needs.
+    """
+    fields = serializer_class().fields
+    kept = sparse_fieldset(request, fields)
+    if len(kept) == len(fields):
+        return queryset
+
+    model = queryset.model
+    dependencies = getattr(serializer_class.Meta, 'field_dependencies', {})
+    columns, relations = set(required), set()
+    for name in kept:
+        if name in dependencies:
+            columns.update(dependencies[name])
+            continue
+        source = fields[name].source.split('.')[0]
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return queryset
+        if model_field.many_to_many or model_field.one_to_many:
+            relations.add(source)
+        else:
+            columns.add(source)
+
+    prefetches = [
+        lookup for lookup in queryset._prefetch_related_lookups
+        if getattr(lookup, 'prefetch_to', lookup).split('__')[0] in relations
+    ]
+    return queryset.prefetch_related(None).prefetch_related(*prefetches).only(*columns)
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin honouring ?fields= / ?omit= from the request in the serializer
+    context, when the view in the context sets `sparse_fieldsets = True`. Only the
+    top-level serializer (or the child of a top-level many=True list) is narrowed;
+    nested serializers keep all their fields.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not getattr(self.context.get('view'), 'sparse_fieldsets', False):
+            return fields
+        root = self.root
+        is_top_level = self is root or (
+            self.parent is root and isinstance(root, serializers.ListSerializer)
+        )
+        if not is_top_level:
+            return fields
+        kept = set(sparse_fieldset(self.context.get('request'), fields))
+        for name in list(fields):
+            if name not in kept:
+                del fields[name]
+        return fields
@@ -0,0 +1,60 @@
+"""
+Management command to benchmark the public list serializers against their values() fast path.
+Usage: python manage.py benchmark_serializers [--username sait27] [--iterations 50]
+
+For each public list section, serializes the user's queryset with the DRF serializer
+and with api.fastpath, checks that both render to identical JSON bytes, and reports
+the mean time and query count of each path.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.fastpath import compile_serializer
+from api.models import Profile
+from api.renderers import ORJSONRenderer
+from api.snapshots import PORTFOLIO_SECTIONS
+
+
+def _measure(serialize, iterations):
+    with CaptureQueriesContext(connection) as queries:
+        data = serialize()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        serialize()
+    return data, (time.perf_counter() - started) / iterations * 1000, len(queries)
+
+
+class Command(BaseCommand):
+    help = 'Compare DRF and values() fast-path serialization of the public list sections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='Portfolio to benchmark. Defaults to the first profile.')
+        parser.add_argument('--iterations', type=int, default=50)
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.order_by('user_id')
+        if options['username']:
+            profiles = profiles.filter(username_slug=options['username'])
+        user_id = profiles.values_list('user_id', flat=True).first()
+        if user_id is None:
+            raise CommandError('No matching portfolio to benchmark.')
+
+        renderer = ORJSONRenderer()
+        iterations = max(1, options['iterations'])
+        self.stdout.write(f'{"section":<16}{"rows":>6}{"drf ms":>10}{"queries":>9}{"fast ms":>10}{"queries":>9}{"speedup":>9}')
+        for key, _, build_queryset, serializer_class in PORTFOLIO_SECTIONS:
+            compiled = compile_serializer(serializer_class)
+            drf_data, drf_ms, drf_queries = _measure(
+                lambda: serializer_class(build_queryset(user_id), many=True).data, iterations,
+            )
+            fast_data, fast_ms, fast_queries = _measure(lambda: compiled.serialize(build_queryset(user_id)), iterations)
+            if renderer.render(drf_data) != renderer.render(fast_data):
+                raise CommandError(f'{key}: fast path output differs from {serializer_class.__name__}.')
+            self.stdout.write(
+                f'{key:<16}{len(drf_data):>6}{drf_ms:>10.2f}{drf_queries:>9}'
+                f'{fast_ms:>10.2f}{fast_queries:>9}{drf_ms / fast_ms if fast_ms else 0:>8.1f}x'
+            )
+        self.stdout.write(self.style.SUCCESS('Fast path output is byte-identical for every section.'))
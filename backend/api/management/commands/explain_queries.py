@@ -0,0 +1,131 @@
+"""
+Management command to check the public and dashboard query shapes against the indexes.
+Usage: python manage.py explain_queries [--username sait27] [--strict]
+
+Runs EXPLAIN QUERY PLAN (SQLite) on the queryset behind each endpoint and reports
+steps that scan a whole table or sort through a temporary B-tree instead of
+reading rows in index order.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.models import (
+    Achievement,
+    Activity,
+    BlogPost,
+    Certification,
+    Education,
+    Experience,
+    Message,
+    Profile,
+    Project,
+    Skill,
+    SkillCategory,
+    Testimonial,
+)
+from api.pagination import MessageKeysetPagination
+from api.snapshots import (
+    public_achievements_queryset,
+    public_activities_queryset,
+    public_blog_queryset,
+    public_certifications_queryset,
+    public_education_queryset,
+    public_experience_queryset,
+    public_projects_queryset,
+    public_skills_queryset,
+    public_testimonials_queryset,
+)
+
+INBOX_CURSOR = ['2026-01-01T00:00:00+00:00', 1]
+
+
+def _inbox(user_id, *conditions, **filters):
+    """One page of the cursor-paginated message inbox."""
+    pagination = MessageKeysetPagination()
+    return (
+        Message.objects.filter(*conditions, recipient=user_id, **filters)
+        .order_by(*pagination._order_by(reverse=False))[:pagination.page_size]
+    )
+
+
+# (endpoint, queryset builder taking the owner's user id)
+QUERY_SHAPES = [
+    ('public profile', lambda user_id: Profile.objects.filter(username_slug='sample')),
+    ('public skills', public_skills_queryset),
+    ('public projects', public_projects_queryset),
+    ('public projects ?category=', lambda user_id: public_projects_queryset(user_id).filter(category='backend')),
+    ('public projects ?featured=', lambda user_id: public_projects_queryset(user_id).filter(is_featured=True)),
+    ('public project detail', lambda user_id: public_projects_queryset(user_id).filter(slug='sample')),
+    ('public experience', public_experience_queryset),
+    ('public education', public_education_queryset),
+    ('public activities', public_activities_queryset),
+    ('public achievements', public_achievements_queryset),
+    ('public certifications', public_certifications_queryset),
+    ('public blog', public_blog_queryset),
+    ('public blog detail', lambda user_id: public_blog_queryset(user_id).filter(slug='sample')),
+    ('public testimonials', public_testimonials_queryset),
+    ('dashboard projects', lambda user_id: Project.objects.filter(user=user_id)),
+    ('dashboard featured projects', lambda user_id: Project.objects.filter(user=user_id, is_featured=True)),
+    ('dashboard skills', lambda user_id: Skill.objects.filter(user=user_id)),
+    ('dashboard categories', lambda user_id: SkillCategory.objects.filter(user=user_id)),
+    ('dashboard experience', lambda user_id: Experience.objects.filter(user=user_id)),
+    ('dashboard education', lambda user_id: Education.objects.filter(user=user_id)),
+    ('dashboard activities', lambda user_id: Activity.objects.filter(user=user_id)),
+    ('dashboard achievements', lambda user_id: Achievement.objects.filter(user=user_id)),
+    ('dashboard certifications', lambda user_id: Certification.objects.filter(user=user_id)),
+    ('dashboard blog', lambda user_id: BlogPost.objects.filter(user=user_id)),
+    ('dashboard testimonials', lambda user_id: Testimonial.objects.filter(user=user_id)),
+    ('dashboard messages', lambda user_id: _inbox(user_id)),
+    ('dashboard messages ?is_read=', lambda user_id: _inbox(user_id, is_read=False)),
+    ('dashboard messages ?sender_email=', lambda user_id: _inbox(user_id, sender_email='a@example.com')),
+    ('dashboard messages ?created_after=', lambda user_id: _inbox(user_id, created_at__gte=INBOX_CURSOR[0])),
+    ('dashboard messages next page', lambda user_id: _inbox(
+        user_id, MessageKeysetPagination()._seek(INBOX_CURSOR, reverse=False),
+    )),
+]
+
+
+def is_full_scan(detail):
+    """True for plan steps that read a whole table or sort rows outside an index."""
+    detail = detail.upper()
+    if detail.startswith('SCAN') and 'USING' not in detail:
+        return True
+    return 'USE TEMP B-TREE' in detail
+
+
+class Command(BaseCommand):
+    help = 'Report full table scans and unindexed sorts in the public and dashboard queries (SQLite)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', help='Explain with this portfolio owner. Defaults to the first profile.')
+        parser.add_argument('--strict', action='store_true', help='Exit with an error if any full scan is found')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(f'EXPLAIN QUERY PLAN is SQLite-only; the default database is {connection.vendor}.')
+
+        profiles = Profile.objects.order_by('user_id')
+        if options['username']:
+            profiles = profiles.filter(username_slug=options['username'])
+        user_id = profiles.values_list('user_id', flat=True).first()
+        if user_id is None:
+            if options['username']:
+                raise CommandError(f'Unknown username: {options["username"]}')
+            user_id = 0  # The plan does not depend on the owner existing.
+
+        flagged = 0
+        with connection.cursor() as cursor:
+            for label, build_queryset in QUERY_SHAPES:
+                sql, params = build_queryset(user_id).query.sql_with_params()
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                scans = [row[-1] for row in cursor.fetchall() if is_full_scan(row[-1])]
+                if scans:
+                    flagged += 1
+                    self.stdout.write(self.style.WARNING(f'{label}: {"; ".join(scans)}'))
+                elif options['verbosity'] > 1:
+                    self.stdout.write(f'{label}: ok')
+
+        summary = f'{flagged} of {len(QUERY_SHAPES)} queries scan a table or sort without an index.'
+        if flagged and options['strict']:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary) if not flagged else summary)
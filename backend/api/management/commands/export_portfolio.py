@@ -0,0 +1,96 @@
+"""
+Management command to export public portfolios as pre-rendered static JSON.
+Usage: python manage.py export_portfolio --output ./static_export [--username sait27] [--full]
+
+Files mirror the /api/u/{username}/... URL tree as directory index files, e.g.
+    {output}/u/sait27/projects/index.json
+    {output}/u/sait27/projects/orbit-commerce-suite/index.json
+so a CDN or nginx can serve them with `try_files $uri/index.json @django`
+when {output} is mounted at /api/. Each index.json has precompressed
+index.json.gz / index.json.br siblings for gzip_static / brotli_static.
+
+Runs are incremental: a manifest records each exported user's snapshot version,
+and only users whose snapshot changed since the last run are re-exported.
+"""
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from api.export import export_user
+from api.models import PortfolioSnapshot, Profile
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class Command(BaseCommand):
+    help = 'Export public portfolios to a directory of static JSON files mirroring /api/u/{username}/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', required=True, help='Directory to write the static tree into')
+        parser.add_argument(
+            '--username', action='append', default=[],
+            help='Export only this username slug (repeatable). Defaults to every portfolio.',
+        )
+        parser.add_argument('--full', action='store_true', help='Re-export even if the snapshot is unchanged')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Export processes')
+        parser.add_argument(
+            '--base-url', default='',
+            help='Origin used to absolutize resume links, e.g. https://api.example.com',
+        )
+
+    def handle(self, *args, **options):
+        output_dir = Path(options['output']).resolve()
+        (output_dir / 'u').mkdir(parents=True, exist_ok=True)
+        manifest_path = output_dir / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+        profiles = Profile.objects.order_by('user_id')
+        if options['username']:
+            profiles = profiles.filter(username_slug__in=options['username'])
+        targets = dict(profiles.values_list('user_id', 'username_slug'))
+        if options['username'] and len(targets) != len(set(options['username'])):
+            missing = set(options['username']) - set(targets.values())
+            raise CommandError(f'Unknown username(s): {", ".join(sorted(missing))}')
+
+        versions = dict(
+            PortfolioSnapshot.objects.filter(user_id__in=targets).values_list('user_id', 'version')
+        )
+        pending = [
+            (user_id, username)
+            for user_id, username in targets.items()
+            if options['full']
+            or manifest.get(str(user_id)) != {'username': username, 'version': versions.get(user_id)}
+        ]
+
+        # Drop trees for deleted portfolios and renamed slugs (full-platform runs only).
+        if not options['username']:
+            for user_id, entry in list(manifest.items()):
+                if targets.get(int(user_id)) != entry['username']:
+                    shutil.rmtree(output_dir / 'u' / entry['username'], ignore_errors=True)
+                    if int(user_id) not in targets:
+                        del manifest[user_id]
+
+        skipped = len(targets) - len(pending)
+        if pending:
+            # Pool workers must open their own database connections.
+            connections.close_all()
+            workers = max(1, min(options['workers'], len(pending)))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                jobs = [
+                    pool.submit(export_user, user_id, username, str(output_dir), options['base_url'])
+                    for user_id, username in pending
+                ]
+                for job in jobs:
+                    user_id, username, version, file_count = job.result()
+                    manifest[str(user_id)] = {'username': username, 'version': version}
+                    self.stdout.write(f'  Exported @{username} ({file_count} files, v{version})')
+
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        self.stdout.write(self.style.SUCCESS(
+            f'Exported {len(pending)} portfolio(s), {skipped} unchanged, into {output_dir}'
+        ))
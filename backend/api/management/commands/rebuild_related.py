@@ -0,0 +1,31 @@
+"""
+Management command to recompute the related posts / related projects index.
+Usage: python manage.py rebuild_related
+
+Signals keep the index current on every post and project write; run this after
+tuning the weights in api/related.py or after bulk writes that bypass signals.
+Snapshots are rebuilt only for users whose neighbour lists changed.
+"""
+from django.core.management.base import BaseCommand
+
+from api.related import rebuild_related
+from api.snapshots import refresh_snapshot
+
+DETAIL_SECTIONS = {'blog': 'blog_details', 'project': 'project_details'}
+
+
+class Command(BaseCommand):
+    help = 'Recompute related blog posts and projects for every portfolio'
+
+    def handle(self, *args, **options):
+        stale_sections = {}
+        rewritten = 0
+        for user_id, kind, changed in rebuild_related():
+            if changed:
+                rewritten += changed
+                stale_sections.setdefault(user_id, set()).add(DETAIL_SECTIONS[kind])
+        for user_id, sections in stale_sections.items():
+            refresh_snapshot(user_id, sections)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rewrote {rewritten} neighbour lists; refreshed {len(stale_sections)} portfolio snapshots.'
+        ))
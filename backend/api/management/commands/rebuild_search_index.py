@@ -0,0 +1,23 @@
+"""
+Management command to rebuild the portfolio full-text search index from scratch.
+Usage: python manage.py rebuild_search_index
+
+Signals keep the index in sync with model saves and deletes; run this after bulk
+writes that bypass them (queryset.update(), raw SQL, fixtures loaded with --raw).
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for every portfolio'
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            raise CommandError(f'Full-text search is not supported on {connection.vendor}.')
+        with transaction.atomic():
+            count = search.rebuild_index(apps.get_model)
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} objects.'))
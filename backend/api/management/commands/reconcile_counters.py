@@ -0,0 +1,21 @@
+"""
+Management command to recount every user's dashboard counters.
+Usage: python manage.py reconcile_counters
+
+Signals keep DashboardCounters current on every save and delete; schedule this
+nightly (e.g. from cron) to repair drift from writes that bypass signals, such
+as QuerySet.update() or raw SQL.
+"""
+from django.core.management.base import BaseCommand
+
+from api.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount dashboard counters for every user and repair any drift'
+
+    def handle(self, *args, **options):
+        created, corrected = reconcile_counters()
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created} counter rows; corrected {corrected} drifted rows.'
+        ))
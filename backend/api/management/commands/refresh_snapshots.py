@@ -0,0 +1,37 @@
+"""
+Management command to rebuild stored portfolio snapshots.
+Usage: python manage.py refresh_snapshots [--section profile --section projects ...] [--username sait27]
+
+Signals keep snapshots current on every write; run this after changing settings
+that shape the stored payloads (e.g. RESPONSIVE_IMAGE_WIDTHS) or after bulk
+writes that bypass signals. Rebuilds every section unless --section is given.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import PortfolioSnapshot, Profile
+from api.snapshots import SECTION_BUILDERS, refresh_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Rebuild stored portfolio snapshots'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--section', action='append', choices=sorted(SECTION_BUILDERS), dest='sections',
+            help='Section to rebuild (repeatable); defaults to every section',
+        )
+        parser.add_argument('--username', help='Only rebuild this portfolio')
+
+    def handle(self, *args, **options):
+        if options['username']:
+            user_ids = list(
+                Profile.objects.filter(username_slug=options['username']).values_list('user_id', flat=True)
+            )
+            if not user_ids:
+                raise CommandError(f'No portfolio with username "{options["username"]}".')
+        else:
+            user_ids = list(PortfolioSnapshot.objects.values_list('user_id', flat=True))
+
+        for user_id in user_ids:
+            refresh_snapshot(user_id, options['sections'])
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {len(user_ids)} portfolio snapshots.'))
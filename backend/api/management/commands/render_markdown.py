@@ -0,0 +1,62 @@
+"""
+Management command to re-render stored markdown HTML after a renderer change.
+Usage: python manage.py render_markdown [--all] [--batch-size 200] [--workers 4]
+
+Re-renders every BlogPost.content and Project.description whose render_version is
+older than api.rendering.RENDERER_VERSION (or every row with --all). Rendering runs
+in a process pool one batch at a time; results are written back with bulk_update and
+the affected users' portfolio snapshots are rebuilt once at the end.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from api.rendering import RENDER_TARGETS, RENDERER_VERSION, render_batch
+from api.snapshots import SECTION_DEPENDENCIES, refresh_snapshot
+
+
+def _batches(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class Command(BaseCommand):
+    help = 'Re-render stored markdown HTML for blog posts and projects'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Re-render rows already at the current version')
+        parser.add_argument('--batch-size', type=int, default=200, help='Rows rendered per worker task')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Render processes')
+
+    def handle(self, *args, **options):
+        stale_sections = {}
+        with ProcessPoolExecutor(max_workers=max(1, options['workers'])) as pool:
+            for model_name, (source, rendered_fields, apply_render) in RENDER_TARGETS.items():
+                model = apps.get_model('api', model_name)
+                queryset = model.objects.all()
+                if not options['all']:
+                    queryset = queryset.filter(render_version__lt=RENDERER_VERSION)
+                rows = list(queryset.values_list('pk', source, 'user_id'))
+                owners = {pk: user_id for pk, _, user_id in rows}
+                sources = [(pk, text) for pk, text, _ in rows]
+
+                rendered_count = 0
+                for results in pool.map(render_batch, _batches(sources, max(1, options['batch_size']))):
+                    instances = []
+                    for pk, rendered in results:
+                        instance = model(pk=pk)
+                        apply_render(instance, rendered)
+                        instances.append(instance)
+                    model.objects.bulk_update(instances, rendered_fields)
+                    rendered_count += len(instances)
+
+                for user_id in set(owners.values()):
+                    stale_sections.setdefault(user_id, set()).update(SECTION_DEPENDENCIES[model])
+                self.stdout.write(f'{model_name}: re-rendered {rendered_count} rows.')
+
+        # bulk_update skips the post_save signals, so rebuild the snapshots directly.
+        for user_id, sections in stale_sections.items():
+            refresh_snapshot(user_id, sections)
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {len(stale_sections)} portfolio snapshots.'))
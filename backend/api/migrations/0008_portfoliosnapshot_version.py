@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_portfoliosnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='portfoliosnapshot',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped on every rebuild; used as the public ETag'),
+        ),
+    ]
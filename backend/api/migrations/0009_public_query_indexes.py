@@ -0,0 +1,79 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_portfoliosnapshot_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='achievement',
+            index=models.Index(fields=['user', 'order', '-achieved_on', '-created_at'], name='achievement_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['user', 'order', '-start_date', '-created_at'], name='activity_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['user', '-published_at', '-created_at'], name='blog_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['user', 'is_published', '-published_at', '-created_at'], name='blog_public_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['user', 'order', '-issue_date', '-created_at'], name='cert_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['user', 'order', '-start_date', '-created_at'], name='education_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['user', 'order', '-start_date'], name='experience_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['recipient', '-created_at'], name='message_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['recipient', 'is_read', '-created_at'], name='message_inbox_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'order', '-date_built'], name='project_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'is_visible', 'order', '-date_built'], name='project_public_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'is_visible', 'category', 'is_featured'], name='project_public_filter_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'is_featured'], name='project_user_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['user', 'order', 'name'], name='skill_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillcategory',
+            index=models.Index(fields=['user', 'order', 'name'], name='skillcat_user_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['user', 'order', '-created_at'], name='testimonial_user_order_idx'),
+        ),
+    ]
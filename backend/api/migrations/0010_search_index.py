@@ -0,0 +1,87 @@
+# Generated by Django 6.0.2 on 2026-10-17 11:30
+
+from django.db import migrations
+
+# Queried by api/search.py; the documents below mirror its builders as of this migration.
+TABLE = 'api_search_index'
+
+SQLITE_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+        title, tags, body,
+        kind UNINDEXED, object_id UNINDEXED, user_id UNINDEXED, slug UNINDEXED,
+        tokenize = 'porter unicode61'
+    )
+    """,
+]
+
+POSTGRES_SCHEMA = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {TABLE} (
+        id bigserial PRIMARY KEY,
+        kind varchar(20) NOT NULL,
+        object_id bigint NOT NULL,
+        user_id bigint NOT NULL,
+        slug varchar(50) NOT NULL DEFAULT '',
+        title text NOT NULL DEFAULT '',
+        tags text NOT NULL DEFAULT '',
+        body text NOT NULL DEFAULT '',
+        document tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A')
+            || setweight(to_tsvector('english', tags), 'B')
+            || setweight(to_tsvector('english', body), 'C')
+        ) STORED,
+        UNIQUE (kind, object_id)
+    )
+    """,
+    f'CREATE INDEX IF NOT EXISTS {TABLE}_document ON {TABLE} USING gin (document)',
+    f'CREATE INDEX IF NOT EXISTS {TABLE}_user ON {TABLE} (user_id, kind)',
+]
+
+SCHEMAS = {'sqlite': SQLITE_SCHEMA, 'postgresql': POSTGRES_SCHEMA}
+
+
+def _documents(apps):
+    """(title, tags, body, kind, object_id, user_id, slug) for every public searchable object."""
+    for project in apps.get_model('api', 'Project').objects.filter(is_visible=True).iterator():
+        yield project.title, '', project.description, 'project', project.pk, project.user_id, project.slug
+    for post in apps.get_model('api', 'BlogPost').objects.filter(is_published=True).iterator():
+        tags = ' '.join(str(tag) for tag in post.tags or [])
+        yield post.title, tags, f'{post.excerpt}\n{post.content}', 'blog', post.pk, post.user_id, post.slug
+    for experience in apps.get_model('api', 'Experience').objects.iterator():
+        body = '\n'.join(str(highlight) for highlight in experience.highlights or [])
+        title = f'{experience.role} at {experience.company}'
+        yield title, '', body, 'experience', experience.pk, experience.user_id, ''
+    for certification in apps.get_model('api', 'Certification').objects.iterator():
+        tags = ' '.join(str(skill) for skill in certification.skills or [])
+        owner = certification.user_id
+        yield certification.name, tags, certification.issuer, 'certification', certification.pk, owner, ''
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in SCHEMAS:
+        return
+    for statement in SCHEMAS[schema_editor.connection.vendor]:
+        schema_editor.execute(statement)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {TABLE} (title, tags, body, kind, object_id, user_id, slug) '
+            'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+            list(_documents(apps)),
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in SCHEMAS:
+        schema_editor.execute(f'DROP TABLE IF EXISTS {TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_public_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
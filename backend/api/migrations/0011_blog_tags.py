@@ -0,0 +1,57 @@
+# Generated by Django 6.0.2 on 2026-10-17 12:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from api import tags
+
+
+def index_existing_tags(apps, schema_editor):
+    for post in apps.get_model('api', 'BlogPost').objects.iterator():
+        tags.sync_post_tags(post, apps.get_model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('slug', models.SlugField()),
+                ('published_count', models.PositiveIntegerField(default=0, help_text='Published posts carrying this tag')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='blog_tags', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-published_count', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_tags', to='api.blogpost')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_tags', to='api.tag')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['user', '-published_count', 'name'], name='tag_user_count_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='tag',
+            unique_together={('user', 'slug')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='posttag',
+            unique_together={('tag', 'post')},
+        ),
+        migrations.RunPython(index_existing_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 6.0.2 on 2026-10-17 12:30
+
+from django.db import migrations, models
+
+from api.rendering import RENDER_TARGETS, render_markdown
+
+# Sections whose rows gained the rendered fields.
+RENDERED_SECTIONS = ['blog', 'blog_details', 'project_details']
+
+
+def render_existing_markdown(apps, schema_editor):
+    for model_name, (source, rendered_fields, apply_render) in RENDER_TARGETS.items():
+        rows = list(apps.get_model('api', model_name).objects.all())
+        for row in rows:
+            apply_render(row, render_markdown(getattr(row, source)))
+        apps.get_model('api', model_name).objects.bulk_update(rows, rendered_fields, batch_size=200)
+
+    # get_snapshot() rebuilds the dropped sections on the next request. The new version
+    # orphans responses cached from the old payload once the cached validators expire.
+    for snapshot in apps.get_model('api', 'PortfolioSnapshot').objects.all():
+        for key in RENDERED_SECTIONS:
+            snapshot.sections.pop(key, None)
+        snapshot.version += 1
+        snapshot.save(update_fields=['sections', 'version', 'updated_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_blog_tags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='Sanitized HTML rendered from content'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='render_version',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='toc',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Headings of content, nested'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Sanitized HTML rendered from description'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='render_version',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='toc',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Headings of description, nested'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='blogpost',
+            name='read_time',
+            field=models.CharField(default='1 min read', help_text='Derived from word_count on save', max_length=20),
+        ),
+        migrations.RunPython(render_existing_markdown, migrations.RunPython.noop),
+    ]
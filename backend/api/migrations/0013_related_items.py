@@ -0,0 +1,49 @@
+# Generated by Django 6.0.2 on 2026-10-17 13:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from api import related
+
+# Sections whose rows gained the related items.
+RELATED_SECTIONS = ['project_details', 'blog_details']
+
+
+def compute_related_items(apps, schema_editor):
+    for _ in related.rebuild_related(apps.get_model):
+        pass
+    # Drop the detail sections so get_snapshot() rebuilds them with the related items. The new
+    # version orphans responses cached from the old payload once the cached validators expire.
+    for snapshot in apps.get_model('api', 'PortfolioSnapshot').objects.all():
+        for key in RELATED_SECTIONS:
+            snapshot.sections.pop(key, None)
+        snapshot.version += 1
+        snapshot.save(update_fields=['sections', 'version', 'updated_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_markdown_render_cache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('blog', 'Blog Post'), ('project', 'Project')], max_length=10)),
+                ('source_id', models.BigIntegerField()),
+                ('target_id', models.BigIntegerField()),
+                ('score', models.FloatField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_items', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['kind', 'source_id', '-score'],
+                'indexes': [models.Index(fields=['user', 'kind', 'source_id', '-score'], name='related_user_kind_idx')],
+            },
+        ),
+        migrations.RunPython(compute_related_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-17 14:00
+
+from django.db import migrations
+
+# Sections whose rows gained *_srcset fields.
+SRCSET_SECTIONS = ['profile', 'projects', 'project_details', 'blog', 'blog_details', 'testimonials']
+
+
+def drop_srcset_sections(apps, schema_editor):
+    # get_snapshot() rebuilds the dropped sections on the next request. The new version
+    # orphans responses cached from the old payload once the cached validators expire.
+    for snapshot in apps.get_model('api', 'PortfolioSnapshot').objects.all():
+        for key in SRCSET_SECTIONS:
+            snapshot.sections.pop(key, None)
+        snapshot.version += 1
+        snapshot.save(update_fields=['sections', 'version', 'updated_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_related_items'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_srcset_sections, migrations.RunPython.noop),
+    ]
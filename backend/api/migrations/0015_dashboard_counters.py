@@ -0,0 +1,77 @@
+# Generated by Django 6.0.2 on 2026-10-17 15:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+# Model name -> (owner field, {counter: filter the row must match, or None}), as in api/counters.py.
+COUNTERS = {
+    'Project': ('user', {'projects': None, 'featured_projects': {'is_featured': True}}),
+    'Skill': ('user', {'skills': None}),
+    'SkillCategory': ('user', {'categories': None}),
+    'Experience': ('user', {'experience': None}),
+    'Message': ('recipient', {'messages': None, 'unread_messages': {'is_read': False}}),
+    'BlogPost': ('user', {'blog_posts': None, 'published_posts': {'is_published': True}}),
+    'Testimonial': ('user', {'testimonials': None}),
+    'Education': ('user', {'education': None}),
+    'Activity': ('user', {'activities': None}),
+    'Achievement': ('user', {'achievements': None}),
+    'Certification': ('user', {'certifications': None}),
+}
+
+
+def backfill_counters(apps, schema_editor):
+    # One grouped COUNT per counter, then one row per user.
+    counts = {}
+    for model_name, (owner, model_counters) in COUNTERS.items():
+        model = apps.get_model('api', model_name)
+        for counter, condition in model_counters.items():
+            rows = model.objects.filter(**(condition or {})).order_by().values(owner).annotate(count=Count('pk'))
+            for row in rows:
+                counts.setdefault(row[owner], {})[counter] = row['count']
+
+    DashboardCounters = apps.get_model('api', 'DashboardCounters')
+    DashboardCounters.objects.bulk_create(
+        [
+            DashboardCounters(user_id=user_id, **counts.get(user_id, {}))
+            for user_id in apps.get_model('auth', 'User').objects.values_list('pk', flat=True)
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_responsive_image_srcsets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounters',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard_counters', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('projects', models.PositiveIntegerField(default=0)),
+                ('featured_projects', models.PositiveIntegerField(default=0)),
+                ('skills', models.PositiveIntegerField(default=0)),
+                ('categories', models.PositiveIntegerField(default=0)),
+                ('experience', models.PositiveIntegerField(default=0)),
+                ('messages', models.PositiveIntegerField(default=0)),
+                ('unread_messages', models.PositiveIntegerField(default=0)),
+                ('blog_posts', models.PositiveIntegerField(default=0)),
+                ('published_posts', models.PositiveIntegerField(default=0)),
+                ('testimonials', models.PositiveIntegerField(default=0)),
+                ('education', models.PositiveIntegerField(default=0)),
+                ('activities', models.PositiveIntegerField(default=0)),
+                ('achievements', models.PositiveIntegerField(default=0)),
+                ('certifications', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Dashboard Counters',
+                'verbose_name_plural': 'Dashboard Counters',
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0.2 on 2026-10-17 16:00
+
+from django.db import migrations
+
+ORDER_GAP = 1024  # api.ordering.ORDER_GAP when this migration was written
+
+ORDERED_MODELS = [
+    'SkillCategory', 'Skill', 'Project', 'Experience', 'Education',
+    'Activity', 'Achievement', 'Certification', 'Testimonial',
+]
+# Sections whose rows serialize the `order` value.
+ORDER_SECTIONS = [
+    'skills', 'projects', 'project_details', 'experience', 'education',
+    'activities', 'achievements', 'certifications', 'testimonials',
+]
+
+
+def spread_order_keys(apps, schema_editor):
+    # Renumber each user's rows ORDER_GAP apart, keeping the order they display in today.
+    for model_name in ORDERED_MODELS:
+        model = apps.get_model('api', model_name)
+        rows = model.objects.order_by('user_id', *model._meta.ordering, 'pk').values_list('pk', 'user_id')
+        by_user = {}
+        for pk, user_id in rows:
+            by_user.setdefault(user_id, []).append(pk)
+        model.objects.bulk_update(
+            [
+                model(pk=pk, order=ORDER_GAP * position)
+                for pks in by_user.values()
+                for position, pk in enumerate(pks, start=1)
+            ],
+            ['order'],
+            batch_size=500,
+        )
+
+    # get_snapshot() rebuilds the dropped sections on the next request. The new version
+    # orphans responses cached from the old payload once the cached validators expire.
+    for snapshot in apps.get_model('api', 'PortfolioSnapshot').objects.all():
+        for key in ORDER_SECTIONS:
+            snapshot.sections.pop(key, None)
+        snapshot.version += 1
+        snapshot.save(update_fields=['sections', 'version', 'updated_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_dashboard_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(spread_order_keys, migrations.RunPython.noop),
+    ]
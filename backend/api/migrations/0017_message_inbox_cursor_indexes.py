@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-17 17:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_gap_order_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_inbox_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='message_inbox_unread_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='message_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['recipient', 'is_read', '-created_at', '-id'], name='message_inbox_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['recipient', 'sender_email', '-created_at', '-id'], name='message_inbox_sender_idx'),
+        ),
+    ]
@@ -2,6 +2,34 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils.text import slugify
 
+from .counters import track_flags
+from .rendering import RENDER_TARGETS, render_markdown
+
+
+# ─── Markdown Rendering ────────────────────────────────────────────────────
+
+def render_fields(instance, save_kwargs):
+    """Render the instance's markdown source into its stored HTML / TOC / word count columns."""
+    source, rendered_fields, apply_render = RENDER_TARGETS[type(instance).__name__]
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None:
+        if source not in update_fields:
+            return
+        save_kwargs['update_fields'] = {*update_fields, *rendered_fields}
+    apply_render(instance, render_markdown(getattr(instance, source)))
+
+
+# ─── Dashboard Counters ────────────────────────────────────────────────────
+
+class CountedFlagsMixin:
+    """Remembers the counter flags a loaded row had, so saving it updates the dashboard counters by delta."""
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        track_flags(cls.__name__, instance)
+        return instance
+
 
 # ─── Profile (One per User) ────────────────────────────────────────────────
 
@@ -78,13 +106,20 @@ class SkillCategory(models.Model):
         verbose_name_plural = "Skill Categories"
         ordering = ['order', 'name']
         unique_together = ['user', 'name']
+        indexes = [
+            models.Index(fields=['user', 'order', 'name'], name='skillcat_user_order_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
+    def populate_derived_fields(self, save_kwargs=None):
+        """Fill the columns save() derives; bulk writes (api/bulk.py) call this directly."""
         if not self.slug:
             self.slug = slugify(self.name)
+
+    def save(self, *args, **kwargs):
+        self.populate_derived_fields(kwargs)
         super().save(*args, **kwargs)
 
 
@@ -105,6 +140,9 @@ class Skill(models.Model):
 
     class Meta:
         ordering = ['order', 'name']
+        indexes = [
+            models.Index(fields=['user', 'order', 'name'], name='skill_user_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.category.name})"
@@ -112,7 +150,7 @@ class Skill(models.Model):
 
 # ─── Project ───────────────────────────────────────────────────────────────
 
-class Project(models.Model):
+class Project(CountedFlagsMixin, models.Model):
     """Portfolio project — scoped to each user."""
 
     CATEGORY_CHOICES = [
@@ -128,6 +166,10 @@ class Project(models.Model):
     slug = models.SlugField(blank=True)
     thumbnail = models.URLField(blank=True, help_text="Cloudinary URL for cover image")
     description = models.TextField(blank=True, help_text="Detailed project description (supports markdown)")
+    description_html = models.TextField(blank=True, editable=False, help_text="Sanitized HTML rendered from description")
+    toc = models.JSONField(default=list, blank=True, editable=False, help_text="Headings of description, nested")
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
     short_description = models.CharField(max_length=300, blank=True, help_text="One-liner for card view")
     tech_stack = models.ManyToManyField(Skill, blank=True, related_name='projects')
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='other')
@@ -143,13 +185,24 @@ class Project(models.Model):
     class Meta:
         ordering = ['order', '-date_built']
         unique_together = ['user', 'slug']
+        indexes = [
+            models.Index(fields=['user', 'order', '-date_built'], name='project_user_order_idx'),
+            models.Index(fields=['user', 'is_visible', 'order', '-date_built'], name='project_public_order_idx'),
+            models.Index(fields=['user', 'is_visible', 'category', 'is_featured'], name='project_public_filter_idx'),
+            models.Index(fields=['user', 'is_featured'], name='project_user_featured_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
+    def populate_derived_fields(self, save_kwargs=None):
+        """Fill the columns save() derives; bulk writes (api/bulk.py) call this directly."""
         if not self.slug:
             self.slug = slugify(self.title)
+        render_fields(self, {} if save_kwargs is None else save_kwargs)
+
+    def save(self, *args, **kwargs):
+        self.populate_derived_fields(kwargs)
         super().save(*args, **kwargs)
 
 
@@ -176,6 +229,9 @@ class Experience(models.Model):
     class Meta:
         ordering = ['order', '-start_date']
         verbose_name_plural = "Experiences"
+        indexes = [
+            models.Index(fields=['user', 'order', '-start_date'], name='experience_user_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.role} at {self.company}"
@@ -201,6 +257,9 @@ class Education(models.Model):
     class Meta:
         ordering = ['order', '-start_date', '-created_at']
         verbose_name_plural = "Education"
+        indexes = [
+            models.Index(fields=['user', 'order', '-start_date', '-created_at'], name='education_user_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.degree} - {self.institution}"
@@ -228,6 +287,9 @@ class Activity(models.Model):
     class Meta:
         ordering = ['order', '-start_date', '-created_at']
         verbose_name_plural = "Activities"
+        indexes = [
+            models.Index(fields=['user', 'order', '-start_date', '-created_at'], name='activity_user_order_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -247,6 +309,9 @@ class Achievement(models.Model):
 
     class Meta:
         ordering = ['order', '-achieved_on', '-created_at']
+        indexes = [
+            models.Index(fields=['user', 'order', '-achieved_on', '-created_at'], name='achievement_user_order_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -272,21 +337,28 @@ class Certification(models.Model):
 
     class Meta:
         ordering = ['order', '-issue_date', '-created_at']
+        indexes = [
+            models.Index(fields=['user', 'order', '-issue_date', '-created_at'], name='cert_user_order_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class BlogPost(models.Model):
+class BlogPost(CountedFlagsMixin, models.Model):
     """Blog posts — scoped to each user."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='blog_posts')
     title = models.CharField(max_length=200)
     slug = models.SlugField(blank=True)
     excerpt = models.TextField(max_length=500, help_text="Brief description for cards")
     content = models.TextField(help_text="Full article content (supports markdown)")
+    content_html = models.TextField(blank=True, editable=False, help_text="Sanitized HTML rendered from content")
+    toc = models.JSONField(default=list, blank=True, editable=False, help_text="Headings of content, nested")
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
     thumbnail = models.URLField(blank=True, help_text="Cloudinary URL for cover image")
     tags = models.JSONField(default=list, blank=True, help_text='List of tags, e.g. ["React", "Django"]')
-    read_time = models.CharField(max_length=20, default="5 min read")
+    read_time = models.CharField(max_length=20, default="1 min read", help_text="Derived from word_count on save")
     is_published = models.BooleanField(default=False)
     is_featured = models.BooleanField(default=False)
     published_at = models.DateTimeField(null=True, blank=True)
@@ -296,16 +368,82 @@ class BlogPost(models.Model):
     class Meta:
         ordering = ['-published_at', '-created_at']
         unique_together = ['user', 'slug']
+        indexes = [
+            models.Index(fields=['user', '-published_at', '-created_at'], name='blog_user_date_idx'),
+            models.Index(fields=['user', 'is_published', '-published_at', '-created_at'], name='blog_public_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
+    def populate_derived_fields(self, save_kwargs=None):
+        """Fill the columns save() derives; bulk writes (api/bulk.py) call this directly."""
         if not self.slug:
             self.slug = slugify(self.title)
+        render_fields(self, {} if save_kwargs is None else save_kwargs)
+
+    def save(self, *args, **kwargs):
+        self.populate_derived_fields(kwargs)
         super().save(*args, **kwargs)
 
 
+# ─── Blog Tags (Normalized Index of BlogPost.tags) ─────────────────────────
+
+class Tag(models.Model):
+    """Normalized blog tag — scoped to each user, with a maintained count of published posts."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='blog_tags')
+    name = models.CharField(max_length=50)
+    slug = models.SlugField()
+    published_count = models.PositiveIntegerField(default=0, help_text="Published posts carrying this tag")
+
+    class Meta:
+        ordering = ['-published_count', 'name']
+        unique_together = ['user', 'slug']
+        indexes = [
+            models.Index(fields=['user', '-published_count', 'name'], name='tag_user_count_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class PostTag(models.Model):
+    """Link between a blog post and one of its normalized tags (kept in sync with BlogPost.tags)."""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='post_tags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='post_tags')
+
+    class Meta:
+        unique_together = ['tag', 'post']
+
+    def __str__(self):
+        return f"{self.post} #{self.tag}"
+
+
+# ─── Related Content (Precomputed Similarity) ──────────────────────────────
+
+class RelatedItem(models.Model):
+    """Precomputed neighbour of a blog post or project within one user's portfolio (see api/related.py)."""
+    KIND_CHOICES = [
+        ('blog', 'Blog Post'),
+        ('project', 'Project'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='related_items')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    source_id = models.BigIntegerField()
+    target_id = models.BigIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ['kind', 'source_id', '-score']
+        indexes = [
+            models.Index(fields=['user', 'kind', 'source_id', '-score'], name='related_user_kind_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.source_id} -> {self.target_id} ({self.score:.2f})"
+
+
 # ─── Testimonial ───────────────────────────────────────────────────────────
 
 class Testimonial(models.Model):
@@ -325,6 +463,9 @@ class Testimonial(models.Model):
 
     class Meta:
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['user', 'order', '-created_at'], name='testimonial_user_order_idx'),
+        ]
 
     def __str__(self):
         return f"{self.client_name} - {self.client_company}"
@@ -332,7 +473,7 @@ class Testimonial(models.Model):
 
 # ─── Message (Contact Form) ────────────────────────────────────────────────
 
-class Message(models.Model):
+class Message(CountedFlagsMixin, models.Model):
     """Incoming messages from the contact form — scoped to each user."""
     recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='messages')
     sender_name = models.CharField(max_length=100)
@@ -345,7 +486,56 @@ class Message(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient', '-created_at', '-id'], name='message_inbox_idx'),
+            models.Index(fields=['recipient', 'is_read', '-created_at', '-id'], name='message_inbox_unread_idx'),
+            models.Index(fields=['recipient', 'sender_email', '-created_at', '-id'], name='message_inbox_sender_idx'),
+        ]
 
     def __str__(self):
         return f"From {self.sender_name}: {self.subject or '(no subject)'}"
 
+
+# ─── Portfolio Snapshot (Materialized Public Payload) ──────────────────────
+
+class PortfolioSnapshot(models.Model):
+    """Pre-serialized public portfolio payload, one per user, keyed by section."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='portfolio_snapshot')
+    sections = models.JSONField(default=dict, blank=True, help_text="Section key -> serialized public payload")
+    version = models.PositiveIntegerField(default=0, help_text="Bumped on every rebuild; used as the public ETag")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Portfolio Snapshot"
+        verbose_name_plural = "Portfolio Snapshots"
+
+    def __str__(self):
+        return f"Snapshot for {self.user}"
+
+
+# ─── Dashboard Counters (Materialized Stats) ───────────────────────────────
+
+class DashboardCounters(models.Model):
+    """Per-user row counts behind the dashboard stats, kept current on every write (see api/counters.py)."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='dashboard_counters')
+    projects = models.PositiveIntegerField(default=0)
+    featured_projects = models.PositiveIntegerField(default=0)
+    skills = models.PositiveIntegerField(default=0)
+    categories = models.PositiveIntegerField(default=0)
+    experience = models.PositiveIntegerField(default=0)
+    messages = models.PositiveIntegerField(default=0)
+    unread_messages = models.PositiveIntegerField(default=0)
+    blog_posts = models.PositiveIntegerField(default=0)
+    published_posts = models.PositiveIntegerField(default=0)
+    testimonials = models.PositiveIntegerField(default=0)
+    education = models.PositiveIntegerField(default=0)
+    activities = models.PositiveIntegerField(default=0)
+    achievements = models.PositiveIntegerField(default=0)
+    certifications = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Dashboard Counters"
+        verbose_name_plural = "Dashboard Counters"
+
+    def __str__(self):
+        return f"Counters for {self.user}"
@@ -0,0 +1,150 @@
+"""
+Sparse, gap-based `order` keys for the dashboard collections.
+
+Keys are spaced ORDER_GAP apart, so moving an item only needs a key strictly
+between its new neighbours'. plan_reorder() keeps the longest run of rows whose
+current keys already increase along the requested order (the longest increasing
+subsequence) and gives the others keys spread evenly through the gaps around
+them; moving one item therefore rewrites exactly one row. Only when a gap is too
+narrow for the rows that must fit into it is the whole collection renumbered.
+
+Items created without an `order` are appended ORDER_GAP after the owner's last
+row, so a new item lands at the end instead of jumping ahead of every gapped key.
+"""
+from bisect import bisect_left
+
+from django.db import transaction
+from django.db.models import Max
+from rest_framework import status
+from rest_framework.response import Response
+
+from .snapshots import SECTION_DEPENDENCIES, schedule_refresh
+
+ORDER_GAP = 1024
+
+
+def gap_keys(count):
+    """Evenly spaced keys for `count` rows: ORDER_GAP, 2 * ORDER_GAP, ..."""
+    return [ORDER_GAP * position for position in range(1, count + 1)]
+
+
+def _kept_positions(keys):
+    """Positions of a longest strictly increasing subsequence of keys (patience sorting, O(n log n))."""
+    tails, tail_positions, previous = [], [], [None] * len(keys)
+    for position, key in enumerate(keys):
+        slot = bisect_left(tails, key)
+        if slot == len(tails):
+            tails.append(key)
+            tail_positions.append(position)
+        else:
+            tails[slot] = key
+            tail_positions[slot] = position
+        previous[position] = tail_positions[slot - 1] if slot else None
+
+    kept = []
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        kept.append(position)
+        position = previous[position]
+    return kept[::-1]
+
+
+def _spread(low, high, count):
+    """count integer keys strictly between low and high (None = open end), or None if they do not fit."""
+    if low is None and high is None:
+        return gap_keys(count)
+    if low is None:
+        return [high - ORDER_GAP * (count - index) for index in range(count)]
+    if high is None:
+        return [low + ORDER_GAP * (index + 1) for index in range(count)]
+    if high - low <= count:
+        return None
+    step = (high - low) / (count + 1)
+    return [low + int(step * (index + 1)) for index in range(count)]
+
+
+def plan_reorder(keys):
+    """
+    New keys for rows whose current keys, listed in the requested order, are `keys`.
+    Returns the full list of new keys; rows whose key is unchanged need no write.
+    """
+    kept = _kept_positions(keys)
+    planned = list(keys)
+    bounds = [None, *kept, None]
+    for low_position, high_position in zip(bounds, bounds[1:]):
+        start = 0 if low_position is None else low_position + 1
+        end = len(keys) if high_position is None else high_position
+        if start == end:
+            continue
+        spread = _spread(
+            None if low_position is None else keys[low_position],
+            None if high_position is None else keys[high_position],
+            end - start,
+        )
+        if spread is None:
+            return gap_keys(len(keys))
+        planned[start:end] = spread
+    return planned
+
+
+# ─── New Items ─────────────────────────────────────────────────────────────
+
+def is_ordered(model):
+    return any(field.name == 'order' for field in model._meta.concrete_fields)
+
+
+def next_order_keys(model, owner, count=1):
+    """`count` keys after the last of the owner's rows (owner: filter kwargs), ORDER_GAP apart."""
+    last = model.objects.filter(**owner).aggregate(last=Max('order'))['last'] or 0
+    return [last + ORDER_GAP * position for position in range(1, count + 1)]
+
+
+class AppendOrderMixin:
+    """perform_create() for an ordered dashboard collection: a POST without `order` appends the item."""
+    owner_field = 'user'
+
+    def perform_create(self, serializer):
+        owner = {self.owner_field: self.request.user}
+        extra = {}
+        if 'order' not in serializer.validated_data:
+            [extra['order']] = next_order_keys(self.get_queryset().model, owner)
+        serializer.save(**owner, **extra)
+
+
+# ─── Reorder Endpoint ──────────────────────────────────────────────────────
+
+class ReorderMixin:
+    """
+    Adds POST <collection>/reorder/ to a dashboard ListCreate view:
+    {"ids": [...]} lists every row of the collection in its new order. Only the
+    rows whose key changes are written, with one bulk_update.
+    """
+    http_method_names = ['post', 'options']
+    owner_field = 'user'
+
+    def post(self, request, *args, **kwargs):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+            return Response({'detail': 'Expected "ids": a list of integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.get_queryset().model
+        current = dict(
+            model.objects.filter(**{self.owner_field: request.user}).order_by().values_list('pk', 'order')
+        )
+        if len(ids) != len(current) or set(ids) != set(current):
+            return Response(
+                {'detail': 'ids must list every item in the collection exactly once.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        keys = [current[pk] for pk in ids]
+        planned = plan_reorder(keys)
+        changed = [model(pk=pk, order=new) for pk, old, new in zip(ids, keys, planned) if new != old]
+        if changed:
+            with transaction.atomic():
+                model.objects.bulk_update(changed, ['order'])
+                schedule_refresh(request.user.pk, SECTION_DEPENDENCIES[model])
+        return Response({
+            'updated': len(changed),
+            'order': [{'id': pk, 'order': key} for pk, key in zip(ids, planned)],
+        })
@@ -0,0 +1,144 @@
+"""
+Keyset (cursor) pagination for long public lists and the message inbox.
+
+Pages are fetched with a seek predicate on the full ordering, e.g.
+WHERE (published_at, created_at, id) < (...), instead of COUNT(*) + OFFSET,
+so every page costs the same regardless of depth and concurrent inserts do not
+shift page boundaries. NULLs always sort last in forward order.
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on every column of `ordering`. The last column must
+    be unique (normally the primary key) so that ties are broken stably.
+    """
+    ordering = ()
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def _fields(self):
+        return [(name.lstrip('-'), name.startswith('-')) for name in self.ordering]
+
+    def _order_by(self, reverse):
+        expressions = []
+        for name, descending in self._fields():
+            # Forward order puts NULLs last; walking backwards puts them first.
+            nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+            if descending != reverse:
+                expressions.append(F(name).desc(**nulls))
+            else:
+                expressions.append(F(name).asc(**nulls))
+        return expressions
+
+    def _after(self, name, descending, value, reverse):
+        """Rows strictly past `value` on a single column, in the walking direction."""
+        if value is None:
+            # Forward: nothing sorts after NULL. Backward: every non-NULL sorts before it.
+            return Q(**{f'{name}__isnull': False}) if reverse else Q(pk__in=[])
+        lookup = 'lt' if descending != reverse else 'gt'
+        condition = Q(**{f'{name}__{lookup}': value})
+        if not reverse:
+            condition |= Q(**{f'{name}__isnull': True})
+        return condition
+
+    def _seek(self, key, reverse):
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, descending), value in zip(self._fields(), key):
+            condition |= equal & self._after(name, descending, value, reverse)
+            equal &= Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+        return condition
+
+    def _key(self, row):
+        return [_encode_value(getattr(row, name)) for name, _ in self._fields()]
+
+    def _decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            key, reverse = payload['k'], bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(key, list) or len(key) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return key, reverse
+
+    def _encode_cursor(self, key, reverse):
+        payload = {'k': key, 'r': 1} if reverse else {'k': key}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        key, reverse = self._decode_cursor(request)
+
+        queryset = queryset.order_by(*self._order_by(reverse))
+        if key is not None:
+            queryset = queryset.filter(self._seek(key, reverse))
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_url = self.previous_url = None
+        if rows:
+            has_next = has_more if not reverse else True
+            has_previous = key is not None if not reverse else has_more
+            if has_next:
+                self.next_url = self._encode_cursor(self._key(rows[-1]), reverse=False)
+            if has_previous:
+                self.previous_url = self._encode_cursor(self._key(rows[0]), reverse=True)
+        elif reverse:
+            self.next_url = remove_query_param(self.base_url, self.cursor_query_param)
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.next_url,
+            'previous': self.previous_url,
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class BlogKeysetPagination(KeysetPagination):
+    ordering = ('-published_at', '-created_at', '-id')
+
+
+class ProjectKeysetPagination(KeysetPagination):
+    ordering = ('order', '-date_built', 'id')
+
+
+class MessageKeysetPagination(KeysetPagination):
+    ordering = ('-created_at', '-id')
@@ -0,0 +1,173 @@
+"""
+Precomputed "related posts" / "related projects" for the public detail pages.
+
+Similarity within one user's published posts (or visible projects) combines
+TF-IDF cosine over title + body with Jaccard overlap of BlogPost.tags /
+Project.tech_stack, computed as dense NumPy matrices. The top RELATED_LIMIT
+neighbours of every item are stored as RelatedItem rows and embedded in the
+snapshot detail payloads, so serving them costs nothing per request.
+
+A write to a post or project recomputes its owner's matrix for that kind (a
+couple of queries and a few milliseconds for a portfolio-sized corpus, and IDF
+stays exact) but only rewrites the neighbour lists that actually changed.
+"""
+import re
+
+import numpy as np
+from django.apps import apps
+from django.db import transaction
+
+from .tags import tag_slugs
+
+RELATED_LIMIT = 4
+MIN_SCORE = 0.05
+TEXT_WEIGHT = 0.6  # The rest of the score comes from tag / tech stack overlap.
+TITLE_REPEAT = 2   # Title terms count this many times as body terms.
+
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or that the this to was were will with '
+    'we you your our i my me how what why when which into about over than then them they their can not'.split()
+)
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]')
+
+
+def _tokens(text):
+    return [token for token in _TOKEN_RE.findall((text or '').lower()) if token not in STOPWORDS]
+
+
+# ─── Corpora ───────────────────────────────────────────────────────────────
+
+def _blog_corpus(user_id, get_model):
+    posts = get_model('api', 'BlogPost').objects.filter(user_id=user_id, is_published=True)
+    return [
+        (post.pk, f'{post.title} ' * TITLE_REPEAT + f'{post.excerpt} {post.content}', set(tag_slugs(post.tags)))
+        for post in posts.only('pk', 'title', 'excerpt', 'content', 'tags')
+    ]
+
+
+def _project_corpus(user_id, get_model):
+    projects = get_model('api', 'Project').objects.filter(user_id=user_id, is_visible=True)
+    through = get_model('api', 'Project').tech_stack.through.objects.filter(project__in=projects)
+    stacks = {}
+    for project_id, skill_id in through.values_list('project_id', 'skill_id'):
+        stacks.setdefault(project_id, set()).add(skill_id)
+    return [
+        (
+            project.pk,
+            f'{project.title} ' * TITLE_REPEAT + f'{project.short_description} {project.description}',
+            stacks.get(project.pk, set()),
+        )
+        for project in projects.only('pk', 'title', 'short_description', 'description')
+    ]
+
+
+# kind -> (model name, corpus loader returning [(pk, text, feature set)])
+RELATED_SOURCES = {
+    'blog': ('BlogPost', _blog_corpus),
+    'project': ('Project', _project_corpus),
+}
+KIND_BY_MODEL = {model_name: kind for kind, (model_name, _) in RELATED_SOURCES.items()}
+
+
+# ─── Similarity ────────────────────────────────────────────────────────────
+
+def _tfidf_cosine(texts):
+    vocabulary = {}
+    rows, columns = [], []
+    for row, text in enumerate(texts):
+        for token in _tokens(text):
+            rows.append(row)
+            columns.append(vocabulary.setdefault(token, len(vocabulary)))
+    counts = np.zeros((len(texts), max(len(vocabulary), 1)), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)), 1.0)
+
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1.0 + len(texts)) / (1.0 + document_frequency)) + 1.0
+    vectors = np.log1p(counts) * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    return vectors @ vectors.T
+
+
+def _jaccard(feature_sets):
+    features = {feature: index for index, feature in enumerate(set().union(*feature_sets))}
+    membership = np.zeros((len(feature_sets), max(len(features), 1)), dtype=np.float32)
+    for row, feature_set in enumerate(feature_sets):
+        membership[row, [features[feature] for feature in feature_set]] = 1.0
+    intersection = membership @ membership.T
+    sizes = membership.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def nearest_neighbours(corpus, limit=RELATED_LIMIT):
+    """{pk: [(neighbour pk, score), ...]} best first, for a [(pk, text, feature set)] corpus."""
+    if len(corpus) < 2:
+        return {pk: [] for pk, _, _ in corpus}
+    pks = [pk for pk, _, _ in corpus]
+    scores = (
+        TEXT_WEIGHT * _tfidf_cosine([text for _, text, _ in corpus])
+        + (1.0 - TEXT_WEIGHT) * _jaccard([features for _, _, features in corpus])
+    )
+    np.fill_diagonal(scores, -1.0)
+    order = np.argsort(-scores, axis=1, kind='stable')[:, :limit]
+    return {
+        pks[row]: [
+            (pks[column], round(float(scores[row, column]), 4))
+            for column in order[row]
+            if scores[row, column] >= MIN_SCORE
+        ]
+        for row in range(len(pks))
+    }
+
+
+# ─── Index Maintenance ─────────────────────────────────────────────────────
+
+def refresh_related(user_id, kind, get_model=apps.get_model):
+    """Recompute one user's neighbours for `kind`, rewriting only the lists that changed."""
+    RelatedItem = get_model('api', 'RelatedItem')
+    neighbours = nearest_neighbours(RELATED_SOURCES[kind][1](user_id, get_model))
+
+    stored = {}
+    for source_id, target_id, score in (
+        RelatedItem.objects.filter(user_id=user_id, kind=kind)
+        .order_by('source_id', '-score', 'pk').values_list('source_id', 'target_id', 'score')
+    ):
+        stored.setdefault(source_id, []).append((target_id, score))
+
+    changed = [source_id for source_id in stored.keys() | neighbours.keys()
+               if stored.get(source_id, []) != neighbours.get(source_id, [])]
+    if not changed:
+        return 0
+    with transaction.atomic():
+        RelatedItem.objects.filter(user_id=user_id, kind=kind, source_id__in=changed).delete()
+        RelatedItem.objects.bulk_create([
+            RelatedItem(user_id=user_id, kind=kind, source_id=source_id, target_id=target_id, score=score)
+            for source_id in changed
+            for target_id, score in neighbours.get(source_id, [])
+        ])
+    return len(changed)
+
+
+def rebuild_related(get_model=apps.get_model):
+    """Recompute every user's neighbours; yields (user_id, kind, lists rewritten)."""
+    for kind, (model_name, _) in RELATED_SOURCES.items():
+        owners = get_model('api', model_name).objects.order_by().values_list('user_id', flat=True).distinct()
+        for user_id in owners:
+            yield user_id, kind, refresh_related(user_id, kind, get_model)
+
+
+def schedule_related_refresh(user_id, kind):
+    """Recompute once the surrounding transaction commits (before the snapshot rebuild)."""
+    transaction.on_commit(lambda: refresh_related(user_id, kind))
+
+
+def related_map(user_id, kind):
+    """{source pk: [target pk, ...]} best first, for embedding in snapshot details."""
+    related = {}
+    for source_id, target_id in (
+        apps.get_model('api', 'RelatedItem').objects.filter(user_id=user_id, kind=kind)
+        .order_by('source_id', '-score', 'pk').values_list('source_id', 'target_id')
+    ):
+        related.setdefault(source_id, []).append(target_id)
+    return related
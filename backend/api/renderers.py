@@ -0,0 +1,80 @@
+from xml.sax.saxutils import escape
+
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer backed by orjson's C encoder.
+    Produces the same compact UTF-8 output as DRF's renderer and falls back to it
+    for indented output or when orjson is unavailable.
+    """
+    _fallback_encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self._fallback_encoder.default)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match DRF: keep the output a strict JavaScript subset.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class XMLDocumentRenderer(BaseRenderer):
+    """Pass-through renderer for views that build their XML document themselves."""
+    media_type = 'application/xml'
+    format = 'xml'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        # Error payloads from DRF's exception handler, e.g. {'detail': ...}.
+        return f'<error>{escape(str(data.get("detail", "")))}</error>'.encode(self.charset)
+
+
+class RSSRenderer(XMLDocumentRenderer):
+    media_type = 'application/rss+xml'
+    format = 'rss'
+
+
+class AtomRenderer(XMLDocumentRenderer):
+    media_type = 'application/atom+xml'
+    format = 'atom'
+
+
+class FirstRendererNegotiation(BaseContentNegotiation):
+    """
+    Always pick the view's first renderer. Feed readers and crawlers send all
+    kinds of Accept headers, and a feed should never answer them with a 406.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
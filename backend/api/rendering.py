@@ -0,0 +1,85 @@
+"""
+Markdown rendering for BlogPost.content and Project.description.
+
+Markdown is rendered once, when the object is saved, into a sanitized HTML column
+with anchored headings, a nested table of contents and a word count (which drives
+BlogPost.read_time). Bump RENDERER_VERSION whenever the output of render_markdown()
+changes; `python manage.py render_markdown` then re-renders every stale row.
+"""
+import math
+import re
+from collections import namedtuple
+
+import markdown
+import nh3
+
+RENDERER_VERSION = 1
+WORDS_PER_MINUTE = 200
+
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists', 'toc']
+
+ALLOWED_ATTRIBUTES = {
+    **nh3.ALLOWED_ATTRIBUTES,
+    **{f'h{level}': {'id'} for level in range(1, 7)},
+    'a': {'href', 'hreflang', 'title'},
+    'img': {'src', 'alt', 'title', 'width', 'height'},
+    'code': {'class'},
+    'th': {'align'},
+    'td': {'align'},
+}
+
+_WORD_RE = re.compile(r"\w+(?:['’]\w+)*")
+
+Rendered = namedtuple('Rendered', ['html', 'toc', 'word_count'])
+
+
+def _toc_entries(tokens):
+    return [
+        {
+            'id': token['id'],
+            'title': token['name'],
+            'level': token['level'],
+            'children': _toc_entries(token['children']),
+        }
+        for token in tokens
+    ]
+
+
+def render_markdown(text):
+    """Render markdown to sanitized HTML, its table of contents and its word count."""
+    text = text or ''
+    converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    html = nh3.clean(converter.convert(text), attributes=ALLOWED_ATTRIBUTES)
+    plain_text = nh3.clean(html, tags=set())
+    return Rendered(html, _toc_entries(converter.toc_tokens), len(_WORD_RE.findall(plain_text)))
+
+
+def render_batch(batch):
+    """
+    Render [(pk, markdown), ...] for `manage.py render_markdown`. Runs in pool
+    workers, so it lives here, away from any model import a spawned worker
+    would trip over before Django is set up.
+    """
+    return [(pk, render_markdown(text)) for pk, text in batch]
+
+
+def read_time(word_count):
+    return f'{max(1, math.ceil(word_count / WORDS_PER_MINUTE))} min read'
+
+
+def apply_blog_render(post, rendered):
+    post.content_html, post.toc, post.word_count = rendered
+    post.read_time = read_time(rendered.word_count)
+    post.render_version = RENDERER_VERSION
+
+
+def apply_project_render(project, rendered):
+    project.description_html, project.toc, project.word_count = rendered
+    project.render_version = RENDERER_VERSION
+
+
+# model name -> (markdown source field, fields written by the render, apply function)
+RENDER_TARGETS = {
+    'BlogPost': ('content', ['content_html', 'toc', 'word_count', 'read_time', 'render_version'], apply_blog_render),
+    'Project': ('description', ['description_html', 'toc', 'word_count', 'render_version'], apply_project_render),
+}
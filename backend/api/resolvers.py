@@ -0,0 +1,102 @@
+"""
+In-process cache resolving public username slugs to slim portfolio records.
+
+Public views only need the owner's user id and the Profile.show_* flags, so
+the resolver loads just those columns and keeps the result in a bounded LRU.
+Profile and User writes invalidate entries (see api/signals.py); the TTL
+bounds staleness for writes made by other worker processes.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+
+from .models import Profile
+
+VISIBILITY_FLAGS = (
+    'show_hero',
+    'show_about',
+    'show_highlights',
+    'show_skills',
+    'show_projects',
+    'show_experience',
+    'show_education',
+    'show_activities',
+    'show_achievements',
+    'show_certifications',
+    'show_blog',
+    'show_testimonials',
+    'show_contact',
+)
+
+
+class ResolvedPortfolio(namedtuple('ResolvedPortfolio', ['user_id', 'profile_id', 'visibility'])):
+    """Slim username resolution: owner ids plus the section visibility bitmask."""
+    __slots__ = ()
+
+    def is_visible(self, flag):
+        return bool(self.visibility & (1 << VISIBILITY_FLAGS.index(flag)))
+
+
+class UsernameResolver:
+    """Thread-safe LRU of username_slug -> ResolvedPortfolio with a per-entry TTL."""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def resolve(self, username_slug):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(username_slug)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(username_slug)
+                return entry[1]
+            generation = self._generation
+
+        row = (
+            Profile.objects
+            .filter(username_slug=username_slug)
+            .values_list('user_id', 'id', *VISIBILITY_FLAGS)
+            .first()
+        )
+        if row is None:
+            return None
+
+        visibility = sum(1 << index for index, shown in enumerate(row[2:]) if shown)
+        record = ResolvedPortfolio(row[0], row[1], visibility)
+        with self._lock:
+            # Skip the insert if an invalidation raced with the lookup above.
+            if generation == self._generation:
+                self._entries[username_slug] = (now + self.ttl, record)
+                self._entries.move_to_end(username_slug)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return record
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            self._generation += 1
+            stale = [slug for slug, (_, record) in self._entries.items() if record.user_id == user_id]
+            for slug in stale:
+                del self._entries[slug]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+username_resolver = UsernameResolver(
+    max_size=settings.USERNAME_RESOLVER_CACHE_SIZE,
+    ttl=settings.USERNAME_RESOLVER_CACHE_TTL,
+)
+
+
+def resolve_username(username_slug):
+    """Resolve a public username slug to a ResolvedPortfolio, or None."""
+    return username_resolver.resolve(username_slug)
@@ -0,0 +1,166 @@
+"""
+Full-text search within a single portfolio.
+
+Projects, published blog posts, experience highlights and certifications are
+indexed as (title, tags, body) documents in one api_search_index table: an FTS5
+virtual table on SQLite, or a table with a generated, GIN-indexed tsvector on
+PostgreSQL. Signals (api/signals.py) keep it in sync with every write. Results
+are ranked with bm25 on SQLite and ts_rank_cd on PostgreSQL, weighting title
+matches above tags and tags above body text.
+"""
+import re
+
+from django.db import connection
+
+TABLE = 'api_search_index'
+MAX_TERMS = 8
+
+# Backends the index exists on (created by migration 0010).
+VENDORS = ('sqlite', 'postgresql')
+
+
+# ─── Documents ─────────────────────────────────────────────────────────────
+
+def _project_document(project):
+    if not project.is_visible:
+        return None
+    return {'slug': project.slug, 'title': project.title, 'tags': '', 'body': project.description}
+
+
+def _blog_document(post):
+    if not post.is_published:
+        return None
+    return {
+        'slug': post.slug,
+        'title': post.title,
+        'tags': ' '.join(str(tag) for tag in post.tags or []),
+        'body': f'{post.excerpt}\n{post.content}',
+    }
+
+
+def _experience_document(experience):
+    return {
+        'slug': '',
+        'title': f'{experience.role} at {experience.company}',
+        'tags': '',
+        'body': '\n'.join(str(highlight) for highlight in experience.highlights or []),
+    }
+
+
+def _certification_document(certification):
+    return {
+        'slug': '',
+        'title': certification.name,
+        'tags': ' '.join(str(skill) for skill in certification.skills or []),
+        'body': certification.issuer,
+    }
+
+
+# kind -> (model name, Profile visibility flag, document builder returning None for non-public objects)
+SEARCH_SOURCES = {
+    'project': ('Project', 'show_projects', _project_document),
+    'blog': ('BlogPost', 'show_blog', _blog_document),
+    'experience': ('Experience', 'show_experience', _experience_document),
+    'certification': ('Certification', 'show_certifications', _certification_document),
+}
+KIND_BY_MODEL = {model_name: kind for kind, (model_name, _, _) in SEARCH_SOURCES.items()}
+
+
+# ─── Index Maintenance ─────────────────────────────────────────────────────
+
+def is_supported(conn=connection):
+    return conn.vendor in VENDORS
+
+
+def index_object(kind, instance, conn=connection):
+    """Replace the search document for one object (removing it if it is no longer public)."""
+    if not is_supported(conn):
+        return
+    document = SEARCH_SOURCES[kind][2](instance)
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s', [kind, instance.pk])
+        if document is not None:
+            cursor.execute(
+                f'INSERT INTO {TABLE} (title, tags, body, kind, object_id, user_id, slug) '
+                'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+                [document['title'], document['tags'], document['body'],
+                 kind, instance.pk, instance.user_id, document['slug']],
+            )
+
+
+def remove_object(kind, object_id, conn=connection):
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE kind = %s AND object_id = %s', [kind, object_id])
+
+
+def rebuild_index(get_model, conn=connection):
+    """Re-index every searchable object; get_model(app_label, model_name) resolves models."""
+    if not is_supported(conn):
+        return 0
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+    count = 0
+    for kind, (model_name, _, _) in SEARCH_SOURCES.items():
+        for instance in get_model('api', model_name).objects.using(conn.alias).iterator():
+            index_object(kind, instance, conn)
+            count += 1
+    return count
+
+
+# ─── Querying ──────────────────────────────────────────────────────────────
+
+def _terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+def _sqlite_search(user_id, terms, kinds, limit):
+    # Quote every term so FTS5 syntax in user input is matched literally; the last
+    # term is a prefix so results show up while the visitor is still typing.
+    match = ' '.join(f'"{term}"' for term in terms) + '*'
+    placeholders = ', '.join(['%s'] * len(kinds))
+    sql = (
+        f"SELECT kind, object_id, slug, title, snippet({TABLE}, -1, '', '', '…', 16), "
+        f'bm25({TABLE}, 10.0, 4.0, 1.0) AS rank '
+        f'FROM {TABLE} WHERE {TABLE} MATCH %s AND user_id = %s AND kind IN ({placeholders}) '
+        'ORDER BY rank LIMIT %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, user_id, *kinds, limit])
+        # bm25() is negative, lower is better; expose a positive score.
+        return [row[:5] + (-row[5],) for row in cursor.fetchall()]
+
+
+def _postgres_search(user_id, terms, kinds, limit):
+    sql = (
+        "SELECT kind, object_id, slug, title, "
+        "ts_headline('english', title || ' ' || tags || ' ' || body, query, "
+        "'StartSel=\"\", StopSel=\"\", MaxWords=24, MinWords=8'), "
+        'ts_rank_cd(document, query) AS rank '
+        f"FROM {TABLE}, websearch_to_tsquery('english', %s) query "
+        'WHERE document @@ query AND user_id = %s AND kind = ANY(%s) '
+        'ORDER BY rank DESC LIMIT %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [' '.join(terms), user_id, list(kinds), limit])
+        return cursor.fetchall()
+
+
+def search(user_id, query, kinds, limit=20):
+    """Ranked matches for `query` among one user's documents of the given kinds."""
+    terms = _terms(query)
+    if not terms or not kinds or not is_supported():
+        return []
+    run = _sqlite_search if connection.vendor == 'sqlite' else _postgres_search
+    return [
+        {
+            'kind': kind,
+            'id': object_id,
+            'slug': slug or None,
+            'title': title,
+            'snippet': snippet,
+            'score': round(float(score), 4),
+        }
+        for kind, object_id, slug, title, snippet, score in run(user_id, terms, kinds, limit)
+    ]
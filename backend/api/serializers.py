@@ -1,5 +1,10 @@
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from django.conf import settings
 from django.urls import reverse
+
+from .assets import image_srcset
+from .fieldsets import SparseFieldsetMixin
 from .models import (
     Profile,
     SkillCategory,
@@ -12,12 +17,36 @@ from .models import (
     Certification,
     Message,
     BlogPost,
+    Tag,
     Testimonial,
 )
 
 DASHBOARD_SECTION_IDS = ['portfolio_metrics', 'quick_actions', 'needs_attention']
 
 
+class SrcsetField(serializers.ReadOnlyField):
+    """
+    srcset of resized Cloudinary variants of the image URL in `source` ('' for
+    other hosts). Left out of the output while settings.RESPONSIVE_IMAGES is off
+    or the field's ladder in settings.RESPONSIVE_IMAGE_WIDTHS is empty.
+    """
+
+    def __init__(self, ladder, **kwargs):
+        self.ladder = ladder
+        super().__init__(**kwargs)
+
+    def is_enabled(self):
+        return settings.RESPONSIVE_IMAGES and bool(settings.RESPONSIVE_IMAGE_WIDTHS.get(self.ladder))
+
+    def get_attribute(self, instance):
+        if not self.is_enabled():
+            raise SkipField()
+        return super().get_attribute(instance)
+
+    def to_representation(self, value):
+        return image_srcset(value, self.ladder)
+
+
 # ─── Skill Serializers ──────────────────────────────────────────────────────
 
 class SkillSerializer(serializers.ModelSerializer):
@@ -31,7 +60,7 @@ class SkillSerializer(serializers.ModelSerializer):
         }
 
 
-class SkillCategorySerializer(serializers.ModelSerializer):
+class SkillCategorySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     skills = SkillSerializer(many=True, read_only=True)
 
     class Meta:
@@ -46,6 +75,7 @@ class SkillCategorySerializer(serializers.ModelSerializer):
 
 class ProfileSerializer(serializers.ModelSerializer):
     resume_download_url = serializers.SerializerMethodField(read_only=True)
+    avatar_srcset = SrcsetField('avatar', source='avatar')
 
     def validate_dashboard_section_order(self, value):
         if value in (None, []):
@@ -72,7 +102,8 @@ class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Profile
         fields = [
-            'id', 'username_slug', 'full_name', 'tagline', 'bio', 'avatar', 'resume', 'resume_download_url',
+            'id', 'username_slug', 'full_name', 'tagline', 'bio', 'avatar', 'avatar_srcset',
+            'resume', 'resume_download_url',
             'github_url', 'linkedin_url', 'twitter_url', 'email',
             'show_hero', 'show_about', 'show_highlights', 'show_skills',
             'show_projects', 'show_experience', 'show_education', 'show_activities',
@@ -91,35 +122,38 @@ class ProfileSerializer(serializers.ModelSerializer):
 
 # ─── Project Serializers ───────────────────────────────────────────────────
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight serializer for project cards (list view)."""
     tech_stack = SkillSerializer(many=True, read_only=True)
+    thumbnail_srcset = SrcsetField('thumbnail', source='thumbnail')
 
     class Meta:
         model = Project
         fields = [
-            'id', 'title', 'slug', 'thumbnail', 'short_description',
+            'id', 'title', 'slug', 'thumbnail', 'thumbnail_srcset', 'short_description',
             'tech_stack', 'category', 'is_featured', 'date_built'
         ]
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Full serializer for single project view."""
     tech_stack = SkillSerializer(many=True, read_only=True)
+    thumbnail_srcset = SrcsetField('thumbnail', source='thumbnail')
 
     class Meta:
         model = Project
         fields = [
-            'id', 'title', 'slug', 'thumbnail', 'description',
-            'short_description', 'tech_stack', 'category',
+            'id', 'title', 'slug', 'thumbnail', 'thumbnail_srcset', 'description', 'description_html', 'toc',
+            'word_count', 'short_description', 'tech_stack', 'category',
             'live_url', 'repo_url', 'is_featured', 'is_visible',
             'date_built', 'created_at', 'updated_at'
         ]
+        read_only_fields = ['description_html', 'toc', 'word_count']
 
 
 # ─── Experience Serializer ──────────────────────────────────────────────────
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     duration = serializers.SerializerMethodField()
 
     class Meta:
@@ -129,6 +163,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
             'start_date', 'end_date', 'is_current',
             'highlights', 'duration', 'order'
         ]
+        field_dependencies = {'duration': ['start_date', 'end_date', 'is_current']}
 
     def get_duration(self, obj):
         """Compute human-readable duration string."""
@@ -139,7 +174,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
 
 # ─── Message Serializer ─────────────────────────────────────────────────────
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     duration = serializers.SerializerMethodField()
 
     class Meta:
@@ -149,6 +184,7 @@ class EducationSerializer(serializers.ModelSerializer):
             'start_date', 'end_date', 'is_current', 'grade',
             'description', 'duration', 'order'
         ]
+        field_dependencies = {'duration': ['start_date', 'end_date', 'is_current']}
 
     def get_duration(self, obj):
         if not obj.start_date and not obj.end_date and not obj.is_current:
@@ -158,7 +194,7 @@ class EducationSerializer(serializers.ModelSerializer):
         return f"{start} â€” {end}"
 
 
-class ActivitySerializer(serializers.ModelSerializer):
+class ActivitySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     duration = serializers.SerializerMethodField()
 
     class Meta:
@@ -168,6 +204,7 @@ class ActivitySerializer(serializers.ModelSerializer):
             'start_date', 'end_date', 'is_current',
             'highlights', 'description', 'duration', 'order'
         ]
+        field_dependencies = {'duration': ['start_date', 'end_date', 'is_current']}
 
     def get_duration(self, obj):
         if not obj.start_date and not obj.end_date and not obj.is_current:
@@ -177,7 +214,7 @@ class ActivitySerializer(serializers.ModelSerializer):
         return f"{start} â€” {end}"
 
 
-class AchievementSerializer(serializers.ModelSerializer):
+class AchievementSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Achievement
         fields = [
@@ -186,7 +223,7 @@ class AchievementSerializer(serializers.ModelSerializer):
         ]
 
 
-class CertificationSerializer(serializers.ModelSerializer):
+class CertificationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     validity = serializers.SerializerMethodField()
 
     class Meta:
@@ -195,6 +232,7 @@ class CertificationSerializer(serializers.ModelSerializer):
             'id', 'name', 'issuer', 'issue_date', 'expiry_date',
             'credential_id', 'credential_url', 'skills', 'validity', 'order'
         ]
+        field_dependencies = {'validity': ['issue_date', 'expiry_date']}
 
     def get_validity(self, obj):
         if not obj.issue_date and not obj.expiry_date:
@@ -229,40 +267,77 @@ class MessageListSerializer(serializers.ModelSerializer):
         fields = ['id', 'sender_name', 'sender_email', 'subject', 'content', 'is_read', 'created_at']
 
 
+class MessageFilterSerializer(serializers.Serializer):
+    """Inbox criteria (list filters, bulk operation targets); every given criterion must match."""
+    is_read = serializers.BooleanField(required=False)
+    sender_email = serializers.EmailField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    created_after = serializers.DateTimeField(required=False)
+
+
+class MessageBulkSerializer(serializers.Serializer):
+    """Bulk inbox operation: an action applied to the messages picked by `ids` or `filter`."""
+    ACTIONS = ['mark_read', 'mark_unread', 'delete']
+
+    action = serializers.ChoiceField(choices=ACTIONS)
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False, max_length=1000)
+    filter = MessageFilterSerializer(required=False)
+
+    def validate(self, data):
+        if ('ids' in data) == ('filter' in data):
+            raise serializers.ValidationError("Give either ids or filter.")
+        if 'filter' in data and not data['filter']:
+            raise serializers.ValidationError({'filter': "Give at least one criterion."})
+        return data
+
+
 # ─── Blog Post Serializers ──────────────────────────────────────────────────
 
-class BlogPostListSerializer(serializers.ModelSerializer):
+class BlogPostListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight serializer for blog post cards."""
-    
+    thumbnail_srcset = SrcsetField('thumbnail', source='thumbnail')
+
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'excerpt', 'thumbnail', 'tags',
+            'id', 'title', 'slug', 'excerpt', 'thumbnail', 'thumbnail_srcset', 'tags',
             'read_time', 'is_published', 'is_featured', 'published_at'
         ]
 
 
-class BlogPostDetailSerializer(serializers.ModelSerializer):
+class BlogPostDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Full serializer for single blog post view."""
-    
+    thumbnail_srcset = SrcsetField('thumbnail', source='thumbnail')
+
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'excerpt', 'content', 'thumbnail',
-            'tags', 'read_time', 'is_published', 'is_featured',
+            'id', 'title', 'slug', 'excerpt', 'content', 'content_html', 'toc', 'thumbnail', 'thumbnail_srcset',
+            'tags', 'word_count', 'read_time', 'is_published', 'is_featured',
             'published_at', 'created_at', 'updated_at'
         ]
+        read_only_fields = ['content_html', 'toc', 'word_count', 'read_time']
+
+
+class TagSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Blog tag facet with its count of published posts."""
+    count = serializers.IntegerField(source='published_count', read_only=True)
+
+    class Meta:
+        model = Tag
+        fields = ['name', 'slug', 'count']
 
 
 # ─── Testimonial Serializer ─────────────────────────────────────────────────
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class TestimonialSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for testimonials."""
-    
+    client_avatar_srcset = SrcsetField('avatar', source='client_avatar')
+
     class Meta:
         model = Testimonial
         fields = [
             'id', 'client_name', 'client_role', 'client_company',
-            'client_avatar', 'content', 'rating', 'project_name',
+            'client_avatar', 'client_avatar_srcset', 'content', 'rating', 'project_name',
             'is_featured', 'order'
         ]
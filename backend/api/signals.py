@@ -0,0 +1,133 @@
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from . import assets, counters, related, search, tags
+from .models import BlogPost, Certification, Experience, Profile, Project
+from .resolvers import username_resolver
+from .snapshots import SECTION_DEPENDENCIES, schedule_refresh
+
+
+# Index receivers are connected before the snapshot ones: outside a transaction the
+# snapshot rebuild runs immediately, and inside one on_commit callbacks run in
+# registration order, so the rebuild always sees the updated indexes.
+
+# ─── Search Index ──────────────────────────────────────────────────────────
+
+def _index_search_document(sender, instance, **kwargs):
+    search.index_object(search.KIND_BY_MODEL[sender.__name__], instance)
+
+
+def _remove_search_document(sender, instance, **kwargs):
+    search.remove_object(search.KIND_BY_MODEL[sender.__name__], instance.pk)
+
+
+for model in (Project, BlogPost, Experience, Certification):
+    post_save.connect(_index_search_document, sender=model, dispatch_uid=f'search-save-{model.__name__}')
+    post_delete.connect(_remove_search_document, sender=model, dispatch_uid=f'search-delete-{model.__name__}')
+
+
+# ─── Blog Tag Index ────────────────────────────────────────────────────────
+
+def _sync_post_tags(sender, instance, **kwargs):
+    tags.sync_post_tags(instance)
+
+
+def _forget_post_tags(sender, instance, **kwargs):
+    tags.forget_post_tags(instance)
+
+
+post_save.connect(_sync_post_tags, sender=BlogPost, dispatch_uid='tags-post-save')
+post_delete.connect(_forget_post_tags, sender=BlogPost, dispatch_uid='tags-post-delete')
+
+
+# ─── Related Content ───────────────────────────────────────────────────────
+
+def _refresh_related(sender, instance, **kwargs):
+    related.schedule_related_refresh(instance.user_id, related.KIND_BY_MODEL[sender.__name__])
+
+
+def _refresh_related_tech_stack(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        related.schedule_related_refresh(instance.user_id, 'project')
+
+
+for model in (Project, BlogPost):
+    post_save.connect(_refresh_related, sender=model, dispatch_uid=f'related-save-{model.__name__}')
+    post_delete.connect(_refresh_related, sender=model, dispatch_uid=f'related-delete-{model.__name__}')
+
+m2m_changed.connect(
+    _refresh_related_tech_stack,
+    sender=Project.tech_stack.through,
+    dispatch_uid='related-project-tech-stack',
+)
+
+
+# ─── Portfolio Snapshots ───────────────────────────────────────────────────
+
+def _refresh_snapshot_sections(sender, instance, **kwargs):
+    schedule_refresh(instance.user_id, SECTION_DEPENDENCIES[sender])
+
+
+def _refresh_project_tech_stack(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        schedule_refresh(instance.user_id, SECTION_DEPENDENCIES[Project])
+
+
+for model in SECTION_DEPENDENCIES:
+    post_save.connect(_refresh_snapshot_sections, sender=model, dispatch_uid=f'snapshot-save-{model.__name__}')
+    post_delete.connect(_refresh_snapshot_sections, sender=model, dispatch_uid=f'snapshot-delete-{model.__name__}')
+
+m2m_changed.connect(
+    _refresh_project_tech_stack,
+    sender=Project.tech_stack.through,
+    dispatch_uid='snapshot-project-tech-stack',
+)
+
+
+# ─── Username Resolution ───────────────────────────────────────────────────
+
+def _invalidate_profile_resolution(sender, instance, **kwargs):
+    username_resolver.invalidate_user(instance.user_id)
+
+
+def _invalidate_user_resolution(sender, instance, **kwargs):
+    username_resolver.invalidate_user(instance.pk)
+
+
+post_save.connect(_invalidate_profile_resolution, sender=Profile, dispatch_uid='resolver-profile-save')
+post_delete.connect(_invalidate_profile_resolution, sender=Profile, dispatch_uid='resolver-profile-delete')
+post_delete.connect(_invalidate_user_resolution, sender=User, dispatch_uid='resolver-user-delete')
+
+
+# ─── Resume Links ──────────────────────────────────────────────────────────
+
+def _forget_changed_resume_link(sender, instance, **kwargs):
+    assets.forget_resume_link(instance.pk, instance.resume or '')
+
+
+def _forget_resume_link(sender, instance, **kwargs):
+    assets.forget_resume_link(instance.pk)
+
+
+post_save.connect(_forget_changed_resume_link, sender=Profile, dispatch_uid='resume-link-profile-save')
+post_delete.connect(_forget_resume_link, sender=Profile, dispatch_uid='resume-link-profile-delete')
+
+
+# ─── Dashboard Counters ────────────────────────────────────────────────────
+
+def _count_saved_row(sender, instance, created, **kwargs):
+    owner_field, _ = counters.COUNTERS[sender.__name__]
+    rows = {'created': [instance]} if created else {'updated': [instance]}
+    counters.record_saves(sender.__name__, getattr(instance, f'{owner_field}_id'), **rows)
+
+
+def _uncount_deleted_row(sender, instance, **kwargs):
+    owner_field, _ = counters.COUNTERS[sender.__name__]
+    counters.record_delete(sender.__name__, getattr(instance, f'{owner_field}_id'), instance)
+
+
+for model_name in counters.COUNTERS:
+    model = apps.get_model('api', model_name)
+    post_save.connect(_count_saved_row, sender=model, dispatch_uid=f'counters-save-{model_name}')
+    post_delete.connect(_uncount_deleted_row, sender=model, dispatch_uid=f'counters-delete-{model_name}')
@@ -0,0 +1,231 @@
+"""
+Materialized public portfolio snapshots.
+
+Each user's public payload is pre-serialized, section by section, into a
+single PortfolioSnapshot row. Writes rebuild only the sections they touch
+(wired up in api/signals.py) and the public views read the stored JSON
+instead of querying the section tables.
+"""
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
+
+from .cache import publish_validators
+from .fastpath import compile_serializer
+from .feeds import build_feed, build_sitemap
+from .related import related_map
+from .models import (
+    Profile,
+    SkillCategory,
+    Skill,
+    Project,
+    Experience,
+    Education,
+    Activity,
+    Achievement,
+    Certification,
+    BlogPost,
+    Tag,
+    Testimonial,
+    PortfolioSnapshot,
+)
+from .serializers import (
+    ProfileSerializer,
+    SkillCategorySerializer,
+    ProjectListSerializer,
+    ProjectDetailSerializer,
+    ExperienceSerializer,
+    EducationSerializer,
+    ActivitySerializer,
+    AchievementSerializer,
+    CertificationSerializer,
+    BlogPostListSerializer,
+    BlogPostDetailSerializer,
+    TagSerializer,
+    TestimonialSerializer,
+)
+
+
+# ─── Public Section Querysets ──────────────────────────────────────────────
+
+def public_skills_queryset(user):
+    return SkillCategory.objects.filter(user=user).prefetch_related('skills')
+
+
+def public_projects_queryset(user):
+    return Project.objects.filter(user=user, is_visible=True).prefetch_related(
+        Prefetch('tech_stack', queryset=Skill.objects.select_related('category')),
+    )
+
+
+def public_experience_queryset(user):
+    return Experience.objects.filter(user=user)
+
+
+def public_education_queryset(user):
+    return Education.objects.filter(user=user)
+
+
+def public_activities_queryset(user):
+    return Activity.objects.filter(user=user)
+
+
+def public_achievements_queryset(user):
+    return Achievement.objects.filter(user=user)
+
+
+def public_certifications_queryset(user):
+    return Certification.objects.filter(user=user)
+
+
+def public_blog_queryset(user):
+    return BlogPost.objects.filter(user=user, is_published=True)
+
+
+def public_blog_tags_queryset(user):
+    return Tag.objects.filter(user=user, published_count__gt=0)
+
+
+def public_testimonials_queryset(user):
+    return Testimonial.objects.filter(user=user)
+
+
+# (response key, Profile visibility flag, queryset builder, serializer)
+PORTFOLIO_SECTIONS = [
+    ('skills', 'show_skills', public_skills_queryset, SkillCategorySerializer),
+    ('projects', 'show_projects', public_projects_queryset, ProjectListSerializer),
+    ('experience', 'show_experience', public_experience_queryset, ExperienceSerializer),
+    ('education', 'show_education', public_education_queryset, EducationSerializer),
+    ('activities', 'show_activities', public_activities_queryset, ActivitySerializer),
+    ('achievements', 'show_achievements', public_achievements_queryset, AchievementSerializer),
+    ('certifications', 'show_certifications', public_certifications_queryset, CertificationSerializer),
+    ('blog', 'show_blog', public_blog_queryset, BlogPostListSerializer),
+    ('testimonials', 'show_testimonials', public_testimonials_queryset, TestimonialSerializer),
+]
+
+
+# ─── Section Builders ──────────────────────────────────────────────────────
+
+def _build_profile(user):
+    profile = Profile.objects.filter(user=user).first()
+    return ProfileSerializer(profile).data if profile else None
+
+
+def _with_related(rows, related, summary_fields):
+    """Key detail rows by slug, embedding short summaries of their precomputed related items."""
+    rows_by_id = {row['id']: row for row in rows}
+    details = {}
+    for row in rows:
+        details[row['slug']] = {
+            **row,
+            'related': [
+                {field: rows_by_id[target_id][field] for field in summary_fields if field in row}
+                for target_id in related.get(row['id'], [])
+                if target_id in rows_by_id
+            ],
+        }
+    return details
+
+
+def _build_project_details(user):
+    rows = ProjectDetailSerializer(public_projects_queryset(user), many=True).data
+    return _with_related(
+        rows, related_map(user.pk, 'project'),
+        ['id', 'slug', 'title', 'thumbnail', 'thumbnail_srcset', 'short_description'],
+    )
+
+
+def _build_blog_details(user):
+    rows = BlogPostDetailSerializer(public_blog_queryset(user), many=True).data
+    return _with_related(
+        rows, related_map(user.pk, 'blog'),
+        ['id', 'slug', 'title', 'thumbnail', 'thumbnail_srcset', 'excerpt', 'read_time'],
+    )
+
+
+def _build_blog_tags(user):
+    return TagSerializer(public_blog_tags_queryset(user), many=True).data
+
+
+def _list_builder(build_queryset, serializer_class):
+    compiled = compile_serializer(serializer_class)
+
+    def build(user):
+        return compiled.serialize(build_queryset(user))
+    return build
+
+
+SECTION_BUILDERS = {
+    'profile': _build_profile,
+    **{
+        key: _list_builder(build_queryset, serializer_class)
+        for key, _, build_queryset, serializer_class in PORTFOLIO_SECTIONS
+    },
+    'project_details': _build_project_details,
+    'blog_details': _build_blog_details,
+    'blog_tags': _build_blog_tags,
+    'feed': build_feed,
+    'sitemap': build_sitemap,
+}
+
+# Which snapshot sections a write to each model invalidates.
+SECTION_DEPENDENCIES = {
+    Profile: ['profile', 'feed', 'sitemap'],
+    SkillCategory: ['skills', 'projects', 'project_details'],
+    Skill: ['skills', 'projects', 'project_details'],
+    Project: ['projects', 'project_details', 'sitemap'],
+    Experience: ['experience'],
+    Education: ['education'],
+    Activity: ['activities'],
+    Achievement: ['achievements'],
+    Certification: ['certifications'],
+    BlogPost: ['blog', 'blog_details', 'blog_tags', 'feed', 'sitemap'],
+    Testimonial: ['testimonials'],
+}
+
+
+# ─── Snapshot Store ────────────────────────────────────────────────────────
+
+def refresh_snapshot(user_id, sections=None):
+    """Rebuild the given sections (or every section) of a user's snapshot."""
+    user = User.objects.filter(pk=user_id).first()
+    if user is None:
+        return None
+
+    with transaction.atomic():
+        snapshot, created = PortfolioSnapshot.objects.select_for_update().get_or_create(user=user)
+        keys = SECTION_BUILDERS.keys() if created or sections is None else sections
+        for key in keys:
+            snapshot.sections[key] = SECTION_BUILDERS[key](user)
+        snapshot.version += 1
+        snapshot.save()
+    publish_validators(user_id, snapshot.version, snapshot.updated_at)
+    return snapshot
+
+
+def schedule_refresh(user_id, sections):
+    """Rebuild the given sections once the surrounding transaction commits."""
+    sections = list(sections)
+    transaction.on_commit(lambda: refresh_snapshot(user_id, sections))
+
+
+def get_snapshot(user_id):
+    """Return the user's snapshot, building it (or any missing section) on demand."""
+    snapshot = PortfolioSnapshot.objects.filter(user_id=user_id).first()
+    if snapshot is None:
+        return refresh_snapshot(user_id)
+    missing = [key for key in SECTION_BUILDERS if key not in snapshot.sections]
+    if missing:
+        snapshot = refresh_snapshot(user_id, missing)
+    return snapshot
+
+
+def visible_sections(snapshot):
+    """Section lists the owner has left visible (Profile.show_*), keyed like the bundle."""
+    profile = snapshot.sections['profile'] or {}
+    return {
+        key: snapshot.sections[key]
+        for key, visibility_flag, _, _ in PORTFOLIO_SECTIONS
+        if profile.get(visibility_flag, True)
+    }
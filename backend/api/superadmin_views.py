@@ -153,7 +153,7 @@ class ImpersonateUserView(APIView):
 
     def post(self, request, user_id):
         try:
-            user = User.objects.get(id=user_id)
+            user = User.objects.select_related('profile').get(id=user_id)
         except User.DoesNotExist:
             return Response({'detail': 'User not found.'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -0,0 +1,72 @@
+"""
+Normalized index of BlogPost.tags.
+
+Every post's JSON tag list is mirrored into Tag / PostTag rows on save (wired up in
+api/signals.py), so filtering by tag is an indexed join and the tag facet reads
+Tag.published_count instead of scanning posts. Tags are matched by slug, so
+"React", "react" and "REACT" are one tag; the first spelling seen is kept as its name.
+"""
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.text import slugify
+
+
+def tag_slugs(tags):
+    """Slug -> display name for a BlogPost.tags list, skipping tags with an empty slug."""
+    slugs = {}
+    for name in tags or []:
+        name = str(name).strip()[:50]
+        slug = slugify(name)[:50]
+        if slug and slug not in slugs:
+            slugs[slug] = name
+    return slugs
+
+
+def recount_tags(tag_ids, get_model=apps.get_model):
+    """Refresh published_count for the given tags and drop tags no post uses any more."""
+    Tag = get_model('api', 'Tag')
+    PostTag = get_model('api', 'PostTag')
+    published = (
+        PostTag.objects.filter(tag=OuterRef('pk'), post__is_published=True)
+        .values('tag').annotate(count=Count('pk')).values('count')
+    )
+    tags = Tag.objects.filter(pk__in=tag_ids)
+    tags.update(published_count=Coalesce(Subquery(published, output_field=IntegerField()), Value(0)))
+    tags.filter(post_tags__isnull=True).delete()
+
+
+def sync_post_tags(post, get_model=apps.get_model):
+    """Mirror one post's tag list into PostTag rows and recount every tag it gained or lost."""
+    Tag = get_model('api', 'Tag')
+    PostTag = get_model('api', 'PostTag')
+    wanted = tag_slugs(post.tags)
+
+    with transaction.atomic():
+        Tag.objects.bulk_create(
+            [Tag(user_id=post.user_id, slug=slug, name=name) for slug, name in wanted.items()],
+            ignore_conflicts=True,
+        )
+        wanted_ids = set(
+            Tag.objects.filter(user_id=post.user_id, slug__in=wanted).values_list('pk', flat=True)
+        )
+        current_ids = set(PostTag.objects.filter(post=post).values_list('tag_id', flat=True))
+        PostTag.objects.filter(post=post, tag_id__in=current_ids - wanted_ids).delete()
+        PostTag.objects.bulk_create([PostTag(post=post, tag_id=tag_id) for tag_id in wanted_ids - current_ids])
+        recount_tags(wanted_ids | current_ids, get_model)
+
+
+def forget_post_tags(post, get_model=apps.get_model):
+    """Recount a deleted post's tags (its PostTag rows are already gone by cascade)."""
+    Tag = get_model('api', 'Tag')
+    tag_ids = Tag.objects.filter(user_id=post.user_id, slug__in=tag_slugs(post.tags)).values_list('pk', flat=True)
+    recount_tags(list(tag_ids), get_model)
+
+
+def post_ids_with_tag(user_id, tag):
+    """Ids of a user's posts carrying `tag` (matched by slug), via the PostTag index."""
+    PostTag = apps.get_model('api', 'PostTag')
+    return set(
+        PostTag.objects.filter(tag__user_id=user_id, tag__slug=slugify(tag)).values_list('post_id', flat=True)
+    )
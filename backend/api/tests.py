@@ -1,3 +1,1595 @@
-from django.test import TestCase
+"""
+Query and wall-time budgets for every route in api/urls.py.
 
-# Create your tests here.
+The suite seeds a realistic tenant with `seed_portfolio` (plus an inbox and a
+second user), then calls each route once with the public response cache and the
+username resolver cold, so every snapshot-served endpoint does its full lookup.
+A request that issues more queries than its budget fails with the offending SQL
+listed; a route added to api/urls.py without a budget fails test_every_route_has_a_budget.
+Each route also declares a wall-time budget in milliseconds, sized for a
+developer laptop; a request slower than ms * ROUTE_BUDGET_SLACK (default 3,
+for CI noise) fails. Raise the slack on a slow runner rather than the budgets.
+"""
+import datetime
+import decimal
+import gc
+import gzip
+import importlib
+import itertools
+import json
+import os
+import tempfile
+import uuid
+import time
+import xml.etree.ElementTree as ElementTree
+from io import StringIO
+from collections import namedtuple
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock, skipUnless
+
+import fakeredis
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import assets, counters, feeds, related, search, urls
+from .compression import brotli, compress_variants
+from .fastpath import compile_serializer
+from .management.commands.explain_queries import is_full_scan
+from .models import (
+    Achievement,
+    Activity,
+    BlogPost,
+    Certification,
+    DashboardCounters,
+    Education,
+    Experience,
+    Message,
+    PortfolioSnapshot,
+    Profile,
+    Project,
+    RelatedItem,
+    Skill,
+    SkillCategory,
+    Tag,
+    Testimonial,
+)
+from .ordering import ORDER_GAP
+from .renderers import ORJSONRenderer
+from .rendering import RENDERER_VERSION, render_markdown
+from .resolvers import UsernameResolver, resolve_username, username_resolver
+from .snapshots import PORTFOLIO_SECTIONS, SECTION_BUILDERS, get_snapshot, refresh_snapshot
+
+USERNAME = 'sait27'
+ROUTE_BUDGET_SLACK = float(os.environ.get('ROUTE_BUDGET_SLACK', 3))
+
+# name: URL name; kwargs/data: values or callables taking the test case; auth: None, 'owner' or 'admin'.
+Route = namedtuple('Route', ['name', 'method', 'kwargs', 'data', 'auth', 'queries', 'ms'])
+
+
+def _route(name, ms, method='get', kwargs=None, data=None, auth=None, queries=0):
+    return Route(name, method, kwargs or (lambda case: {}), data, auth, queries, ms)
+
+
+def _public(name, queries, ms):
+    return _route(name, ms, kwargs=lambda case: {'username': USERNAME}, queries=queries)
+
+
+def _public_detail(name, model, queries, ms):
+    return _route(
+        name,
+        ms,
+        kwargs=lambda case: {'username': USERNAME, 'slug': model.objects.filter(user=case.owner).first().slug},
+        queries=queries,
+    )
+
+
+# Collection -> (case, n) -> a valid create payload; n keeps unique names and slugs unique.
+BULK_CREATES = {
+    'projects': lambda case, n: {'title': f'Bulk project {n}', 'description': '## Notes\n\nImported.'},
+    'skills': lambda case, n: {
+        'name': f'Skill {n}', 'category': SkillCategory.objects.filter(user=case.owner).first().pk,
+    },
+    'categories': lambda case, n: {'name': f'Category {n}'},
+    'experience': lambda case, n: {'role': 'Engineer', 'company': f'Company {n}', 'start_date': '2020-01-01'},
+    'education': lambda case, n: {'institution': f'University {n}', 'degree': 'BSc'},
+    'activities': lambda case, n: {'title': f'Activity {n}'},
+    'achievements': lambda case, n: {'title': f'Achievement {n}'},
+    'certifications': lambda case, n: {'name': f'Certification {n}'},
+    'blog': lambda case, n: {'title': f'Bulk post {n}', 'excerpt': 'Imported', 'content': 'Imported post.',
+                             'tags': ['Import'], 'is_published': True},
+    'testimonials': lambda case, n: {
+        'client_name': f'Client {n}', 'client_role': 'CTO', 'client_company': 'Acme', 'content': 'Great work.',
+    },
+}
+_bulk_sequence = itertools.count()
+
+
+def _bulk_operations(list_name, model, owner_field):
+    """Two creates and one update of an existing row."""
+    def operations(case):
+        create = BULK_CREATES[list_name]
+        existing = model.objects.filter(**{owner_field: case.owner}).first()
+        return [
+            {'op': 'create', 'data': create(case, next(_bulk_sequence))},
+            {'op': 'create', 'data': create(case, next(_bulk_sequence))},
+            {'op': 'update', 'id': existing.pk, 'data': {}},
+        ]
+    return operations
+
+
+def _move_last_to_front(model):
+    def data(case):
+        ids = list(model.objects.filter(user=case.owner).values_list('pk', flat=True))
+        return {'ids': ids[-1:] + ids[:-1]}
+    return data
+
+
+def _dashboard(prefix, names, model, listing, detail, owner_field='user', bulk=None, reorder=None):
+    """Routes of one dashboard collection; listing, detail, bulk and reorder are (queries, ms) budgets."""
+    list_name, detail_name = names.split('/')
+    bulk_routes = [] if bulk is None else [_route(
+        f'{prefix}-{list_name}-bulk', bulk[1], method='post', auth='owner', queries=bulk[0],
+        data=_bulk_operations(list_name, model, owner_field),
+    )]
+    reorder_routes = [] if reorder is None else [_route(
+        f'{prefix}-{list_name}-reorder', reorder[1], method='post', auth='owner', queries=reorder[0],
+        data=_move_last_to_front(model),
+    )]
+    return [
+        *bulk_routes,
+        *reorder_routes,
+        _route(f'{prefix}-{list_name}', listing[1], auth='owner', queries=listing[0]),
+        _route(
+            f'{prefix}-{detail_name}-detail',
+            detail[1],
+            kwargs=lambda case: {'pk': model.objects.filter(**{owner_field: case.owner}).first().pk},
+            auth='owner',
+            queries=detail[0],
+        ),
+    ]
+
+
+def _dashboard_routes(prefix):
+    return [
+        _route(f'{prefix}-stats', 15, auth='owner', queries=1),
+        _route(f'{prefix}-profile', 20, auth='owner', queries=1),
+        *_dashboard(prefix, 'projects/project', Project, (3, 30), (2, 20), bulk=(15, 80), reorder=(4, 20)),
+        *_dashboard(prefix, 'skills/skill', Skill, (1, 20), (1, 15), bulk=(10, 50), reorder=(4, 40)),
+        *_dashboard(prefix, 'categories/category', SkillCategory, (2, 25), (2, 20), bulk=(9, 50), reorder=(4, 20)),
+        *_dashboard(prefix, 'experience/experience', Experience, (1, 20), (1, 15), bulk=(14, 60), reorder=(4, 20)),
+        *_dashboard(prefix, 'education/education', Education, (1, 20), (1, 15), bulk=(8, 60), reorder=(4, 20)),
+        *_dashboard(prefix, 'activities/activity', Activity, (1, 20), (1, 15), bulk=(8, 60), reorder=(4, 20)),
+        *_dashboard(prefix, 'achievements/achievement', Achievement, (1, 20), (1, 15), bulk=(8, 60), reorder=(4, 20)),
+        *_dashboard(
+            prefix, 'certifications/certification', Certification, (1, 20), (1, 15), bulk=(14, 60), reorder=(4, 20),
+        ),
+        *_dashboard(prefix, 'messages/message', Message, (2, 25), (1, 15), owner_field='recipient'),
+        _route(f'{prefix}-messages-bulk', 25, method='post', auth='owner', queries=5,
+               data={'action': 'mark_read', 'filter': {'is_read': False}}),
+        *_dashboard(prefix, 'blog/blog', BlogPost, (2, 30), (1, 20), bulk=(36, 150)),
+        *_dashboard(prefix, 'testimonials/testimonial', Testimonial, (1, 20), (1, 15), bulk=(8, 60), reorder=(4, 20)),
+        _route(f'{prefix}-upload', 10, method='post', auth='owner', queries=0),
+    ]
+
+
+ROUTE_BUDGETS = [
+    # ── Auth ──
+    _route('auth-register', 200, method='post', queries=6, data={
+        'username': 'budgetuser', 'email': 'budget@example.com', 'full_name': 'Budget User',
+        'password': 'a-Strong-pass-123', 'password_confirm': 'a-Strong-pass-123',
+    }),
+    _route('token-obtain', 20, method='post', queries=1, data={'username': USERNAME, 'password': 'admin123'}),
+    _route('token-refresh', 15, method='post', queries=1,
+           data=lambda case: {'refresh': str(RefreshToken.for_user(case.owner))}),
+    _route('auth-me', 15, auth='owner', queries=1),
+    _route('auth-forgot-password', 15, method='post', queries=1, data={'email': 'nobody@example.com'}),
+    _route('auth-reset-password', 15, method='post', queries=0, data={
+        'uid': 'bm9wZQ', 'token': 'bad', 'new_password': 'a-Strong-pass-123', 'confirm_password': 'a-Strong-pass-123',
+    }),
+    _route('auth-change-password', 15, method='post', auth='owner', queries=1, data={
+        'old_password': 'admin123', 'new_password': 'a-Strong-pass-123',
+    }),
+
+    # ── Platform admin ──
+    _route('admin-stats', 20, auth='admin', queries=8),
+    _route('admin-users', 40, auth='admin', queries=2),
+    _route('admin-user-detail', 25, kwargs=lambda case: {'user_id': case.other.pk}, auth='admin', queries=1),
+    _route('admin-impersonate', 25, method='post', kwargs=lambda case: {'user_id': case.other.pk}, auth='admin',
+           queries=5),
+    _route('admin-stop-impersonation', 15, method='post', auth='admin', queries=1,
+           data=lambda case: {'original_admin_id': case.owner.pk}),
+
+    # ── Public portfolio (cold cache; snapshot already built) ──
+    _public('public-profile', 3, 40),
+    _public('public-bundle', 3, 150),
+    _public('public-resume', 2, 15),
+    _public('public-skills', 3, 50),
+    _public('public-projects', 3, 60),
+    _public_detail('public-project-detail', Project, 3, 40),
+    _public('public-experience', 3, 40),
+    _public('public-education', 3, 40),
+    _public('public-activities', 3, 40),
+    _public('public-achievements', 3, 40),
+    _public('public-certifications', 3, 40),
+    _route('public-contact', 30, method='post', kwargs=lambda case: {'username': USERNAME}, queries=3, data={
+        'sender_name': 'Visitor', 'sender_email': 'visitor@example.com', 'subject': 'Hi', 'content': 'Hello there',
+    }),
+    _public('public-blog', 3, 50),
+    _public('public-blog-tags', 3, 40),
+    _public_detail('public-blog-detail', BlogPost, 3, 40),
+    _public('public-testimonials', 3, 40),
+    _public('public-search', 4, 30),
+    _public('public-blog-feed', 3, 50),
+    _public('public-blog-atom', 3, 60),
+    _public('public-sitemap', 3, 40),
+    _route('platform-sitemap', 25, queries=2),
+
+    # ── Dashboard ──
+    *_dashboard_routes('user'),
+    *_dashboard_routes('dashboard'),
+]
+
+QUERY_STRINGS = {
+    'public-search': '?q=django',
+}
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class RouteBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+        Profile.objects.filter(user=cls.owner).update(
+            is_platform_admin=True, resume='https://example.com/resume.pdf',
+        )
+        cls.other = User.objects.create_user('other', 'other@example.com', 'pass')
+        Profile.objects.create(user=cls.other, username_slug='other', full_name='Other', email='other@example.com')
+        Message.objects.bulk_create([
+            Message(recipient=cls.owner, sender_name=f'Sender {i}', sender_email=f's{i}@example.com',
+                    subject=f'Subject {i}', content='Hello', is_read=i % 2 == 0)
+            for i in range(25)
+        ])
+        counters.get_counters(cls.owner.pk)
+
+    def setUp(self):
+        caches['default'].clear()
+        caches['public'].clear()
+        username_resolver.clear()
+        # Build the snapshot outside the measured requests; each route then starts cold.
+        self.client.get(reverse('public-bundle', kwargs={'username': USERNAME}))
+
+    def _call(self, route):
+        client = APIClient()
+        if route.auth:
+            client.force_authenticate(self.owner)
+        url = reverse(route.name, kwargs=route.kwargs(self)) + QUERY_STRINGS.get(route.name, '')
+        data = route.data(self) if callable(route.data) else route.data
+        # Collect garbage left by earlier tests up front, so a collector pause is not billed to this route.
+        gc.collect()
+        gc.disable()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = getattr(client, route.method)(url, data, format='json')
+                elapsed_ms = (time.perf_counter() - started) * 1000
+        finally:
+            gc.enable()
+        return response, queries.captured_queries, elapsed_ms
+
+    def test_every_route_has_a_budget(self):
+        routes = {pattern.name for pattern in urls.urlpatterns if pattern.name}
+        declared = {route.name for route in ROUTE_BUDGETS}
+        self.assertEqual(routes - declared, set(), 'Routes without a budget in ROUTE_BUDGETS')
+
+    def test_routes_stay_within_budget(self):
+        for route in ROUTE_BUDGETS:
+            with self.subTest(route=route.name):
+                caches['public'].clear()
+                username_resolver.clear()
+                response, queries, elapsed_ms = self._call(route)
+                self.assertLess(response.status_code, 500, f'{route.name} failed: {response.status_code}')
+                if len(queries) > route.queries:
+                    sql = '\n'.join(f'  {index}. {query["sql"]}' for index, query in enumerate(queries, 1))
+                    self.fail(f'{route.name}: {len(queries)} queries, budget {route.queries}:\n{sql}')
+                self.assertLessEqual(
+                    elapsed_ms, route.ms * ROUTE_BUDGET_SLACK,
+                    f'{route.name}: {elapsed_ms:.0f} ms, budget {route.ms} ms x {ROUTE_BUDGET_SLACK} slack',
+                )
+
+    def test_warm_public_routes_skip_the_database(self):
+        for route in ROUTE_BUDGETS:
+            if not route.name.startswith('public-') or route.method != 'get':
+                continue
+            with self.subTest(route=route.name):
+                self._call(route)
+                response, queries, _ = self._call(route)
+                self.assertIn(response.status_code, (200, 302))
+                self.assertEqual(
+                    queries, [], f'{route.name} hit the database on a warm cache:\n'
+                    + '\n'.join(query['sql'] for query in queries),
+                )
+
+
+class DashboardCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def test_missing_row_is_built_in_one_statement(self):
+        DashboardCounters.objects.filter(pk=self.owner.pk).delete()
+        with CaptureQueriesContext(connection) as queries:
+            stats = counters.get_counters(self.owner.pk)
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(stats, counters.compute_counters(self.owner.pk))
+        self.assertTrue(DashboardCounters.objects.filter(pk=self.owner.pk).exists())
+
+    def test_writes_keep_counters_current(self):
+        counters.get_counters(self.owner.pk)
+        project = Project.objects.filter(user=self.owner).first()
+        project.is_featured = not project.is_featured
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+            Message.objects.create(recipient=self.owner, sender_name='A', sender_email='a@example.com', content='Hi')
+            BlogPost.objects.filter(user=self.owner).first().delete()
+            Skill.objects.filter(user=self.owner).first().delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            stats = counters.get_counters(self.owner.pk)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(stats, counters.compute_counters(self.owner.pk))
+
+    def test_writes_apply_deltas_instead_of_recounting(self):
+        counters.get_counters(self.owner.pk)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            message = Message.objects.create(
+                recipient=self.owner, sender_name='A', sender_email='a@example.com', content='Hi',
+            )
+            message.is_read = True
+            message.save()
+            message.save()
+            Message.objects.get(pk=message.pk).delete()
+            skill = Skill.objects.filter(user=self.owner).first()
+            skill.name = 'Renamed'
+            skill.save()
+
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "api_dashboardcounters"')]
+        self.assertEqual(len(updates), 3)  # create, mark read, delete; no-op saves write nothing
+        self.assertFalse(any('COUNT(' in sql for sql in updates))
+        self.assertEqual(counters.get_counters(self.owner.pk), counters.compute_counters(self.owner.pk))
+
+    def test_rolled_back_writes_leave_counters_alone(self):
+        before = counters.get_counters(self.owner.pk)
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                project = Project.objects.filter(user=self.owner).first()
+                project.is_featured = not project.is_featured
+                project.save()
+                Message.objects.create(recipient=self.owner, sender_name='A', sender_email='a@example.com', content='x')
+                raise IntegrityError('rolled back')
+        self.assertEqual(counters.get_counters(self.owner.pk), before)
+
+    def test_reconcile_repairs_drift(self):
+        counters.get_counters(self.owner.pk)
+        Message.objects.create(recipient=self.owner, sender_name='A', sender_email='a@example.com', content='Hi')
+        Message.objects.filter(recipient=self.owner).update(is_read=True)  # bypasses signals
+
+        self.assertEqual(counters.reconcile_counters(), (0, 1))
+        self.assertEqual(counters.get_counters(self.owner.pk)['unread_messages'], 0)
+        self.assertEqual(counters.reconcile_counters(), (0, 0))
+
+
+class BulkMutationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('dashboard-certifications-bulk')
+
+    def test_applies_every_operation_in_one_request(self):
+        first, second = Certification.objects.filter(user=self.owner)[:2]
+        response = self.client.post(self.url, [
+            {'op': 'create', 'data': {'name': 'Imported'}},
+            {'op': 'update', 'id': first.pk, 'data': {'issuer': 'Bulk Issuer'}},
+            {'op': 'delete', 'id': second.pk},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['status'] for item in response.data['results']], [201, 200, 204])
+        self.assertEqual(response.data['results'][0]['data']['name'], 'Imported')
+        first.refresh_from_db()
+        self.assertEqual(first.issuer, 'Bulk Issuer')
+        self.assertFalse(Certification.objects.filter(pk=second.pk).exists())
+        self.assertEqual(counters.get_counters(self.owner.pk), counters.compute_counters(self.owner.pk))
+
+    def test_invalid_item_rejects_the_whole_batch(self):
+        before = Certification.objects.filter(user=self.owner).count()
+        other = User.objects.create_user('other', 'other@example.com', 'pass')
+        foreign = Certification.objects.create(user=other, name='Not yours')
+        response = self.client.post(self.url, [
+            {'op': 'create', 'data': {'name': 'Valid'}},
+            {'op': 'create', 'data': {}},
+            {'op': 'delete', 'id': foreign.pk},
+            {'op': 'rename', 'id': 1},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([item['status'] for item in response.data['results']], [424, 400, 404, 400])
+        self.assertIn('name', response.data['results'][1]['errors'])
+        self.assertEqual(Certification.objects.filter(user=self.owner).count(), before)
+        self.assertTrue(Certification.objects.filter(pk=foreign.pk).exists())
+
+    def test_blog_posts_are_rendered_and_indexed(self):
+        counters.get_counters(self.owner.pk)
+        published = BlogPost.objects.filter(user=self.owner, is_published=True).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('dashboard-blog-bulk'), [
+                {'op': 'create', 'data': {'title': 'Bulk Import', 'excerpt': 'x', 'content': '# Heading',
+                                          'tags': ['Bulk'], 'is_published': False}},
+                {'op': 'update', 'id': published.pk, 'data': {'is_published': False}},
+            ], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(counters.get_counters(self.owner.pk), counters.compute_counters(self.owner.pk))
+        post = BlogPost.objects.get(pk=response.data['results'][0]['id'])
+        self.assertEqual(post.slug, 'bulk-import')
+        self.assertIn('<h1', post.content_html)
+        self.assertTrue(post.post_tags.filter(tag__slug='bulk').exists())
+
+
+class ReorderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('dashboard-experience-reorder')
+        self.ids = list(Experience.objects.filter(user=self.owner).values_list('pk', flat=True))
+
+    def test_moving_one_item_rewrites_one_row(self):
+        self.client.post(self.url, {'ids': self.ids[::-1]}, format='json')
+        ids = self.ids[::-1]
+        ids.insert(0, ids.pop())
+
+        response = self.client.post(self.url, {'ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(list(Experience.objects.filter(user=self.owner).values_list('pk', flat=True)), ids)
+
+    def test_new_items_without_an_order_are_appended(self):
+        self.client.post(self.url, {'ids': self.ids[::-1]}, format='json')
+        created = self.client.post(reverse('dashboard-experience'), {
+            'role': 'Engineer', 'company': 'Appended', 'start_date': '2020-01-01',
+        }, format='json')
+        bulk = self.client.post(reverse('dashboard-experience-bulk'), [
+            {'op': 'create', 'data': {'role': 'Engineer', 'company': f'Bulk {n}', 'start_date': '2020-01-01'}}
+            for n in range(2)
+        ], format='json')
+
+        self.assertEqual(created.status_code, 201)
+        appended = [created.data['id'], *(item['id'] for item in bulk.data['results'])]
+        self.assertEqual(list(Experience.objects.filter(user=self.owner).values_list('pk', flat=True)),
+                         self.ids[::-1] + appended)
+        keys = list(Experience.objects.filter(user=self.owner).values_list('order', flat=True))
+        self.assertEqual(keys[-3:], [keys[-4] + ORDER_GAP * n for n in (1, 2, 3)])
+
+    def test_rejects_a_partial_ordering(self):
+        response = self.client.post(self.url, {'ids': self.ids[1:]}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class MessageBulkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pass')
+        cls.other = User.objects.create_user('other', 'other@example.com', 'pass')
+        for recipient in (cls.owner, cls.other):
+            Message.objects.bulk_create([
+                Message(recipient=recipient, sender_name='S', sender_email='s@example.com', content='Hi',
+                        is_read=i % 2 == 0)
+                for i in range(10)
+            ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('user-messages-bulk')
+        counters.get_counters(self.owner.pk)
+
+    def test_mark_read_by_filter_keeps_unread_counter_current(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'action': 'mark_read', 'filter': {'is_read': False}}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['affected'], 5)
+        self.assertEqual(response.data['unread_messages'], 0)
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE "api_message"')]), 1)
+        self.assertEqual(Message.objects.filter(recipient=self.other, is_read=False).count(), 5)
+
+    def test_delete_by_ids_is_scoped_to_the_inbox(self):
+        own = list(Message.objects.filter(recipient=self.owner, is_read=False).values_list('pk', flat=True)[:2])
+        foreign = Message.objects.filter(recipient=self.other).first().pk
+
+        response = self.client.post(self.url, {'action': 'delete', 'ids': [*own, foreign]}, format='json')
+
+        self.assertEqual(response.data['affected'], 2)
+        self.assertEqual(response.data['unread_messages'], 3)
+        self.assertTrue(Message.objects.filter(pk=foreign).exists())
+        self.assertEqual(counters.get_counters(self.owner.pk), counters.compute_counters(self.owner.pk))
+
+    def test_delete_by_filter_is_one_delete_and_one_recount(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {'action': 'delete', 'filter': {'is_read': True}}, format='json')
+
+        self.assertEqual(response.data['affected'], 5)
+        writes = [q['sql'].split(' ', 1)[0] for q in queries if q['sql'].startswith(('DELETE', 'UPDATE'))]
+        self.assertEqual(writes, ['DELETE', 'UPDATE'])
+        self.assertEqual(counters.get_counters(self.owner.pk), counters.compute_counters(self.owner.pk))
+
+    def test_requires_ids_or_a_filter(self):
+        for payload in ({'action': 'delete'}, {'action': 'delete', 'filter': {}}, {'action': 'archive', 'ids': [1]}):
+            with self.subTest(payload=payload):
+                self.assertEqual(self.client.post(self.url, payload, format='json').status_code, 400)
+
+
+class MessageInboxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pass')
+        Message.objects.bulk_create([
+            Message(recipient=cls.owner, sender_name='S', sender_email=f's{i % 3}@example.com', content='Hi',
+                    is_read=i % 2 == 0)
+            for i in range(45)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = reverse('user-messages')
+
+    def _walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [message['id'] for message in response.data['results']]
+            url = response.data['next']
+        return ids, response
+
+    def test_cursor_pages_cover_the_inbox_newest_first(self):
+        ids, response = self._walk(self.url)
+        expected = list(Message.objects.filter(recipient=self.owner).order_by('-created_at', '-id')
+                        .values_list('pk', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual((response.data['total'], response.data['unread']), (45, 22))
+        self.assertNotIn('count', response.data)
+
+    def test_filters_combine(self):
+        ids, _ = self._walk(self.url + '?is_read=false&sender_email=s1@example.com')
+        expected = set(Message.objects.filter(recipient=self.owner, is_read=False, sender_email='s1@example.com')
+                       .values_list('pk', flat=True))
+        self.assertEqual(set(ids), expected)
+
+    def test_invalid_filter_is_rejected(self):
+        self.assertEqual(self.client.get(self.url + '?created_after=yesterday').status_code, 400)
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+        self.slug = Project.objects.filter(user=self.owner).first().slug
+
+    def _detail(self, slug, **headers):
+        return self.client.get(
+            reverse('public-project-detail', kwargs={'username': USERNAME, 'slug': slug}), headers=headers,
+        )
+
+    def test_matching_validators_answer_304(self):
+        response = self._detail(self.slug)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        not_modified = self._detail(self.slug, if_none_match=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        self.assertEqual(self._detail(self.slug, if_modified_since=response['Last-Modified']).status_code, 304)
+
+    def test_missing_slug_is_404_even_with_a_current_etag(self):
+        etag = self._detail(self.slug)['ETag']
+        self.assertEqual(self._detail('no-such-project', if_none_match=etag).status_code, 404)
+        self.assertEqual(self._detail(self.slug, if_none_match=etag).status_code, 304)
+
+    def test_migrated_sections_are_rebuilt_under_a_new_etag(self):
+        etag = self._detail(self.slug)['ETag']
+        migration = importlib.import_module('api.migrations.0014_responsive_image_srcsets')
+        migration.drop_srcset_sections(apps, None)
+        # Migrations only bump the row; the new version is seen once the cached validators expire.
+        with mock.patch('time.time', return_value=time.time() + settings.PUBLIC_CACHE_VALIDATOR_TTL + 1):
+            response = self._detail(self.slug, if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('project_details', PortfolioSnapshot.objects.get(user=self.owner).sections)
+
+    def test_writes_change_the_etag(self):
+        etag = self._detail(self.slug)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.filter(slug=self.slug).first().save()
+        response = self._detail(self.slug, if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+def _worker_caches(public):
+    """CACHES for one simulated worker process, with `public` as its public response cache."""
+    return {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'public': {**public, 'TIMEOUT': 3600, 'KEY_PREFIX': 'public'},
+    }
+
+
+def _locmem_worker(name):
+    return override_settings(CACHES=_worker_caches({
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'worker-{name}',
+    }))
+
+
+class CrossProcessCacheTests(TestCase):
+    """A snapshot rebuilt in one process must reach the public responses served by another."""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+        cls.url = reverse('public-profile', kwargs={'username': USERNAME})
+
+    def setUp(self):
+        username_resolver.clear()
+        for name in ('a', 'b'):
+            with _locmem_worker(name):
+                caches['public'].clear()
+
+    def _rebuild(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_snapshot(self.owner.pk, ['profile'])
+
+    def test_locmem_workers_converge_within_the_validator_ttl(self):
+        with _locmem_worker('a'):
+            etag = self.client.get(self.url)['ETag']
+        with _locmem_worker('b'):
+            self._rebuild()
+            self.assertNotEqual(self.client.get(self.url)['ETag'], etag)
+
+        with _locmem_worker('a'):
+            self.assertEqual(self.client.get(self.url, headers={'if_none_match': etag}).status_code, 304)
+            later = time.time() + settings.PUBLIC_CACHE_VALIDATOR_TTL + 1
+            with mock.patch('time.time', return_value=later):
+                response = self.client.get(self.url, headers={'if_none_match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_redis_workers_see_each_others_writes_at_once(self):
+        server = fakeredis.FakeServer()
+        redis_worker = override_settings(
+            CACHES=_worker_caches({
+                'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+                'LOCATION': 'redis://127.0.0.1:6379/1',
+                'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': server},
+            }),
+            PUBLIC_CACHE_VALIDATOR_TTL=3600,
+        )
+        with redis_worker:
+            etag = self.client.get(self.url)['ETag']
+        with redis_worker:
+            self._rebuild()
+        with redis_worker:
+            response = self.client.get(self.url, headers={'if_none_match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class SparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _rows(self, response):
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return data['results'] if isinstance(data, dict) else data
+
+    def test_public_lists_keep_only_the_requested_fields(self):
+        url = reverse('public-projects', kwargs={'username': USERNAME})
+        for query in ('?fields=title,slug', '?pagination=cursor&fields=title,slug'):
+            with self.subTest(query=query):
+                rows = self._rows(self.client.get(url + query))
+                self.assertTrue(rows)
+                self.assertTrue(all(set(row) == {'title', 'slug'} for row in rows))
+
+    def test_omit_drops_fields_from_a_detail(self):
+        slug = Project.objects.filter(user=self.owner).first().slug
+        response = self.client.get(
+            reverse('public-project-detail', kwargs={'username': USERNAME, 'slug': slug}) + '?omit=description,toc',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['slug'], slug)
+        self.assertNotIn('description', response.json())
+        self.assertNotIn('toc', response.json())
+
+    def test_dashboard_views_ignore_the_parameters(self):
+        Message.objects.create(recipient=self.owner, sender_name='A', sender_email='a@example.com', content='Hi')
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        for name in ('dashboard-projects', 'dashboard-messages'):
+            with self.subTest(name=name):
+                rows = self._rows(client.get(reverse(name) + '?fields=id'))
+                self.assertGreater(len(rows[0]), 1)
+
+
+class PortfolioBundleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+        cls.url = reverse('public-bundle', kwargs={'username': USERNAME})
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def test_bundle_matches_the_section_endpoints(self):
+        bundle = self.client.get(self.url).json()
+        for section in ('profile', 'projects', 'experience', 'testimonials'):
+            with self.subTest(section=section):
+                served = self.client.get(reverse(f'public-{section}', kwargs={'username': USERNAME})).json()
+                if section != 'profile' and isinstance(served, dict):
+                    served = served['results']
+                self.assertEqual(bundle[section], served)
+
+    def test_hidden_sections_are_omitted(self):
+        profile = Profile.objects.get(user=self.owner)
+        profile.show_blog = False
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+
+        bundle = self.client.get(self.url).json()
+        self.assertNotIn('blog', bundle)
+        self.assertIn('projects', bundle)
+
+    def test_unknown_username_is_404(self):
+        self.assertEqual(self.client.get(reverse('public-bundle', kwargs={'username': 'nobody'})).status_code, 404)
+
+
+class PortfolioSnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+        self.snapshot = get_snapshot(self.owner.pk)
+
+    def test_a_write_rebuilds_only_its_sections(self):
+        experience = Experience.objects.filter(user=self.owner).first()
+        experience.role = 'Principal Engineer'
+        projects = self.snapshot.sections['projects']
+        with self.captureOnCommitCallbacks(execute=True):
+            experience.save()
+
+        snapshot = PortfolioSnapshot.objects.get(user=self.owner)
+        self.assertEqual(snapshot.version, self.snapshot.version + 1)
+        self.assertIn('Principal Engineer', [row['role'] for row in snapshot.sections['experience']])
+        self.assertEqual(snapshot.sections['projects'], projects)
+
+    def test_deletes_and_m2m_changes_reach_the_snapshot(self):
+        project = Project.objects.filter(user=self.owner, tech_stack__isnull=False).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            project.tech_stack.clear()
+        rows = {row['slug']: row for row in get_snapshot(self.owner.pk).sections['projects']}
+        self.assertEqual(rows[project.slug]['tech_stack'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertNotIn(project.slug, get_snapshot(self.owner.pk).sections['project_details'])
+
+    def test_missing_sections_are_rebuilt_on_read(self):
+        PortfolioSnapshot.objects.filter(user=self.owner).update(sections={})
+        snapshot = get_snapshot(self.owner.pk)
+        self.assertEqual(set(snapshot.sections), set(SECTION_BUILDERS))
+        self.assertGreater(snapshot.version, self.snapshot.version)
+
+    def test_public_lists_read_the_snapshot_not_the_tables(self):
+        url = reverse('public-experience', kwargs={'username': USERNAME})
+        self.client.get(url)
+        caches['public'].clear()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertFalse(any('"api_experience"' in query['sql'] for query in queries))
+
+
+class UsernameResolverTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create_user(f'user{n}', f'user{n}@example.com', 'pass') for n in range(3)]
+        for user in cls.users:
+            Profile.objects.create(user=user, username_slug=user.username, full_name=user.username, show_blog=False)
+
+    def test_hits_skip_the_database(self):
+        resolver = UsernameResolver(max_size=10, ttl=60)
+        record = resolver.resolve('user0')
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.resolve('user0'), record)
+        self.assertEqual(record.user_id, self.users[0].pk)
+        self.assertTrue(record.is_visible('show_projects'))
+        self.assertFalse(record.is_visible('show_blog'))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        resolver = UsernameResolver(max_size=2, ttl=60)
+        resolver.resolve('user0')
+        resolver.resolve('user1')
+        resolver.resolve('user0')
+        resolver.resolve('user2')
+        with self.assertNumQueries(0):
+            resolver.resolve('user0')
+            resolver.resolve('user2')
+        with self.assertNumQueries(1):
+            resolver.resolve('user1')
+
+    def test_entries_expire_after_the_ttl(self):
+        resolver = UsernameResolver(max_size=10, ttl=60)
+        resolver.resolve('user0')
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61), self.assertNumQueries(1):
+            resolver.resolve('user0')
+
+    def test_profile_writes_invalidate_the_shared_resolver(self):
+        username_resolver.clear()
+        self.assertIsNotNone(resolve_username('user0'))
+        Profile.objects.filter(user=self.users[0]).first().save()
+        with self.assertNumQueries(1):
+            resolve_username('user0')
+
+        profile = Profile.objects.get(user=self.users[0])
+        profile.username_slug = 'renamed'
+        profile.save()
+        self.assertIsNone(resolve_username('user0'))
+        self.assertEqual(resolve_username('renamed').user_id, self.users[0].pk)
+
+
+class EncodedResponseTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.url = reverse('public-projects', kwargs={'username': USERNAME})
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def test_orjson_output_matches_drf(self):
+        data = {
+            'text': 'café\u2028line', 'when': datetime.datetime(2026, 1, 2, 3, 4, 5),
+            'amount': decimal.Decimal('1.50'), 'id': uuid.UUID(int=1), 'nested': [{'n': 1}, None],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=2'),
+            JSONRenderer().render(data, 'application/json; indent=2'),
+        )
+
+    def test_cached_bytes_are_served_as_rendered(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second['Content-Type'], 'application/json')
+
+    def test_python_payload_cache_serves_the_same_json(self):
+        encoded = self.client.get(self.url).json()
+        caches['public'].clear()
+        with override_settings(PUBLIC_CACHE_ENCODED=False):
+            self.assertEqual(self.client.get(self.url).json(), encoded)
+            self.assertEqual(self.client.get(self.url).json(), encoded)
+
+
+class _InlineExecutor:
+    """Stands in for ProcessPoolExecutor: forked workers cannot see the test transaction."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+@mock.patch('api.management.commands.export_portfolio.ProcessPoolExecutor', _InlineExecutor)
+class ExportPortfolioTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+        self.output = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def _export(self, *args):
+        stdout = StringIO()
+        call_command('export_portfolio', '--output', str(self.output), *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def _exported(self, *parts):
+        return json.loads((self.output / 'u' / USERNAME / Path(*parts) / 'index.json').read_bytes())
+
+    def test_files_mirror_the_public_api(self):
+        self._export('--username', USERNAME)
+        slug = Project.objects.filter(user=self.owner).first().slug
+        for parts, name, kwargs in (
+            (('profile',), 'public-profile', {}),
+            (('projects',), 'public-projects', {}),
+            (('projects', slug), 'public-project-detail', {'slug': slug}),
+            (('blog', 'tags'), 'public-blog-tags', {}),
+        ):
+            with self.subTest(name=name):
+                served = self.client.get(reverse(name, kwargs={'username': USERNAME, **kwargs})).json()
+                self.assertEqual(self._exported(*parts), served)
+        compressed = self.output / 'u' / USERNAME / 'bundle' / 'index.json.gz'
+        self.assertEqual(json.loads(gzip.decompress(compressed.read_bytes())), self._exported('bundle'))
+
+    def test_runs_are_incremental(self):
+        self.assertIn('Exported 1 portfolio(s)', self._export('--username', USERNAME))
+        self.assertIn('0 portfolio(s), 1 unchanged', self._export('--username', USERNAME))
+
+        refresh_snapshot(self.owner.pk, ['profile'])
+        self.assertIn('Exported 1 portfolio(s)', self._export('--username', USERNAME))
+        self.assertIn('Exported 1 portfolio(s)', self._export('--username', USERNAME, '--full'))
+
+
+class PrecompressedResponseTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.url = reverse('public-bundle', kwargs={'username': USERNAME})
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+        self.identity = self.client.get(self.url).content
+
+    def test_gzip_variant_decodes_to_the_identity_body(self):
+        response = self.client.get(self.url, headers={'accept_encoding': 'gzip'})
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), self.identity)
+
+    @skipUnless(brotli, 'brotli is not installed')
+    def test_brotli_is_preferred_when_accepted(self):
+        response = self.client.get(self.url, headers={'accept_encoding': 'gzip, deflate, br'})
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), self.identity)
+
+    def test_quality_values_are_honoured(self):
+        for header, expected in (('br;q=0, gzip', 'gzip'), ('gzip;q=0', None), ('identity', None), ('*', 'br')):
+            with self.subTest(header=header):
+                response = self.client.get(self.url, headers={'accept_encoding': header})
+                if expected == 'br' and brotli is None:
+                    expected = 'gzip'
+                self.assertEqual(response.get('Content-Encoding'), expected)
+
+    def test_small_bodies_are_not_compressed(self):
+        self.assertEqual(compress_variants(b'{}'), {'identity': b'{}'})
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('writer', 'writer@example.com', 'pass')
+        Profile.objects.create(user=cls.owner, username_slug='writer', full_name='Writer')
+        BlogPost.objects.bulk_create([
+            BlogPost(user=cls.owner, title=f'Post {n}', slug=f'post-{n}', excerpt='x', content='x', is_published=True)
+            for n in range(45)
+        ])
+        posts = list(BlogPost.objects.filter(user=cls.owner).order_by('pk').values_list('pk', flat=True))
+        tie = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        # Twenty posts share one timestamp, five have none; the rest are spread out.
+        BlogPost.objects.filter(pk__in=posts[:20]).update(published_at=tie)
+        BlogPost.objects.filter(pk__in=posts[20:25]).update(published_at=None)
+        for offset, pk in enumerate(posts[25:]):
+            BlogPost.objects.filter(pk=pk).update(published_at=tie + datetime.timedelta(days=offset % 4))
+        cls.expected = list(
+            BlogPost.objects.filter(user=cls.owner)
+            .order_by(F('published_at').desc(nulls_last=True), '-created_at', '-id')
+            .values_list('pk', flat=True)
+        )
+        cls.url = reverse('public-blog', kwargs={'username': 'writer'}) + '?pagination=cursor'
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _page(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return [post['id'] for post in data['results']], data
+
+    def test_next_links_walk_every_post_once_in_order(self):
+        ids, pages, url = [], [], self.url
+        while url:
+            page, data = self._page(url)
+            ids += page
+            pages.append(page)
+            url = data['next']
+        self.assertEqual(ids, self.expected)
+        self.assertEqual([len(page) for page in pages], [20, 20, 5])
+
+    def test_previous_links_walk_back_through_the_same_pages(self):
+        first, data = self._page(self.url)
+        self.assertIsNone(data['previous'])
+        second, data = self._page(data['next'])
+        last, data = self._page(data['next'])
+        self.assertIsNone(data['next'])
+
+        back, data = self._page(data['previous'])
+        self.assertEqual(back, second)
+        back, data = self._page(data['previous'])
+        self.assertEqual(back, first)
+        self.assertEqual(first + second + last, self.expected)
+
+    def test_invalid_cursor_is_404(self):
+        self.assertEqual(self.client.get(self.url + '&cursor=not-a-cursor').status_code, 404)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'explain_queries reads SQLite query plans')
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+
+    def test_every_query_shape_uses_an_index(self):
+        stdout = StringIO()
+        call_command('explain_queries', '--username', USERNAME, '--strict', stdout=stdout)
+        self.assertNotIn('USE TEMP B-TREE', stdout.getvalue())
+
+    def test_full_scans_are_detected(self):
+        self.assertTrue(is_full_scan('SCAN api_project'))
+        self.assertTrue(is_full_scan('USE TEMP B-TREE FOR ORDER BY'))
+        self.assertFalse(is_full_scan('SEARCH api_project USING INDEX project_public_idx (user_id=?)'))
+        self.assertFalse(is_full_scan('SCAN api_project USING INDEX project_user_order_idx'))
+
+
+@skipUnless(search.is_supported(connection), 'no full-text index on this database backend')
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('searcher', 'searcher@example.com', 'pass')
+        cls.profile = Profile.objects.create(user=cls.owner, username_slug='searcher', full_name='Searcher')
+        other = User.objects.create_user('other', 'other@example.com', 'pass')
+        cls.in_title = Project.objects.create(user=cls.owner, title='Kubernetes Operator', description='Go code.')
+        cls.in_body = Project.objects.create(
+            user=cls.owner, title='Billing', description='Deployed on kubernetes with a custom controller.',
+        )
+        BlogPost.objects.create(
+            user=cls.owner, title='Kubernetes notes', excerpt='x', content='Draft', is_published=False,
+        )
+        cls.post = BlogPost.objects.create(
+            user=cls.owner, title='Scaling', excerpt='x', content='Lessons from kubernetes.', is_published=True,
+        )
+        Project.objects.create(user=other, title='Kubernetes elsewhere', description='Not this portfolio.')
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _search(self, query):
+        response = self.client.get(reverse('public-search', kwargs={'username': 'searcher'}) + query)
+        self.assertEqual(response.status_code, 200)
+        return [(result['kind'], result['id']) for result in response.json()['results']]
+
+    def test_matches_are_ranked_and_scoped_to_public_documents(self):
+        results = self._search('?q=kubernetes')
+        self.assertEqual(results[0], ('project', self.in_title.pk))
+        self.assertEqual(
+            set(results), {('project', self.in_title.pk), ('project', self.in_body.pk), ('blog', self.post.pk)},
+        )
+
+    def test_last_term_matches_as_a_prefix(self):
+        self.assertIn(('project', self.in_title.pk), self._search('?q=kubern'))
+
+    def test_kind_filter_and_hidden_sections(self):
+        self.assertEqual(self._search('?q=kubernetes&kind=blog'), [('blog', self.post.pk)])
+        Profile.objects.filter(pk=self.profile.pk).update(show_blog=False)
+        username_resolver.clear()
+        self.assertNotIn('blog', {kind for kind, _ in self._search('?q=kubernetes')})
+
+    def test_query_syntax_is_matched_literally(self):
+        for query in ('?q="kubernetes', '?q=kubernetes OR NEAR(', '?q=title:billing'):
+            with self.subTest(query=query):
+                self._search(query)
+        response = self.client.get(reverse('public-search', kwargs={'username': 'searcher'}))
+        self.assertEqual(response.status_code, 400)
+
+    def test_edits_and_deletes_update_the_index(self):
+        self.in_title.title = 'Operator'
+        self.in_title.description = 'Nothing here.'
+        self.in_title.save()
+        self.post.delete()
+        results = search.search(self.owner.pk, 'kubernetes', list(search.SEARCH_SOURCES))
+        self.assertEqual([(result['kind'], result['id']) for result in results], [('project', self.in_body.pk)])
+
+
+class BlogTagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('tagger', 'tagger@example.com', 'pass')
+        Profile.objects.create(user=cls.owner, username_slug='tagger', full_name='Tagger')
+        cls.first = BlogPost.objects.create(
+            user=cls.owner, title='First', excerpt='x', content='x', tags=['React', 'Django'], is_published=True,
+        )
+        cls.second = BlogPost.objects.create(
+            user=cls.owner, title='Second', excerpt='x', content='x', tags=['react ', 'Python'], is_published=True,
+        )
+        BlogPost.objects.create(user=cls.owner, title='Draft', excerpt='x', content='x', tags=['Rust'])
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _facets(self):
+        response = self.client.get(reverse('public-blog-tags', kwargs={'username': 'tagger'}))
+        return {tag['slug']: (tag['name'], tag['count']) for tag in response.json()}
+
+    def _tagged(self, tag, query=''):
+        response = self.client.get(reverse('public-blog', kwargs={'username': 'tagger'}) + f'?tag={tag}{query}')
+        return {post['id'] for post in response.json()['results']}
+
+    def test_facets_count_published_posts_by_slug(self):
+        self.assertEqual(self._facets(), {
+            'react': ('React', 2), 'django': ('Django', 1), 'python': ('Python', 1),
+        })
+
+    def test_tag_filter_matches_by_slug_on_both_list_paths(self):
+        for query in ('', '&pagination=cursor'):
+            with self.subTest(query=query):
+                self.assertEqual(self._tagged('REACT', query), {self.first.pk, self.second.pk})
+                self.assertEqual(self._tagged('python', query), {self.second.pk})
+                self.assertEqual(self._tagged('rust', query), set())
+
+    def test_edits_and_deletes_keep_the_index_current(self):
+        self.first.tags = ['Django']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.save()
+            self.second.delete()
+        self.assertEqual(self._facets(), {'django': ('Django', 1)})
+        self.assertFalse(Tag.objects.filter(user=self.owner, slug='python').exists())
+
+
+MARKDOWN_SOURCE = (
+    '# Intro\n\nSome words here.\n\n## Setup steps\n\n'
+    'Run it <script>alert(1)</script> [x](javascript:alert(1)) <img src=x onerror=alert(1)>\n\n# Next\n'
+)
+
+
+@mock.patch('api.management.commands.render_markdown.ProcessPoolExecutor', _InlineExecutor)
+class MarkdownRenderingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='writer', password='pw-12345')
+        Profile.objects.create(user=cls.owner, username_slug='writer', full_name='Writer')
+
+    def test_render_sanitizes_and_anchors_headings(self):
+        html, toc, word_count = render_markdown(MARKDOWN_SOURCE)
+        self.assertIn('<h1 id="intro">Intro</h1>', html)
+        self.assertIn('<h2 id="setup-steps">Setup steps</h2>', html)
+        for unsafe in ('<script', 'alert(1)</', 'javascript:', 'onerror'):
+            self.assertNotIn(unsafe, html)
+        self.assertEqual(toc, [
+            {'id': 'intro', 'title': 'Intro', 'level': 1, 'children': [
+                {'id': 'setup-steps', 'title': 'Setup steps', 'level': 2, 'children': []},
+            ]},
+            {'id': 'next', 'title': 'Next', 'level': 1, 'children': []},
+        ])
+        self.assertEqual(word_count, 10)
+
+    def test_save_stores_the_rendered_columns(self):
+        post = BlogPost.objects.create(user=self.owner, title='Post', excerpt='x', content=' '.join(['word'] * 450))
+        self.assertEqual((post.word_count, post.read_time, post.render_version), (450, '3 min read', RENDERER_VERSION))
+        project = Project.objects.create(user=self.owner, title='Tool', description='## Usage\n\nRun **it**.')
+        self.assertEqual(project.toc[0]['id'], 'usage')
+        self.assertIn('<strong>it</strong>', project.description_html)
+
+        post.content = '# Rewritten'
+        post.save(update_fields=['content'])
+        post.refresh_from_db()
+        self.assertEqual((post.content_html, post.word_count), ('<h1 id="rewritten">Rewritten</h1>', 1))
+
+    def test_command_rerenders_stale_rows(self):
+        post = BlogPost.objects.create(user=self.owner, title='Post', excerpt='x', content='# Old')
+        BlogPost.objects.filter(pk=post.pk).update(content='# New', render_version=0)
+        Project.objects.create(user=self.owner, title='Tool', description='Current.')
+
+        stdout = StringIO()
+        call_command('render_markdown', '--workers', '1', stdout=stdout)
+        self.assertIn('BlogPost: re-rendered 1 rows.', stdout.getvalue())
+        self.assertIn('Project: re-rendered 0 rows.', stdout.getvalue())
+        post.refresh_from_db()
+        self.assertEqual((post.content_html, post.render_version), ('<h1 id="new">New</h1>', RENDERER_VERSION))
+
+
+class RelatedItemTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='relator', password='pw-12345')
+        Profile.objects.create(user=cls.owner, username_slug='relator', full_name='Relator')
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _post(self, title, content, tags):
+        return BlogPost.objects.create(
+            user=self.owner, title=title, excerpt='x', content=content, tags=tags, is_published=True,
+        )
+
+    def _related(self, post):
+        response = self.client.get(reverse('public-blog-detail', kwargs={'username': 'relator', 'slug': post.slug}))
+        return [item['id'] for item in response.json()['related']]
+
+    def test_nearest_neighbours_rank_by_text_and_tags(self):
+        neighbours = related.nearest_neighbours([
+            (1, 'django orm queries django', {'django'}),
+            (2, 'django orm indexes', {'django'}),
+            (3, 'sourdough baking', {'bread'}),
+        ])
+        self.assertEqual([pk for pk, _ in neighbours[1]], [2])
+        self.assertEqual(neighbours[3], [])
+        self.assertEqual(related.nearest_neighbours([(1, 'alone', set())]), {1: []})
+
+    def test_writes_keep_the_detail_payloads_current(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            orm = self._post('Django ORM tips', 'Query the django orm with select_related.', ['Django'])
+            indexes = self._post('Django indexes', 'Composite indexes make the django orm fast.', ['Django'])
+            bread = self._post('Sourdough', 'Flour, water and patience.', ['Baking'])
+        self.assertEqual(self._related(orm), [indexes.pk])
+        self.assertEqual(self._related(bread), [])
+
+        indexes.is_published = False
+        with self.captureOnCommitCallbacks(execute=True):
+            indexes.save()
+        self.assertEqual(self._related(orm), [])
+        self.assertFalse(RelatedItem.objects.filter(target_id=indexes.pk).exists())
+
+    def test_rebuild_only_rewrites_changed_lists(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            orm = self._post('Django ORM tips', 'Query the django orm.', ['Django'])
+            self._post('Django indexes', 'Indexes for the django orm.', ['Django'])
+        self.assertEqual(list(related.rebuild_related()), [(self.owner.pk, 'blog', 0)])
+
+        RelatedItem.objects.filter(source_id=orm.pk).delete()
+        stdout = StringIO()
+        call_command('rebuild_related', stdout=stdout)
+        self.assertIn('Rewrote 1 neighbour lists; refreshed 1 portfolio snapshots.', stdout.getvalue())
+
+
+class CompiledSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_portfolio', stdout=StringIO())
+        cls.owner = User.objects.get(username=USERNAME)
+        # Rows with NULL dates and an empty relation exercise the None / missing-children branches.
+        Experience.objects.create(
+            user=cls.owner, role='Consultant', company='Self', start_date=datetime.date(2024, 1, 1),
+        )
+        Certification.objects.create(user=cls.owner, name='Undated')
+        Project.objects.create(user=cls.owner, title='No stack', description='x')
+
+    def test_output_matches_the_drf_serializers(self):
+        renderer = JSONRenderer()
+        for (key, _, build_queryset, serializer_class), responsive in itertools.product(
+            PORTFOLIO_SECTIONS, (True, False),
+        ):
+            with self.subTest(section=key, responsive=responsive), override_settings(RESPONSIVE_IMAGES=responsive):
+                queryset = build_queryset(self.owner)
+                expected = serializer_class(queryset, many=True).data
+                self.assertTrue(expected)
+                self.assertEqual(
+                    renderer.render(compile_serializer(serializer_class).serialize(queryset)),
+                    renderer.render(expected),
+                )
+
+    def test_nested_lists_cost_one_query_each(self):
+        _, _, build_queryset, serializer_class = next(
+            section for section in PORTFOLIO_SECTIONS if section[0] == 'projects'
+        )
+        compiled = compile_serializer(serializer_class)
+        with self.assertNumQueries(1 + len(compiled.nested)):
+            compiled.serialize(build_queryset(self.owner))
+
+    def test_method_fields_must_declare_their_columns(self):
+        class UndeclaredSerializer(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Skill
+                fields = ['id', 'label']
+
+            def get_label(self, obj):
+                return obj.name
+
+        with self.assertRaisesMessage(ImproperlyConfigured, 'UndeclaredSerializer.label'):
+            compile_serializer(UndeclaredSerializer)
+
+
+class FeedSitemapTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='feeder', password='pw-12345')
+        cls.profile = Profile.objects.create(user=cls.owner, username_slug='feeder', full_name='Feeder')
+        cls.older = BlogPost.objects.create(
+            user=cls.owner, title='Older', excerpt='First post', content='One', tags=['Django'], is_published=True,
+            published_at=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+        cls.newer = BlogPost.objects.create(
+            user=cls.owner, title='Newer', excerpt='Second post', content='**Two**', is_published=True,
+            published_at=datetime.datetime(2025, 2, 1, tzinfo=datetime.timezone.utc),
+        )
+        BlogPost.objects.create(user=cls.owner, title='Draft', excerpt='x', content='x')
+        cls.project = Project.objects.create(user=cls.owner, title='Shown', description='x')
+        Project.objects.create(user=cls.owner, title='Hidden', description='x', is_visible=False)
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    def _get(self, name, **kwargs):
+        return self.client.get(reverse(name, kwargs=kwargs))
+
+    def _locations(self, response):
+        root = ElementTree.fromstring(response.content)
+        return [element.text for element in root.iter(f'{{{feeds.SITEMAP_NAMESPACE}}}loc')]
+
+    def test_rss_lists_published_posts_newest_first(self):
+        response = self._get('public-blog-feed', username='feeder')
+        self.assertEqual(response['Content-Type'], 'application/rss+xml')
+        channel = ElementTree.fromstring(response.content).find('channel')
+        self.assertEqual(channel.findtext('title'), 'Feeder — Blog')
+        items = channel.findall('item')
+        self.assertEqual([item.findtext('title') for item in items], ['Newer', 'Older'])
+        self.assertEqual(items[0].findtext('link'), feeds.public_url('post', username='feeder', slug='newer'))
+        self.assertEqual(items[0].findtext(f'{{{feeds.CONTENT_NAMESPACE}}}encoded'), '<p><strong>Two</strong></p>')
+        self.assertEqual(items[1].findtext('category'), 'Django')
+
+    def test_atom_feed_and_hidden_blog(self):
+        response = self._get('public-blog-atom', username='feeder')
+        self.assertEqual(response['Content-Type'], 'application/atom+xml')
+        entries = ElementTree.fromstring(response.content).findall(f'{{{feeds.ATOM_NAMESPACE}}}entry')
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[1].find(f'{{{feeds.ATOM_NAMESPACE}}}category').get('term'), 'django')
+
+        Profile.objects.filter(pk=self.profile.pk).update(show_blog=False)
+        username_resolver.clear()
+        self.assertEqual(self._get('public-blog-feed', username='feeder').status_code, 404)
+
+    def test_feed_follows_writes(self):
+        self.assertEqual(self._get('public-blog-feed', username='feeder').status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            BlogPost.objects.create(
+                user=self.owner, title='Newest', excerpt='x', content='x', is_published=True,
+                published_at=datetime.datetime(2025, 3, 1, tzinfo=datetime.timezone.utc),
+            )
+        channel = ElementTree.fromstring(self._get('public-blog-feed', username='feeder').content).find('channel')
+        self.assertEqual(channel.find('item').findtext('title'), 'Newest')
+
+    def test_sitemap_lists_visible_pages(self):
+        self.assertEqual(self._locations(self._get('public-sitemap', username='feeder')), [
+            feeds.public_url('portfolio', username='feeder'),
+            feeds.public_url('project', username='feeder', slug='shown'),
+            feeds.public_url('post', username='feeder', slug='newer'),
+            feeds.public_url('post', username='feeder', slug='older'),
+        ])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.show_projects = False
+            self.profile.save()
+        locations = self._locations(self._get('public-sitemap', username='feeder'))
+        self.assertNotIn(feeds.public_url('project', username='feeder', slug='shown'), locations)
+
+    def test_platform_index_links_every_shard(self):
+        self._get('public-sitemap', username='feeder')
+        response = self._get('platform-sitemap')
+        self.assertEqual(self._locations(response), [
+            'http://testserver' + reverse('public-sitemap', kwargs={'username': 'feeder'}),
+        ])
+        revalidated = self.client.get(reverse('platform-sitemap'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Renamed'
+            self.project.save()
+        self.assertNotEqual(self._get('platform-sitemap')['ETag'], response['ETag'])
+
+
+CLOUDINARY_RESUME = 'https://res.cloudinary.com/demo/raw/upload/v1700000000/resumes/cv.pdf'
+
+
+class ResumeLinkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='resumed', password='pw-12345')
+        cls.profile = Profile.objects.create(
+            user=cls.owner, username_slug='resumed', full_name='Resumed', resume='https://example.com/cv.pdf',
+        )
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+        self.url = reverse('public-resume', kwargs={'username': 'resumed'})
+
+    def _set_resume(self, resume):
+        self.profile.resume = resume
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+
+    def test_repeat_clicks_skip_the_database(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, 'https://example.com/cv.pdf', fetch_redirect_response=False)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url)['Location'], 'https://example.com/cv.pdf')
+
+    def test_signed_links_are_reused_until_near_expiry(self):
+        self._set_resume(CLOUDINARY_RESUME)
+        now = time.time()
+        signed = mock.patch.object(
+            assets, '_signed_download_url', side_effect=[
+                ('https://api.cloudinary.com/signed-1', int(now) + assets.RESUME_LINK_TTL),
+                ('https://api.cloudinary.com/signed-2', int(now) + 2 * assets.RESUME_LINK_TTL),
+            ],
+        )
+        with signed as sign:
+            self.assertEqual(self.client.get(self.url)['Location'], 'https://api.cloudinary.com/signed-1')
+            self.assertEqual(self.client.get(self.url)['Location'], 'https://api.cloudinary.com/signed-1')
+            self.assertEqual(sign.call_count, 1)
+
+            near_expiry = now + assets.RESUME_LINK_TTL - assets.RESUME_LINK_REUSE_MARGIN
+            with mock.patch('time.time', return_value=near_expiry):
+                self.assertEqual(self.client.get(self.url)['Location'], 'https://api.cloudinary.com/signed-2')
+            self.assertEqual(sign.call_count, 2)
+
+    def test_missing_credentials_are_not_cached(self):
+        self._set_resume(CLOUDINARY_RESUME)
+        with mock.patch.object(assets, '_signed_download_url', side_effect=assets.ResumeDeliveryNotConfigured):
+            self.assertEqual(self.client.get(self.url).status_code, 503)
+        self.assertIsNone(assets.cached_resume_link(self.profile.pk))
+
+    def test_profile_writes_forget_a_changed_resume(self):
+        self.client.get(self.url)
+        self.profile.tagline = 'Unrelated edit'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+        self.assertEqual(assets.cached_resume_link(self.profile.pk), 'https://example.com/cv.pdf')
+
+        self._set_resume('https://example.com/cv-2026.pdf')
+        self.assertIsNone(assets.cached_resume_link(self.profile.pk))
+        self.assertEqual(self.client.get(self.url)['Location'], 'https://example.com/cv-2026.pdf')
+
+        self._set_resume('')
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+CLOUDINARY_IMAGE = 'https://res.cloudinary.com/demo/image/upload/v1700000000/projects/cover.png'
+
+
+class ResponsiveImageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='pictured', password='pw-12345')
+        Profile.objects.create(
+            user=cls.owner, username_slug='pictured', full_name='Pictured', avatar=CLOUDINARY_IMAGE,
+        )
+        Project.objects.create(user=cls.owner, title='Cover', description='x', thumbnail=CLOUDINARY_IMAGE)
+        Project.objects.create(
+            user=cls.owner, title='Elsewhere', description='x', thumbnail='https://example.com/a.png',
+        )
+
+    def setUp(self):
+        caches['public'].clear()
+        username_resolver.clear()
+
+    @override_settings(RESPONSIVE_IMAGE_WIDTHS={'thumbnail': [320, 640]})
+    def test_srcset_chains_a_resize_per_width(self):
+        base = 'https://res.cloudinary.com/demo/image/upload'
+        self.assertEqual(assets.image_srcset(CLOUDINARY_IMAGE, 'thumbnail'), (
+            f'{base}/f_auto,q_auto,c_limit,w_320/v1700000000/projects/cover.png 320w, '
+            f'{base}/f_auto,q_auto,c_limit,w_640/v1700000000/projects/cover.png 640w'
+        ))
+        transformed = f'{base}/e_grayscale/v1700000000/projects/cover.png'
+        self.assertTrue(assets.image_srcset(transformed, 'thumbnail').startswith(
+            f'{base}/e_grayscale/f_auto,q_auto,c_limit,w_320/v1700000000/'
+        ))
+
+    def test_untransformable_images_have_no_srcset(self):
+        for url in (
+            '',
+            'https://example.com/a.png',
+            'https://res.cloudinary.com/demo/raw/upload/v1700000000/cv.pdf',
+            'https://res.cloudinary.com/demo/image/private/v1700000000/secret.png',
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(assets.image_srcset(url, 'thumbnail'), '')
+        self.assertEqual(assets.image_srcset(CLOUDINARY_IMAGE, 'unknown-ladder'), '')
+
+    def test_public_payloads_carry_srcsets(self):
+        profile = self.client.get(reverse('public-profile', kwargs={'username': 'pictured'})).json()
+        widths = settings.RESPONSIVE_IMAGE_WIDTHS['avatar']
+        self.assertEqual(profile['avatar_srcset'].count('w, ') + 1, len(widths))
+        self.assertTrue(profile['avatar_srcset'].endswith(f' {widths[-1]}w'))
+
+        projects = self.client.get(reverse('public-projects', kwargs={'username': 'pictured'})).json()
+        rows = projects['results'] if isinstance(projects, dict) else projects
+        srcsets = {row['title']: row['thumbnail_srcset'] for row in rows}
+        self.assertIn('/f_auto,q_auto,c_limit,w_', srcsets['Cover'])
+        self.assertEqual(srcsets['Elsewhere'], '')
+
+    def test_disabled_srcsets_are_left_out(self):
+        for overrides in (
+            {'RESPONSIVE_IMAGES': False},
+            {'RESPONSIVE_IMAGE_WIDTHS': {'thumbnail': [], 'avatar': []}},
+        ):
+            with self.subTest(overrides=overrides), override_settings(**overrides):
+                caches['public'].clear()
+                refresh_snapshot(self.owner.pk)
+                bundle = self.client.get(reverse('public-bundle', kwargs={'username': 'pictured'})).json()
+                self.assertNotIn('avatar_srcset', bundle['profile'])
+                self.assertTrue(bundle['projects'])
+                self.assertFalse(any('thumbnail_srcset' in row for row in bundle['projects']))
+                slug = Project.objects.get(user=self.owner, title='Cover').slug
+                detail = self.client.get(
+                    reverse('public-project-detail', kwargs={'username': 'pictured', 'slug': slug}),
+                ).json()
+                self.assertNotIn('thumbnail_srcset', detail)
@@ -24,6 +24,7 @@ urlpatterns = [
 
     # ── Public Portfolio Endpoints (by username) ─────────────────────────
     path('u/<str:username>/profile/', views.PublicProfileView.as_view(), name='public-profile'),
+    path('u/<str:username>/bundle/', views.PublicPortfolioBundleView.as_view(), name='public-bundle'),
     path('u/<str:username>/resume/', views.PublicResumeView.as_view(), name='public-resume'),
     path('u/<str:username>/skills/', views.PublicSkillListView.as_view(), name='public-skills'),
     path('u/<str:username>/projects/', views.PublicProjectListView.as_view(), name='public-projects'),
@@ -35,46 +36,72 @@ urlpatterns = [
     path('u/<str:username>/certifications/', views.PublicCertificationListView.as_view(), name='public-certifications'),
     path('u/<str:username>/contact/', views.PublicContactView.as_view(), name='public-contact'),
     path('u/<str:username>/blog/', views.PublicBlogListView.as_view(), name='public-blog'),
+    path('u/<str:username>/blog/tags/', views.PublicBlogTagListView.as_view(), name='public-blog-tags'),
+    path('u/<str:username>/blog/feed.xml', views.PublicBlogFeedView.as_view(), name='public-blog-feed'),
+    path('u/<str:username>/blog/atom.xml', views.PublicBlogAtomFeedView.as_view(), name='public-blog-atom'),
     path('u/<str:username>/blog/<slug:slug>/', views.PublicBlogDetailView.as_view(), name='public-blog-detail'),
     path('u/<str:username>/testimonials/', views.PublicTestimonialListView.as_view(), name='public-testimonials'),
+    path('u/<str:username>/search/', views.PublicSearchView.as_view(), name='public-search'),
+    path('u/<str:username>/sitemap.xml', views.PublicSitemapView.as_view(), name='public-sitemap'),
+    path('sitemap.xml', views.PlatformSitemapView.as_view(), name='platform-sitemap'),
 
     # ── User Dashboard (authenticated user's own data) ────────────────────────
     path('user/stats/', admin_views.DashboardStatsView.as_view(), name='user-stats'),
     path('user/profile/', admin_views.DashboardProfileView.as_view(), name='user-profile'),
 
     path('user/projects/', admin_views.DashboardProjectListCreateView.as_view(), name='user-projects'),
+    path('user/projects/bulk/', admin_views.DashboardProjectBulkView.as_view(), name='user-projects-bulk'),
+    path('user/projects/reorder/', admin_views.DashboardProjectReorderView.as_view(), name='user-projects-reorder'),
     path('user/projects/<int:pk>/', admin_views.DashboardProjectDetailView.as_view(), name='user-project-detail'),
 
     path('user/skills/', admin_views.DashboardSkillListCreateView.as_view(), name='user-skills'),
+    path('user/skills/bulk/', admin_views.DashboardSkillBulkView.as_view(), name='user-skills-bulk'),
+    path('user/skills/reorder/', admin_views.DashboardSkillReorderView.as_view(), name='user-skills-reorder'),
     path('user/skills/<int:pk>/', admin_views.DashboardSkillDetailView.as_view(), name='user-skill-detail'),
 
     path('user/skill-categories/', admin_views.DashboardCategoryListCreateView.as_view(), name='user-categories'),
+    path('user/skill-categories/bulk/', admin_views.DashboardCategoryBulkView.as_view(), name='user-categories-bulk'),
+    path('user/skill-categories/reorder/', admin_views.DashboardCategoryReorderView.as_view(), name='user-categories-reorder'),
     path('user/skill-categories/<int:pk>/', admin_views.DashboardCategoryDetailView.as_view(), name='user-category-detail'),
 
     path('user/experience/', admin_views.DashboardExperienceListCreateView.as_view(), name='user-experience'),
+    path('user/experience/bulk/', admin_views.DashboardExperienceBulkView.as_view(), name='user-experience-bulk'),
+    path('user/experience/reorder/', admin_views.DashboardExperienceReorderView.as_view(), name='user-experience-reorder'),
     path('user/experience/<int:pk>/', admin_views.DashboardExperienceDetailView.as_view(), name='user-experience-detail'),
 
     path('user/education/', admin_views.DashboardEducationListCreateView.as_view(), name='user-education'),
+    path('user/education/bulk/', admin_views.DashboardEducationBulkView.as_view(), name='user-education-bulk'),
+    path('user/education/reorder/', admin_views.DashboardEducationReorderView.as_view(), name='user-education-reorder'),
     path('user/education/<int:pk>/', admin_views.DashboardEducationDetailView.as_view(), name='user-education-detail'),
 
     path('user/activities/', admin_views.DashboardActivityListCreateView.as_view(), name='user-activities'),
+    path('user/activities/bulk/', admin_views.DashboardActivityBulkView.as_view(), name='user-activities-bulk'),
+    path('user/activities/reorder/', admin_views.DashboardActivityReorderView.as_view(), name='user-activities-reorder'),
     path('user/activities/<int:pk>/', admin_views.DashboardActivityDetailView.as_view(), name='user-activity-detail'),
 
     path('user/achievements/', admin_views.DashboardAchievementListCreateView.as_view(), name='user-achievements'),
+    path('user/achievements/bulk/', admin_views.DashboardAchievementBulkView.as_view(), name='user-achievements-bulk'),
+    path('user/achievements/reorder/', admin_views.DashboardAchievementReorderView.as_view(), name='user-achievements-reorder'),
     path('user/achievements/<int:pk>/', admin_views.DashboardAchievementDetailView.as_view(), name='user-achievement-detail'),
 
     path('user/certifications/', admin_views.DashboardCertificationListCreateView.as_view(), name='user-certifications'),
+    path('user/certifications/bulk/', admin_views.DashboardCertificationBulkView.as_view(), name='user-certifications-bulk'),
+    path('user/certifications/reorder/', admin_views.DashboardCertificationReorderView.as_view(), name='user-certifications-reorder'),
     path('user/certifications/<int:pk>/', admin_views.DashboardCertificationDetailView.as_view(), name='user-certification-detail'),
 
     path('user/messages/', admin_views.DashboardMessageListView.as_view(), name='user-messages'),
+    path('user/messages/bulk/', admin_views.DashboardMessageBulkView.as_view(), name='user-messages-bulk'),
     path('user/messages/<int:pk>/', admin_views.DashboardMessageDetailView.as_view(), name='user-message-detail'),
 
     path('user/upload/', admin_views.DashboardUploadView.as_view(), name='user-upload'),
 
     path('user/blog/', admin_views.DashboardBlogListCreateView.as_view(), name='user-blog'),
+    path('user/blog/bulk/', admin_views.DashboardBlogBulkView.as_view(), name='user-blog-bulk'),
     path('user/blog/<int:pk>/', admin_views.DashboardBlogDetailView.as_view(), name='user-blog-detail'),
 
     path('user/testimonials/', admin_views.DashboardTestimonialListCreateView.as_view(), name='user-testimonials'),
+    path('user/testimonials/bulk/', admin_views.DashboardTestimonialBulkView.as_view(), name='user-testimonials-bulk'),
+    path('user/testimonials/reorder/', admin_views.DashboardTestimonialReorderView.as_view(), name='user-testimonials-reorder'),
     path('user/testimonials/<int:pk>/', admin_views.DashboardTestimonialDetailView.as_view(), name='user-testimonial-detail'),
 
     # ── Dashboard (backward compatibility) ────────────────────────────
@@ -82,38 +109,58 @@ urlpatterns = [
     path('dashboard/profile/', admin_views.DashboardProfileView.as_view(), name='dashboard-profile'),
 
     path('dashboard/projects/', admin_views.DashboardProjectListCreateView.as_view(), name='dashboard-projects'),
+    path('dashboard/projects/bulk/', admin_views.DashboardProjectBulkView.as_view(), name='dashboard-projects-bulk'),
+    path('dashboard/projects/reorder/', admin_views.DashboardProjectReorderView.as_view(), name='dashboard-projects-reorder'),
     path('dashboard/projects/<int:pk>/', admin_views.DashboardProjectDetailView.as_view(), name='dashboard-project-detail'),
 
     path('dashboard/skills/', admin_views.DashboardSkillListCreateView.as_view(), name='dashboard-skills'),
+    path('dashboard/skills/bulk/', admin_views.DashboardSkillBulkView.as_view(), name='dashboard-skills-bulk'),
+    path('dashboard/skills/reorder/', admin_views.DashboardSkillReorderView.as_view(), name='dashboard-skills-reorder'),
     path('dashboard/skills/<int:pk>/', admin_views.DashboardSkillDetailView.as_view(), name='dashboard-skill-detail'),
 
     path('dashboard/skill-categories/', admin_views.DashboardCategoryListCreateView.as_view(), name='dashboard-categories'),
+    path('dashboard/skill-categories/bulk/', admin_views.DashboardCategoryBulkView.as_view(), name='dashboard-categories-bulk'),
+    path('dashboard/skill-categories/reorder/', admin_views.DashboardCategoryReorderView.as_view(), name='dashboard-categories-reorder'),
     path('dashboard/skill-categories/<int:pk>/', admin_views.DashboardCategoryDetailView.as_view(), name='dashboard-category-detail'),
 
     path('dashboard/experience/', admin_views.DashboardExperienceListCreateView.as_view(), name='dashboard-experience'),
+    path('dashboard/experience/bulk/', admin_views.DashboardExperienceBulkView.as_view(), name='dashboard-experience-bulk'),
+    path('dashboard/experience/reorder/', admin_views.DashboardExperienceReorderView.as_view(), name='dashboard-experience-reorder'),
     path('dashboard/experience/<int:pk>/', admin_views.DashboardExperienceDetailView.as_view(), name='dashboard-experience-detail'),
 
     path('dashboard/education/', admin_views.DashboardEducationListCreateView.as_view(), name='dashboard-education'),
+    path('dashboard/education/bulk/', admin_views.DashboardEducationBulkView.as_view(), name='dashboard-education-bulk'),
+    path('dashboard/education/reorder/', admin_views.DashboardEducationReorderView.as_view(), name='dashboard-education-reorder'),
     path('dashboard/education/<int:pk>/', admin_views.DashboardEducationDetailView.as_view(), name='dashboard-education-detail'),
 
     path('dashboard/activities/', admin_views.DashboardActivityListCreateView.as_view(), name='dashboard-activities'),
+    path('dashboard/activities/bulk/', admin_views.DashboardActivityBulkView.as_view(), name='dashboard-activities-bulk'),
+    path('dashboard/activities/reorder/', admin_views.DashboardActivityReorderView.as_view(), name='dashboard-activities-reorder'),
     path('dashboard/activities/<int:pk>/', admin_views.DashboardActivityDetailView.as_view(), name='dashboard-activity-detail'),
 
     path('dashboard/achievements/', admin_views.DashboardAchievementListCreateView.as_view(), name='dashboard-achievements'),
+    path('dashboard/achievements/bulk/', admin_views.DashboardAchievementBulkView.as_view(), name='dashboard-achievements-bulk'),
+    path('dashboard/achievements/reorder/', admin_views.DashboardAchievementReorderView.as_view(), name='dashboard-achievements-reorder'),
     path('dashboard/achievements/<int:pk>/', admin_views.DashboardAchievementDetailView.as_view(), name='dashboard-achievement-detail'),
 
     path('dashboard/certifications/', admin_views.DashboardCertificationListCreateView.as_view(), name='dashboard-certifications'),
+    path('dashboard/certifications/bulk/', admin_views.DashboardCertificationBulkView.as_view(), name='dashboard-certifications-bulk'),
+    path('dashboard/certifications/reorder/', admin_views.DashboardCertificationReorderView.as_view(), name='dashboard-certifications-reorder'),
     path('dashboard/certifications/<int:pk>/', admin_views.DashboardCertificationDetailView.as_view(), name='dashboard-certification-detail'),
 
     path('dashboard/messages/', admin_views.DashboardMessageListView.as_view(), name='dashboard-messages'),
+    path('dashboard/messages/bulk/', admin_views.DashboardMessageBulkView.as_view(), name='dashboard-messages-bulk'),
     path('dashboard/messages/<int:pk>/', admin_views.DashboardMessageDetailView.as_view(), name='dashboard-message-detail'),
 
     path('dashboard/upload/', admin_views.DashboardUploadView.as_view(), name='dashboard-upload'),
 
     path('dashboard/blog/', admin_views.DashboardBlogListCreateView.as_view(), name='dashboard-blog'),
+    path('dashboard/blog/bulk/', admin_views.DashboardBlogBulkView.as_view(), name='dashboard-blog-bulk'),
     path('dashboard/blog/<int:pk>/', admin_views.DashboardBlogDetailView.as_view(), name='dashboard-blog-detail'),
 
     path('dashboard/testimonials/', admin_views.DashboardTestimonialListCreateView.as_view(), name='dashboard-testimonials'),
+    path('dashboard/testimonials/bulk/', admin_views.DashboardTestimonialBulkView.as_view(), name='dashboard-testimonials-bulk'),
+    path('dashboard/testimonials/reorder/', admin_views.DashboardTestimonialReorderView.as_view(), name='dashboard-testimonials-reorder'),
     path('dashboard/testimonials/<int:pk>/', admin_views.DashboardTestimonialDetailView.as_view(), name='dashboard-testimonial-detail'),
 ]
 
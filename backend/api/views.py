@@ -1,9 +1,11 @@
-import os
-import re
-import time
 from urllib.parse import urlparse
 
-from django.http import HttpResponseRedirect
+from django.conf import settings
+from django.db.models import Count, Max, Sum
+from django.http import HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -20,10 +22,11 @@ from .models import (
     Certification,
     Message,
     BlogPost,
+    Tag,
     Testimonial,
+    PortfolioSnapshot,
 )
 from .serializers import (
-    ProfileSerializer,
     SkillCategorySerializer,
     ProjectListSerializer,
     ProjectDetailSerializer,
@@ -35,169 +38,326 @@ from .serializers import (
     MessageCreateSerializer,
     BlogPostListSerializer,
     BlogPostDetailSerializer,
+    TagSerializer,
     TestimonialSerializer,
 )
+from . import cache as response_cache
+from . import assets, feeds, search
+from .tags import post_ids_with_tag
+from .compression import choose_encoding, compress_variants
+from .fieldsets import sparse_data, sparse_queryset
+from .pagination import BlogKeysetPagination, ProjectKeysetPagination
+from .renderers import AtomRenderer, FirstRendererNegotiation, RSSRenderer, XMLDocumentRenderer
+from .resolvers import resolve_username
+from .snapshots import (
+    get_snapshot,
+    public_skills_queryset,
+    public_projects_queryset,
+    public_experience_queryset,
+    public_education_queryset,
+    public_activities_queryset,
+    public_achievements_queryset,
+    public_certifications_queryset,
+    public_blog_queryset,
+    public_blog_tags_queryset,
+    public_testimonials_queryset,
+    visible_sections,
+)
 from .throttles import ContactRateThrottle
 
 
-def get_user_by_username(username):
-    """Resolve username to User via Profile.username_slug."""
-    try:
-        profile = Profile.objects.select_related('user').get(username_slug=username)
-        return profile.user
-    except Profile.DoesNotExist:
-        return None
+# ─── Snapshot Serving ───────────────────────────────────────────────────────
+
+def _snapshot_profile(snapshot, request):
+    """Snapshot profile payload with the resume link made absolute for this request."""
+    profile = dict(snapshot.sections['profile'])
+    if profile.get('resume_download_url'):
+        profile['resume_download_url'] = request.build_absolute_uri(profile['resume_download_url'])
+    return profile
+
 
+def _snapshot_etag(user_id, version):
+    # Weak: the same snapshot version is served under several content encodings.
+    return 'W/' + quote_etag(f'{user_id}-{version}')
 
-_CLOUDINARY_VERSION_RE = re.compile(r'^v\d+$')
 
+def _stamp_validators(response, user_id, version, last_modified):
+    response['ETag'] = _snapshot_etag(user_id, version)
+    response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    return response
 
-def _is_public_http_url(value):
-    parsed = urlparse(value)
-    return parsed.scheme in {'http', 'https'} and bool(parsed.netloc)
 
+def _not_modified(request, user_id, version, last_modified):
+    """A 304 if the request's If-None-Match / If-Modified-Since still match, else None."""
+    etag = _snapshot_etag(user_id, version)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+    return not_modified
 
-def _extract_cloudinary_asset_details(asset_url):
-    parsed = urlparse(asset_url)
-    if parsed.netloc != 'res.cloudinary.com':
-        return None
 
-    path_parts = [part for part in parsed.path.split('/') if part]
-    if len(path_parts) < 5:
-        return None
+def _precompressed_response(request, variants, content_type):
+    encoding = choose_encoding(request, variants)
+    response = HttpResponse(variants[encoding], content_type=content_type)
+    if encoding != 'identity':
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
 
-    resource_type = path_parts[1]
-    delivery_type = path_parts[2]
-    version_index = next(
-        (index for index, part in enumerate(path_parts) if _CLOUDINARY_VERSION_RE.match(part)),
-        None,
-    )
-    if version_index is None or version_index >= len(path_parts) - 1:
-        return None
 
-    public_id_parts = path_parts[version_index + 1:]
-    file_name = public_id_parts[-1]
-    base_name, extension = os.path.splitext(file_name)
-    if resource_type != 'raw' and base_name:
-        public_id_parts[-1] = base_name
+# Renderer formats cached as final, precompressed bytes (JSON and the XML feeds).
+PRECOMPRESSED_FORMATS = {'json', 'xml', 'rss', 'atom'}
 
-    public_id = '/'.join(public_id_parts).strip('/')
-    if not public_id:
-        return None
 
-    return {
-        'public_id': public_id,
-        'resource_type': resource_type,
-        'delivery_type': delivery_type,
-        'format': extension.lstrip('.').lower() if extension else '',
-    }
+class SnapshotResponseMixin:
+    """
+    Build responses from the user's PortfolioSnapshot with ETag / Last-Modified
+    validators, through the versioned public response cache. Conditional GETs
+    for a cached response are answered with 304 from the snapshot version, and
+    cache hits are served without touching the database. JSON responses are cached as their
+    final encoded bytes (PUBLIC_CACHE_ENCODED), precompressed once with gzip and
+    brotli, so a hit skips rendering and compression too; so are the XML feeds.
+    """
+
+    def snapshot_response(self, request, user_id, build_response):
+        encoded = settings.PUBLIC_CACHE_ENCODED and request.accepted_renderer.format in PRECOMPRESSED_FORMATS
+        variant = f'precompressed:{request.accepted_media_type}' if encoded else 'data'
+        content_type = request.accepted_renderer.media_type
+
+        # The validators are per user, not per resource: only answer 304 once this
+        # request is known to resolve to a 200 (a cached body, or one just built),
+        # so a conditional GET for a missing slug still gets its 404.
+        validators = response_cache.get_validators(user_id)
+        if validators:
+            version, last_modified = validators
+            cached = response_cache.get_response(user_id, version, request, variant)
+            if cached is not None:
+                if encoded or cached[1] == status.HTTP_200_OK:
+                    not_modified = _not_modified(request, user_id, version, last_modified)
+                    if not_modified is not None:
+                        return not_modified
+                if encoded:
+                    response = _precompressed_response(request, cached, content_type)
+                else:
+                    data, status_code = cached
+                    response = Response(data, status=status_code)
+                return _stamp_validators(response, user_id, version, last_modified)
+
+        snapshot = get_snapshot(user_id)
+        response = build_response(snapshot)
+        if response is None:
+            return None
+        last_modified = int(snapshot.updated_at.timestamp())
+        status_code = response.status_code
+        if encoded:
+            body = request.accepted_renderer.render(
+                response.data, request.accepted_media_type, self.get_renderer_context(),
+            )
+            variants = compress_variants(body)
+            response_cache.set_response(user_id, snapshot.version, request, variants, variant)
+            response = _precompressed_response(request, variants, content_type)
+        else:
+            response_cache.set_response(user_id, snapshot.version, request, (response.data, status_code), variant)
+        if status_code == status.HTTP_200_OK:
+            not_modified = _not_modified(request, user_id, snapshot.version, last_modified)
+            if not_modified is not None:
+                return not_modified
+        return _stamp_validators(response, user_id, snapshot.version, last_modified)
+
+
+class SnapshotListMixin(SnapshotResponseMixin):
+    """
+    Serve a list view from the user's PortfolioSnapshot instead of the section tables.
+    Unknown users fall through to the regular (empty) queryset response.
+    ?fields= / ?omit= trim snapshot rows, and narrow the SQL on the queryset paths.
+    """
+    snapshot_section = None
+    sparse_fieldsets = True
+    # Opt-in keyset pagination (?pagination=cursor), served from the section table.
+    keyset_pagination_class = None
+
+    def filter_snapshot_rows(self, rows):
+        return rows
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # Keyset cursors are built from the ordering columns, so they must stay loaded.
+        required = ()
+        if self.wants_keyset_pagination():
+            required = [name.lstrip('-') for name in self.keyset_pagination_class.ordering]
+        return sparse_queryset(queryset, self.get_serializer_class(), self.request, required)
+
+    def wants_keyset_pagination(self):
+        params = self.request.query_params
+        return self.keyset_pagination_class is not None and (
+            params.get('pagination') == 'cursor' or 'cursor' in params
+        )
+
+    def list(self, request, *args, **kwargs):
+        keyset = self.wants_keyset_pagination()
+        if keyset:
+            self.pagination_class = self.keyset_pagination_class
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
+            return super().list(request, *args, **kwargs)
+        if keyset:
+            return self.snapshot_response(request, portfolio.user_id, self._build_keyset_response)
+        return self.snapshot_response(request, portfolio.user_id, self._build_list_response)
+
+    def _build_keyset_response(self, snapshot):
+        # Still cached and validated against the snapshot version, like every public response.
+        return super().list(self.request, *self.args, **self.kwargs)
+
+    def _build_list_response(self, snapshot):
+        rows = self.filter_snapshot_rows(snapshot.sections[self.snapshot_section])
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([sparse_data(self.request, row) for row in page])
+        return Response([sparse_data(self.request, row) for row in rows])
+
+
+class SnapshotDetailMixin(SnapshotResponseMixin):
+    """
+    Serve a slug detail view from the user's PortfolioSnapshot.
+    Slugs missing from the snapshot fall back to the database lookup (and its 404).
+    """
+    snapshot_section = None
+    sparse_fieldsets = True
+
+    def filter_queryset(self, queryset):
+        return sparse_queryset(super().filter_queryset(queryset), self.get_serializer_class(), self.request)
+
+    def retrieve(self, request, *args, **kwargs):
+        portfolio = resolve_username(self.kwargs['username'])
+        if portfolio:
+            response = self.snapshot_response(request, portfolio.user_id, self._build_detail_response)
+            if response is not None:
+                return response
+        return super().retrieve(request, *args, **kwargs)
+
+    def _build_detail_response(self, snapshot):
+        row = snapshot.sections[self.snapshot_section].get(self.kwargs['slug'])
+        return Response(sparse_data(self.request, row)) if row is not None else None
 
 
 # ─── Profile ────────────────────────────────────────────────────────────────
 
-class PublicProfileView(APIView):
+class PublicProfileView(SnapshotResponseMixin, APIView):
     """
     GET /api/u/{username}/profile/
     Returns the user's profile.
+    Supports ?fields= / ?omit= sparse fieldsets.
+    """
+    def get(self, request, username):
+        portfolio = resolve_username(username)
+        if not portfolio:
+            return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return self.snapshot_response(
+            request,
+            portfolio.user_id,
+            lambda snapshot: Response(sparse_data(request, _snapshot_profile(snapshot, request))),
+        )
+
+
+class PublicPortfolioBundleView(SnapshotResponseMixin, APIView):
+    """
+    GET /api/u/{username}/bundle/
+    Returns the profile and every visible section in a single response.
+    Sections hidden via the Profile.show_* flags are omitted.
     """
     def get(self, request, username):
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(username)
+        if not portfolio:
             return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
-        serializer = ProfileSerializer(user.profile, context={'request': request})
-        return Response(serializer.data)
+
+        return self.snapshot_response(
+            request,
+            portfolio.user_id,
+            lambda snapshot: Response({
+                'profile': _snapshot_profile(snapshot, request),
+                **visible_sections(snapshot),
+            }),
+        )
 
 
 class PublicResumeView(APIView):
     """
     GET /api/u/{username}/resume/
     Redirects to a resume download URL. Uses signed Cloudinary download links
-    when resume assets are hosted on Cloudinary.
+    when resume assets are hosted on Cloudinary. The target is cached per
+    profile (api/assets.py), so repeat clicks skip the database and signing.
     """
     def get(self, request, username):
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(username)
+        if not portfolio:
             return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-        resume_url = (getattr(user.profile, 'resume', '') or '').strip()
+        cached_url = assets.cached_resume_link(portfolio.profile_id)
+        if cached_url:
+            return HttpResponseRedirect(cached_url)
+
+        resume_url = (
+            Profile.objects.filter(pk=portfolio.profile_id).values_list('resume', flat=True).first() or ''
+        ).strip()
         if not resume_url:
             return Response({'detail': 'Resume not found.'}, status=status.HTTP_404_NOT_FOUND)
-        if not _is_public_http_url(resume_url):
+        if not assets.is_public_http_url(resume_url):
             return Response({'detail': 'Resume URL is invalid.'}, status=status.HTTP_400_BAD_REQUEST)
         parsed_resume_url = urlparse(resume_url)
         if parsed_resume_url.path == request.path:
             return Response({'detail': 'Resume URL is invalid.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        cloudinary_asset = _extract_cloudinary_asset_details(resume_url)
-        if cloudinary_asset:
-            try:
-                import cloudinary
-                import cloudinary.utils
-
-                cloudinary_config = cloudinary.config()
-                if not cloudinary_config.api_key or not cloudinary_config.api_secret:
-                    return Response(
-                        {
-                            'detail': (
-                                'Resume delivery is not configured on the server. '
-                                'Set CLOUDINARY_API_KEY and CLOUDINARY_API_SECRET.'
-                            )
-                        },
-                        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        try:
+            return HttpResponseRedirect(assets.resume_link(portfolio.profile_id, resume_url))
+        except assets.ResumeDeliveryNotConfigured:
+            return Response(
+                {
+                    'detail': (
+                        'Resume delivery is not configured on the server. '
+                        'Set CLOUDINARY_API_KEY and CLOUDINARY_API_SECRET.'
                     )
-
-                signed_download_url = cloudinary.utils.private_download_url(
-                    cloudinary_asset['public_id'],
-                    cloudinary_asset['format'] or 'pdf',
-                    resource_type=cloudinary_asset['resource_type'],
-                    type=cloudinary_asset['delivery_type'],
-                    attachment=True,
-                    secure=True,
-                    expires_at=int(time.time()) + (10 * 60),
-                )
-                if _is_public_http_url(signed_download_url):
-                    return HttpResponseRedirect(signed_download_url)
-            except Exception:
-                # Fall back to the stored URL when signed URL generation fails.
-                pass
-
-        return HttpResponseRedirect(resume_url)
+                },
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
 
 
 # ─── Skills ─────────────────────────────────────────────────────────────────
 
-class PublicSkillListView(generics.ListAPIView):
+class PublicSkillListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/skills/
     Returns all skills grouped by category for a user.
     """
+    snapshot_section = 'skills'
     serializer_class = SkillCategorySerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return SkillCategory.objects.none()
-        return SkillCategory.objects.filter(user=user).prefetch_related('skills')
+        return public_skills_queryset(portfolio.user_id)
 
 
 # ─── Projects ──────────────────────────────────────────────────────────────
 
-class PublicProjectListView(generics.ListAPIView):
+class PublicProjectListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/projects/
-    Returns visible projects for a user. Supports ?category= and ?featured= filters.
+    Returns visible projects for a user. Supports ?category= and ?featured= filters,
+    and ?pagination=cursor for keyset pagination ordered by (order, -date_built, id).
     """
+    snapshot_section = 'projects'
+    keyset_pagination_class = ProjectKeysetPagination
     serializer_class = ProjectListSerializer
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Project.objects.none()
 
-        queryset = Project.objects.filter(user=user, is_visible=True).prefetch_related('tech_stack')
+        queryset = public_projects_queryset(portfolio.user_id)
         category = self.request.query_params.get('category')
         if category:
             queryset = queryset.filter(category=category)
@@ -206,105 +366,114 @@ class PublicProjectListView(generics.ListAPIView):
             queryset = queryset.filter(is_featured=True)
         return queryset
 
+    def filter_snapshot_rows(self, rows):
+        category = self.request.query_params.get('category')
+        if category:
+            rows = [row for row in rows if row['category'] == category]
+        featured = self.request.query_params.get('featured')
+        if featured and featured.lower() == 'true':
+            rows = [row for row in rows if row['is_featured']]
+        return rows
+
 
-class PublicProjectDetailView(generics.RetrieveAPIView):
+class PublicProjectDetailView(SnapshotDetailMixin, generics.RetrieveAPIView):
     """
     GET /api/u/{username}/projects/{slug}/
     Returns full detail for a single project by slug.
     """
+    snapshot_section = 'project_details'
     serializer_class = ProjectDetailSerializer
     lookup_field = 'slug'
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Project.objects.none()
-        return Project.objects.filter(user=user, is_visible=True).prefetch_related('tech_stack')
+        return public_projects_queryset(portfolio.user_id)
 
 
 # ─── Experience ─────────────────────────────────────────────────────────────
 
-class PublicExperienceListView(generics.ListAPIView):
+class PublicExperienceListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/experience/
     Returns experience timeline for a user.
     """
+    snapshot_section = 'experience'
     serializer_class = ExperienceSerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Experience.objects.none()
-        return Experience.objects.filter(user=user)
+        return public_experience_queryset(portfolio.user_id)
 
 
 # ─── Contact ───────────────────────────────────────────────────────────────
 
-class PublicEducationListView(generics.ListAPIView):
+class PublicEducationListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/education/
     Returns education entries for a user.
     """
+    snapshot_section = 'education'
     serializer_class = EducationSerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Education.objects.none()
-        return Education.objects.filter(user=user)
+        return public_education_queryset(portfolio.user_id)
 
 
-class PublicActivityListView(generics.ListAPIView):
+class PublicActivityListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/activities/
     Returns extracurricular activities for a user.
     """
+    snapshot_section = 'activities'
     serializer_class = ActivitySerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Activity.objects.none()
-        return Activity.objects.filter(user=user)
+        return public_activities_queryset(portfolio.user_id)
 
 
-class PublicAchievementListView(generics.ListAPIView):
+class PublicAchievementListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/achievements/
     Returns achievements for a user.
     """
+    snapshot_section = 'achievements'
     serializer_class = AchievementSerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Achievement.objects.none()
-        return Achievement.objects.filter(user=user)
+        return public_achievements_queryset(portfolio.user_id)
 
 
-class PublicCertificationListView(generics.ListAPIView):
+class PublicCertificationListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/certifications/
     Returns certifications for a user.
     """
+    snapshot_section = 'certifications'
     serializer_class = CertificationSerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Certification.objects.none()
-        return Certification.objects.filter(user=user)
+        return public_certifications_queryset(portfolio.user_id)
 
 
 class PublicContactView(generics.CreateAPIView):
@@ -316,14 +485,13 @@ class PublicContactView(generics.CreateAPIView):
     throttle_classes = [ContactRateThrottle]
 
     def create(self, request, *args, **kwargs):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(recipient=user)
+        serializer.save(recipient_id=portfolio.user_id)
         return Response(
             {'detail': 'Message sent successfully!'},
             status=status.HTTP_201_CREATED
@@ -332,50 +500,217 @@ class PublicContactView(generics.CreateAPIView):
 
 # ─── Blog ──────────────────────────────────────────────────────────────────
 
-class PublicBlogListView(generics.ListAPIView):
+class PublicBlogListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/blog/
-    Returns published blog posts for a user.
+    Returns published blog posts for a user. Supports ?tag= filtering (matched by
+    tag slug through the PostTag index) and ?pagination=cursor for keyset
+    pagination ordered by (-published_at, -created_at, -id).
     """
+    snapshot_section = 'blog'
+    keyset_pagination_class = BlogKeysetPagination
     serializer_class = BlogPostListSerializer
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return BlogPost.objects.none()
-        return BlogPost.objects.filter(user=user, is_published=True)
 
+        queryset = public_blog_queryset(portfolio.user_id)
+        tag = self.request.query_params.get('tag')
+        if tag:
+            queryset = queryset.filter(pk__in=post_ids_with_tag(portfolio.user_id, tag))
+        return queryset
+
+    def filter_snapshot_rows(self, rows):
+        tag = self.request.query_params.get('tag')
+        if tag:
+            post_ids = post_ids_with_tag(resolve_username(self.kwargs['username']).user_id, tag)
+            rows = [row for row in rows if row['id'] in post_ids]
+        return rows
 
-class PublicBlogDetailView(generics.RetrieveAPIView):
+
+class PublicBlogTagListView(SnapshotListMixin, generics.ListAPIView):
+    """
+    GET /api/u/{username}/blog/tags/
+    Returns the user's blog tags with their published post counts, most used first.
+    """
+    snapshot_section = 'blog_tags'
+    serializer_class = TagSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
+            return Tag.objects.none()
+        return public_blog_tags_queryset(portfolio.user_id)
+
+
+class PublicBlogDetailView(SnapshotDetailMixin, generics.RetrieveAPIView):
     """
     GET /api/u/{username}/blog/{slug}/
     Returns full detail for a single blog post by slug.
     """
+    snapshot_section = 'blog_details'
     serializer_class = BlogPostDetailSerializer
     lookup_field = 'slug'
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return BlogPost.objects.none()
-        return BlogPost.objects.filter(user=user, is_published=True)
+        return public_blog_queryset(portfolio.user_id)
+
+
+# ─── Search ────────────────────────────────────────────────────────────────
+
+class PublicSearchView(SnapshotResponseMixin, APIView):
+    """
+    GET /api/u/{username}/search/?q=
+    Full-text search across a user's visible projects, blog posts, experience
+    and certifications, ranked best first. Optional ?kind=project,blog narrows
+    the sections searched and ?limit= (max 50) caps the results.
+    """
+    max_limit = 50
+
+    def get(self, request, username):
+        portfolio = resolve_username(username)
+        if not portfolio:
+            return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'detail': 'Query parameter "q" is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), self.max_limit)
+        except ValueError:
+            return Response({'detail': 'limit must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        requested = {kind for kind in request.query_params.get('kind', '').split(',') if kind}
+        kinds = [
+            kind for kind, (_, visibility_flag, _) in search.SEARCH_SOURCES.items()
+            if portfolio.is_visible(visibility_flag) and (not requested or kind in requested)
+        ]
+
+        # The index changes with the same writes that bump the snapshot version.
+        return self.snapshot_response(
+            request,
+            portfolio.user_id,
+            lambda snapshot: Response({
+                'query': query, 'results': search.search(portfolio.user_id, query, kinds, limit),
+            }),
+        )
+
+
+# ─── Feeds & Sitemaps ──────────────────────────────────────────────────────
+
+class PublicBlogFeedView(SnapshotResponseMixin, APIView):
+    """
+    GET /api/u/{username}/blog/feed.xml
+    RSS 2.0 feed of the user's latest published posts, assembled from the
+    pre-rendered items in the snapshot 'feed' section.
+    """
+    renderer_classes = [RSSRenderer]
+    content_negotiation_class = FirstRendererNegotiation
+    render_document = staticmethod(feeds.rss_document)
+
+    def get(self, request, username):
+        portfolio = resolve_username(username)
+        if not portfolio or not portfolio.is_visible('show_blog'):
+            return Response({'detail': 'Feed not found.'}, status=status.HTTP_404_NOT_FOUND)
+        feed_url = request.build_absolute_uri(request.path)
+        return self.snapshot_response(
+            request,
+            portfolio.user_id,
+            lambda snapshot: Response(
+                self.render_document(snapshot.sections['feed'], snapshot.sections['profile'], feed_url)
+            ),
+        )
+
+
+class PublicBlogAtomFeedView(PublicBlogFeedView):
+    """
+    GET /api/u/{username}/blog/atom.xml
+    Atom 1.0 version of the blog feed.
+    """
+    renderer_classes = [AtomRenderer]
+    render_document = staticmethod(feeds.atom_document)
+
+
+class PublicSitemapView(SnapshotResponseMixin, APIView):
+    """
+    GET /api/u/{username}/sitemap.xml
+    Sitemap shard for one portfolio: its page plus every visible project and
+    published post, from the snapshot 'sitemap' section.
+    """
+    renderer_classes = [XMLDocumentRenderer]
+    content_negotiation_class = FirstRendererNegotiation
+
+    def get(self, request, username):
+        portfolio = resolve_username(username)
+        if not portfolio:
+            return Response({'detail': 'Portfolio not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return self.snapshot_response(
+            request,
+            portfolio.user_id,
+            lambda snapshot: Response(feeds.sitemap_document(
+                snapshot.sections['sitemap'], snapshot.sections['profile'], snapshot.updated_at,
+            )),
+        )
+
+
+class PlatformSitemapView(APIView):
+    """
+    GET /api/sitemap.xml
+    Sitemap index over every active portfolio's shard. Its validators come from
+    a single aggregate over the snapshot table, so conditional GETs and cache
+    hits never walk the content tables, and any snapshot rebuild (which is what
+    changes a shard) produces a new index.
+    """
+    renderer_classes = [XMLDocumentRenderer]
+    content_negotiation_class = FirstRendererNegotiation
+
+    def get(self, request):
+        snapshots = PortfolioSnapshot.objects.filter(user__is_active=True, user__profile__isnull=False)
+        summary = snapshots.aggregate(count=Count('pk'), versions=Sum('version'), last=Max('updated_at'))
+        last_modified = int(summary['last'].timestamp()) if summary['last'] else 0
+        etag = 'W/' + quote_etag(f"sitemap-{summary['count']}-{summary['versions'] or 0}-{last_modified}")
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified or None)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+
+        variants = response_cache.get_platform_response('sitemap', etag, request)
+        if variants is None:
+            shards = [
+                (request.build_absolute_uri(reverse('public-sitemap', kwargs={'username': username})), updated_at)
+                for username, updated_at in snapshots.order_by('user__profile__username_slug')
+                .values_list('user__profile__username_slug', 'updated_at')
+            ]
+            variants = compress_variants(feeds.sitemap_index_document(shards).encode())
+            response_cache.set_platform_response('sitemap', etag, request, variants)
+
+        response = _precompressed_response(request, variants, request.accepted_renderer.media_type)
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        return response
 
 
 # ─── Testimonials ──────────────────────────────────────────────────────────
 
-class PublicTestimonialListView(generics.ListAPIView):
+class PublicTestimonialListView(SnapshotListMixin, generics.ListAPIView):
     """
     GET /api/u/{username}/testimonials/
     Returns testimonials for a user.
     """
+    snapshot_section = 'testimonials'
     serializer_class = TestimonialSerializer
     pagination_class = None
 
     def get_queryset(self):
-        username = self.kwargs['username']
-        user = get_user_by_username(username)
-        if not user:
+        portfolio = resolve_username(self.kwargs['username'])
+        if not portfolio:
             return Testimonial.objects.none()
-        return Testimonial.objects.filter(user=user)
+        return public_testimonials_queryset(portfolio.user_id)
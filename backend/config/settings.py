@@ -115,6 +115,10 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 # ─── Django REST Framework ──────────────────────────────────────────────────
 
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_PERMISSION_CLASSES': [
@@ -165,6 +169,85 @@ CLOUDINARY_STORAGE = {
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 
 
+# ─── Caches ─────────────────────────────────────────────────────────────────
+# 'public' holds versioned public portfolio responses. Choose the backend with
+# PUBLIC_CACHE_BACKEND: locmem (in-process LRU, single worker / dev), file, or
+# redis (any Redis-protocol server at REDIS_URL; needs the redis package).
+# Deployments running several workers should use file or redis.
+
+PUBLIC_CACHE_BACKEND = config('PUBLIC_CACHE_BACKEND', default='locmem')
+PUBLIC_CACHE_TIMEOUT = config('PUBLIC_CACHE_TIMEOUT', default=3600, cast=int)
+PUBLIC_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'public-portfolio',
+        'OPTIONS': {'MAX_ENTRIES': config('PUBLIC_CACHE_MAX_ENTRIES', default=5000, cast=int)},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('PUBLIC_CACHE_DIR', default=str(BASE_DIR / '.cache' / 'public')),
+        'OPTIONS': {'MAX_ENTRIES': config('PUBLIC_CACHE_MAX_ENTRIES', default=5000, cast=int)},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('REDIS_URL', default='redis://127.0.0.1:6379/1'),
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'public': {
+        **PUBLIC_CACHE_BACKENDS[PUBLIC_CACHE_BACKEND],
+        'TIMEOUT': PUBLIC_CACHE_TIMEOUT,
+        'KEY_PREFIX': 'public',
+    },
+}
+
+# How long a worker trusts its cached snapshot version before re-reading it from
+# the database. A locmem cache is private to one process and never sees the
+# versions published by other workers or management commands, so there the
+# validators expire after a few seconds; shared backends see every publish.
+PUBLIC_CACHE_VALIDATOR_TTL = config(
+    'PUBLIC_CACHE_VALIDATOR_TTL', default=5 if PUBLIC_CACHE_BACKEND == 'locmem' else PUBLIC_CACHE_TIMEOUT, cast=int,
+)
+
+# Cache the final encoded JSON bytes for public responses, so a hit is served
+# without re-rendering. Disable to cache the Python payload instead.
+PUBLIC_CACHE_ENCODED = config('PUBLIC_CACHE_ENCODED', default=True, cast=bool)
+
+
+# ─── Portfolio Caching ──────────────────────────────────────────────────────
+
+USERNAME_RESOLVER_CACHE_SIZE = config('USERNAME_RESOLVER_CACHE_SIZE', default=2048, cast=int)
+USERNAME_RESOLVER_CACHE_TTL = config('USERNAME_RESOLVER_CACHE_TTL', default=60, cast=int)
+
+
+# ─── Feeds & Sitemaps ───────────────────────────────────────────────────────
+# Public site that blog feeds and sitemaps link to, and its page paths.
+
+PUBLIC_SITE_URL = config('PUBLIC_SITE_URL', default='http://localhost:5173')
+PUBLIC_PAGE_PATHS = {
+    'portfolio': '/{username}',
+    'project': '/{username}/projects/{slug}',
+    'post': '/{username}/blog/{slug}',
+}
+
+
+# ─── Responsive Images ──────────────────────────────────────────────────────
+# The public payloads carry *_srcset fields (avatar_srcset, thumbnail_srcset,
+# client_avatar_srcset) only while RESPONSIVE_IMAGES is on; a field whose width
+# ladder below is empty is left out as well. Snapshots store the computed
+# variants: after changing either setting, run `python manage.py refresh_snapshots`.
+
+RESPONSIVE_IMAGES = config('RESPONSIVE_IMAGES', default=True, cast=bool)
+RESPONSIVE_IMAGE_WIDTHS = {
+    'thumbnail': config('RESPONSIVE_THUMBNAIL_WIDTHS', default='320,640,960,1280,1920', cast=Csv(int)),
+    'avatar': config('RESPONSIVE_AVATAR_WIDTHS', default='96,192,384', cast=Csv(int)),
+}
+
+
 # ─── Logging ────────────────────────────────────────────────────────────────
 
 LOGGING = {
@@ -89,6 +89,7 @@ export const authApi = {
 
 export const publicApi = {
   getProfile: (username) => api.get(`/u/${resolveUsername(username)}/profile/`),
+  getBundle: (username) => api.get(`/u/${resolveUsername(username)}/bundle/`),
   getProjects: (usernameOrParams, maybeParams = {}) => {
     const { username, params } = resolveUsernameAndParams(usernameOrParams, maybeParams);
     return api.get(`/u/${username}/projects/`, { params });
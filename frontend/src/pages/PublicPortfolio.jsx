@@ -114,36 +114,14 @@ export default function PublicPortfolio() {
       setCertifications([]);
 
       try {
-        const [
-          profileRes,
-          skillsRes,
-          projectsRes,
-          expRes,
-          eduRes,
-          activitiesRes,
-          achievementsRes,
-          certificationsRes,
-          blogsRes,
-          testimonialsRes,
-        ] = await Promise.all([
-          publicApi.getProfile(username),
-          publicApi.getSkills(username).catch(() => ({ data: [] })),
-          publicApi.getProjects(username).catch(() => ({ data: [] })),
-          publicApi.getExperience(username).catch(() => ({ data: [] })),
-          publicApi.getEducation(username).catch(() => ({ data: [] })),
-          publicApi.getActivities(username).catch(() => ({ data: [] })),
-          publicApi.getAchievements(username).catch(() => ({ data: [] })),
-          publicApi.getCertifications(username).catch(() => ({ data: [] })),
-          publicApi.getBlogs(username).catch(() => ({ data: [] })),
-          publicApi.getTestimonials(username).catch(() => ({ data: [] })),
-        ]);
+        const { data: bundle } = await publicApi.getBundle(username);
 
         if (cancelled) return;
 
-        setProfile(profileRes.data);
-        setSkills(toArray(skillsRes?.data));
+        setProfile(bundle.profile);
+        setSkills(toArray(bundle.skills));
 
-        const projectsList = toArray(projectsRes?.data).sort((a, b) => {
+        const projectsList = toArray(bundle.projects).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -151,12 +129,12 @@ export default function PublicPortfolio() {
         });
         setProjects(projectsList);
 
-        const experienceList = toArray(expRes?.data).sort((a, b) => {
+        const experienceList = toArray(bundle.experience).sort((a, b) => {
           return new Date(b.start_date || 0) - new Date(a.start_date || 0);
         });
         setExperience(experienceList);
 
-        const educationList = toArray(eduRes?.data).sort((a, b) => {
+        const educationList = toArray(bundle.education).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -164,7 +142,7 @@ export default function PublicPortfolio() {
         });
         setEducation(educationList);
 
-        const activityList = toArray(activitiesRes?.data).sort((a, b) => {
+        const activityList = toArray(bundle.activities).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -172,7 +150,7 @@ export default function PublicPortfolio() {
         });
         setActivities(activityList);
 
-        const achievementList = toArray(achievementsRes?.data).sort((a, b) => {
+        const achievementList = toArray(bundle.achievements).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -180,7 +158,7 @@ export default function PublicPortfolio() {
         });
         setAchievements(achievementList);
 
-        const certificationList = toArray(certificationsRes?.data).sort((a, b) => {
+        const certificationList = toArray(bundle.certifications).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -188,12 +166,12 @@ export default function PublicPortfolio() {
         });
         setCertifications(certificationList);
 
-        const blogList = toArray(blogsRes?.data).sort((a, b) => {
+        const blogList = toArray(bundle.blog).sort((a, b) => {
           return new Date(b.published_at || b.created_at || 0) - new Date(a.published_at || a.created_at || 0);
         });
         setBlogs(blogList);
 
-        const testimonialsList = toArray(testimonialsRes?.data).sort((a, b) => {
+        const testimonialsList = toArray(bundle.testimonials).sort((a, b) => {
           const leftOrder = Number(a.order) || 0;
           const rightOrder = Number(b.order) || 0;
           if (leftOrder !== rightOrder) return leftOrder - rightOrder;
@@ -518,7 +496,7 @@ export default function PublicPortfolio() {
           <Motion.div className="about-preview__image" initial={{ opacity: 0, scale: 0.9 }} whileInView={{ opacity: 1, scale: 1 }} viewport={{ once: true }}>
             <div className="about-preview__img-wrapper glass">
               {profile?.avatar ? (
-                <img src={profile.avatar} alt={profile?.full_name || username} />
+                <img src={profile.avatar} srcSet={profile.avatar_srcset || undefined} sizes="192px" alt={profile?.full_name || username} />
               ) : (
                 <div className="about-preview__placeholder">
                   <span className="gradient-text portfolio-avatar-fallback">
@@ -672,7 +650,7 @@ export default function PublicPortfolio() {
               >
                 <div className="featured__card-img">
                   {project.thumbnail ? (
-                    <img src={project.thumbnail} alt={project.title} loading="lazy" />
+                    <img src={project.thumbnail} srcSet={project.thumbnail_srcset || undefined} sizes="(max-width: 768px) 100vw, 33vw" alt={project.title} loading="lazy" />
                   ) : (
                     <div className="portfolio-empty-box">
                       <span>{(project.title || 'P').charAt(0).toUpperCase()}</span>
@@ -980,7 +958,7 @@ export default function PublicPortfolio() {
               >
                 <div className="featured__card-img">
                   {blog.thumbnail ? (
-                    <img src={blog.thumbnail} alt={blog.title} loading="lazy" />
+                    <img src={blog.thumbnail} srcSet={blog.thumbnail_srcset || undefined} sizes="(max-width: 768px) 100vw, 33vw" alt={blog.title} loading="lazy" />
                   ) : (
                     <div className="portfolio-empty-box">
                       <span>{(blog.title || 'A').charAt(0).toUpperCase()}</span>
@@ -1062,7 +1040,7 @@ export default function PublicPortfolio() {
                   <div className="portfolio-testimonial-card__head">
                     <div className="portfolio-testimonial-card__avatar">
                       {item.client_avatar ? (
-                        <img src={item.client_avatar} alt={name} />
+                        <img src={item.client_avatar} srcSet={item.client_avatar_srcset || undefined} sizes="96px" alt={name} />
                       ) : (
                         <span>{name.charAt(0).toUpperCase()}</span>
                       )}
@@ -1293,7 +1271,7 @@ function ProjectDetailsModal({ project, loading, onClose }) {
       {loading && <p>Loading latest project details...</p>}
       {!loading && (
         <>
-          {project?.thumbnail && <img src={project.thumbnail} alt={project.title} className="portfolio-modal__media" />}
+          {project?.thumbnail && <img src={project.thumbnail} srcSet={project.thumbnail_srcset || undefined} sizes="(max-width: 960px) 100vw, 960px" alt={project.title} className="portfolio-modal__media" />}
           <p>{description}</p>
           {Array.isArray(project?.tech_stack) && project.tech_stack.length > 0 && (
             <div className="portfolio-modal__chips">
@@ -1333,7 +1311,7 @@ function BlogDetailsModal({ blog, loading, onClose }) {
       {loading && <p>Loading latest article details...</p>}
       {!loading && (
         <>
-          {blog?.thumbnail && <img src={blog.thumbnail} alt={blog.title} className="portfolio-modal__media" />}
+          {blog?.thumbnail && <img src={blog.thumbnail} srcSet={blog.thumbnail_srcset || undefined} sizes="(max-width: 960px) 100vw, 960px" alt={blog.title} className="portfolio-modal__media" />}
           <div className="portfolio-modal__article">
             {(content || '')
               .split('\n')
@@ -23,7 +23,7 @@ const EMPTY_EXPERIENCE = {
   end_date: '',
   is_current: false,
   highlights: [],
-  order: 0,
+  order: '',
 };
 
 const formatMonthYear = (value) => {
@@ -137,7 +137,7 @@ export default function AdminExperience() {
       role: normalizeText(formData.role),
       company: normalizeText(formData.company),
       company_url: normalizeText(formData.company_url),
-      order: Number(formData.order) || 0,
+      order: formData.order === '' ? undefined : Number(formData.order) || 0,
       highlights: formData.highlights.map((item) => normalizeText(item)).filter(Boolean),
     };
 
@@ -314,7 +314,7 @@ export default function AdminExperience() {
                   value={formData.order}
                   onChange={handleChange}
                   icon={FaSort}
-                  hint="Lower appears first"
+                  hint="Lower appears first; leave blank to add at the end"
                 />
 
                 <div className="form-actions">
@@ -7,6 +7,7 @@ import LoadingSkeleton from '../../components/LoadingSkeleton';
 
 export default function AdminMessages() {
   const [messages, setMessages] = useState([]);
+  const [unreadCount, setUnreadCount] = useState(0);
   const [loading, setLoading] = useState(true);
   const [selectedMessage, setSelectedMessage] = useState(null);
 
@@ -15,7 +16,9 @@ export default function AdminMessages() {
     userApi.getMessages()
       .then(res => {
         const data = res.data.results || res.data;
-        setMessages(Array.isArray(data) ? data : []);
+        const list = Array.isArray(data) ? data : [];
+        setMessages(list);
+        setUnreadCount(res.data.unread ?? list.filter(m => !m.is_read).length);
       })
       .catch(() => toast.error('Failed to load messages'))
       .finally(() => setLoading(false));
@@ -56,7 +59,7 @@ export default function AdminMessages() {
     <div>
       <div className="admin-page-header">
         <h1>Messages</h1>
-        <p>{messages.filter(m => !m.is_read).length} unread messages</p>
+        <p>{unreadCount} unread messages</p>
       </div>
 
       {loading ? (
@@ -42,7 +42,7 @@ const SECTION_CONFIG = {
       is_current: false,
       grade: '',
       description: '',
-      order: 0,
+      order: '',
     },
   },
   activities: {
@@ -62,7 +62,7 @@ const SECTION_CONFIG = {
       is_current: false,
       highlights: [],
       description: '',
-      order: 0,
+      order: '',
     },
   },
   achievements: {
@@ -79,7 +79,7 @@ const SECTION_CONFIG = {
       achieved_on: '',
       description: '',
       proof_url: '',
-      order: 0,
+      order: '',
     },
   },
   certifications: {
@@ -98,7 +98,7 @@ const SECTION_CONFIG = {
       credential_id: '',
       credential_url: '',
       skills: [],
-      order: 0,
+      order: '',
     },
   },
 };
@@ -223,11 +223,7 @@ export default function AdminMilestones() {
     const { name, value, type, checked } = event.target;
     setFormData((prev) => ({
       ...prev,
-      [name]: type === 'checkbox'
-        ? checked
-        : name === 'order'
-          ? Number(value) || 0
-          : value,
+      [name]: type === 'checkbox' ? checked : value,
     }));
   };
 
@@ -253,7 +249,10 @@ export default function AdminMilestones() {
   };
 
   const buildPayload = () => {
-    const basePayload = { ...formData, order: Number(formData.order) || 0 };
+    const basePayload = {
+      ...formData,
+      order: formData.order === '' ? undefined : Number(formData.order) || 0,
+    };
 
     if (activeSection === 'education') {
       return {
@@ -561,7 +560,7 @@ export default function AdminMilestones() {
                   value={formData.order}
                   onChange={handleChange}
                   icon={FaSort}
-                  hint="Lower appears first"
+                  hint="Lower appears first; leave blank to add at the end"
                 />
 
                 <div className="form-actions">
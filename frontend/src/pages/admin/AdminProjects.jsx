@@ -48,7 +48,7 @@ const EMPTY_PROJECT = {
   repo_url: '',
   is_featured: false,
   is_visible: true,
-  order: 0,
+  order: '',
   date_built: '',
 };
 
@@ -168,7 +168,7 @@ export default function AdminProjects() {
       category: normalizeText(formData.category) || 'other',
       live_url: normalizeText(formData.live_url),
       repo_url: normalizeText(formData.repo_url),
-      order: Number(formData.order) || 0,
+      order: formData.order === '' ? undefined : Number(formData.order) || 0,
     };
 
     try {
@@ -353,7 +353,7 @@ export default function AdminProjects() {
                     type="number"
                     value={formData.order}
                     onChange={handleChange}
-                    hint="Lower appears first"
+                    hint="Lower appears first; leave blank to add at the end"
                   />
                   <div className="admin-form__checks">
                     <FormField
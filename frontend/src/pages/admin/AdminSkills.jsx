@@ -8,8 +8,8 @@ import FormField from '../../components/FormField';
 import SkillIcon from '../../components/SkillIcon';
 import FileUploader from '../../components/FileUploader';
 
-const EMPTY_CATEGORY = { name: '', order: 0 };
-const EMPTY_SKILL = { name: '', icon: '', category: '', order: 0 };
+const EMPTY_CATEGORY = { name: '', order: '' };
+const EMPTY_SKILL = { name: '', icon: '', category: '', order: '' };
 const COMMON_SKILL_NAMES = [
   'React',
   'Next.js',
@@ -166,7 +166,7 @@ export default function AdminSkills() {
     }
 
     setIsSubmitting(true);
-    const payload = { name, order: Number(catForm.order) || 0 };
+    const payload = { name, order: catForm.order === '' ? undefined : Number(catForm.order) || 0 };
     try {
       if (editingCat) {
         await userApi.updateCategory(editingCat.id, payload);
@@ -201,7 +201,7 @@ export default function AdminSkills() {
       name,
       icon: skillForm.icon.trim(),
       category: skillForm.category,
-      order: Number(skillForm.order) || 0,
+      order: skillForm.order === '' ? undefined : Number(skillForm.order) || 0,
     };
     try {
       if (editingSkill) {
@@ -305,7 +305,7 @@ export default function AdminSkills() {
                   type="number"
                   value={catForm.order}
                   onChange={(event) =>
-                    setCatForm((prev) => ({ ...prev, order: Number(event.target.value) || 0 }))
+                    setCatForm((prev) => ({ ...prev, order: event.target.value }))
                   }
                   icon={FaSort}
                 />
@@ -405,7 +405,7 @@ export default function AdminSkills() {
                     type="number"
                     value={skillForm.order}
                     onChange={(event) =>
-                      setSkillForm((prev) => ({ ...prev, order: Number(event.target.value) || 0 }))
+                      setSkillForm((prev) => ({ ...prev, order: event.target.value }))
                     }
                     icon={FaSort}
                   />
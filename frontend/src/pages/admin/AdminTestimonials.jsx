@@ -29,7 +29,7 @@ const EMPTY_TESTIMONIAL = {
   rating: 5,
   project_name: '',
   is_featured: false,
-  order: 0,
+  order: '',
 };
 
 const RATING_FILTERS = [
@@ -132,7 +132,7 @@ export default function AdminTestimonials() {
       ...prev,
       [name]: type === 'checkbox'
         ? checked
-        : name === 'order' || name === 'rating'
+        : name === 'rating'
           ? Number(value) || 0
           : value,
     }));
@@ -150,7 +150,7 @@ export default function AdminTestimonials() {
       project_name: normalizeText(formData.project_name),
       content: normalizeText(formData.content),
       rating: Math.max(1, Math.min(5, Number(formData.rating) || 5)),
-      order: Number(formData.order) || 0,
+      order: formData.order === '' ? undefined : Number(formData.order) || 0,
     };
 
     if (!payload.client_name || !payload.client_role || !payload.client_company || !payload.content) {
@@ -348,7 +348,7 @@ export default function AdminTestimonials() {
                     value={formData.order}
                     onChange={handleChange}
                     icon={FaSort}
-                    hint="Lower appears first"
+                    hint="Lower appears first; leave blank to add at the end"
                   />
                 </div>
 